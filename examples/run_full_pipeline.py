@@ -3,11 +3,13 @@ Example: Run Full Pipeline
 Demonstrates how to run the complete data governance pipeline.
 """
 
+import logging
 import sys
 sys.path.append('..')
 
 from pipeline import GovernancePipeline
-from loguru import logger
+
+logger = logging.getLogger(__name__)
 
 
 def main():
@@ -55,9 +57,10 @@ def main():
         print("=" * 80)
         
     except Exception as e:
-        logger.error(f"Pipeline execution failed: {str(e)}")
+        logger.error("Pipeline execution failed: %s", e)
         raise
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-8s | %(name)s - %(message)s")
     main()
@@ -3,71 +3,78 @@ Example: Run Lineage Tracking
 Demonstrates how to track data lineage in Snowflake.
 """
 
+import logging
 import sys
 sys.path.append('..')
 
 from connection import SnowflakeConnection
 from lineage import LineageTracker
-from loguru import logger
+
+logger = logging.getLogger(__name__)
 
 
 def main():
     """Track data lineage from Snowflake."""
     
-    # Initialize connection
-    conn = SnowflakeConnection(config_path="../config/config.yaml")
-    
     try:
-        # Connect to Snowflake
-        conn.connect()
-        logger.info("Connected to Snowflake")
+        # Connect to Snowflake; the context manager closes the session on exit
+        with SnowflakeConnection.get_shared(config_path="../config/config.yaml") as conn:
+            logger.info("Connected to Snowflake")
         
-        # Initialize lineage tracker
-        tracker = LineageTracker(conn)
+            # Initialize lineage tracker
+            tracker = LineageTracker(conn)
         
-        # Extract table dependencies
-        logger.info("Extracting table dependencies...")
-        dependencies = tracker.extract_table_dependencies('PROD_DB')
+            # Extract table dependencies
+            logger.info("Extracting table dependencies...")
+            dependencies = tracker.extract_table_dependencies('PROD_DB')
         
-        # Extract query history lineage
-        logger.info("Extracting query history lineage...")
-        query_lineage = tracker.extract_query_history_lineage(days=7)
+            # Extract query history lineage
+            logger.info("Extracting query history lineage...")
+            query_lineage = tracker.extract_query_history_lineage(days=7)
         
-        # Print summary
-        print("\n" + "=" * 60)
-        print("LINEAGE TRACKING SUMMARY")
-        print("=" * 60)
-        print(f"Table Dependencies: {len(dependencies)}")
-        print(f"Query-based Lineage: {len(query_lineage)}")
-        print(f"Total Lineage Records: {len(dependencies) + len(query_lineage)}")
-        print("=" * 60)
+            # Print summary
+            print("\n" + "=" * 60)
+            print("LINEAGE TRACKING SUMMARY")
+            print("=" * 60)
+            print(f"Table Dependencies: {len(dependencies)}")
+            print(f"Query-based Lineage: {len(query_lineage)}")
+            print(f"Total Lineage Records: {len(dependencies) + len(query_lineage)}")
+            print("=" * 60)
         
-        # Example: Get lineage for specific table
-        table_name = "PROD_DB.SALES.ORDERS"
-        print(f"\nLineage for {table_name}:")
+            # Example: Get lineage for specific table
+            table_name = "PROD_DB.SALES.ORDERS"
+            print(f"\nLineage for {table_name}:")
         
-        upstream = tracker.get_upstream_lineage(table_name)
-        print(f"  Upstream tables: {len(upstream.get('ancestors', []))}")
+            upstream = tracker.get_upstream_lineage(table_name)
+            print(f"  Upstream tables: {len(upstream.get('ancestors', []))}")
         
-        downstream = tracker.get_downstream_lineage(table_name)
-        print(f"  Downstream tables: {len(downstream.get('descendants', []))}")
+            downstream = tracker.get_downstream_lineage(table_name)
+            print(f"  Downstream tables: {len(downstream.get('descendants', []))}")
         
-        # Save to Snowflake
-        all_lineage = dependencies + query_lineage
-        tracker.save_lineage_to_snowflake(all_lineage, "GOVERNANCE_DB.METADATA.LINEAGE_GRAPH")
-        logger.info("Lineage data saved to Snowflake")
+            # Save to Snowflake
+            all_lineage = tracker.deduplicate_lineage(dependencies, query_lineage)
+            tracker.save_lineage_to_snowflake(all_lineage, "GOVERNANCE_DB.METADATA.LINEAGE_GRAPH")
+            logger.info("Lineage data saved to Snowflake")
         
-        # Export graph
-        tracker.export_lineage_graph("../output/lineage_graph.json")
-        logger.info("Lineage graph exported")
+            # Materialize the transitive closure for constant-time full lineage lookups
+            tracker.rebuild_closure(
+                "GOVERNANCE_DB.METADATA.LINEAGE_GRAPH",
+                "GOVERNANCE_DB.METADATA.LINEAGE_CLOSURE"
+            )
+            closure_upstream = tracker.get_upstream_from_closure(
+                table_name, "GOVERNANCE_DB.METADATA.LINEAGE_CLOSURE"
+            )
+            print(f"  All upstream tables (closure): {len(closure_upstream['ancestors'])}")
+        
+            # Export graph
+            tracker.export_lineage_graph("../output/lineage_graph.parquet")
+            logger.info("Lineage graph exported")
         
     except Exception as e:
-        logger.error(f"Lineage tracking failed: {str(e)}")
+        logger.error("Lineage tracking failed: %s", e)
         raise
-        
-    finally:
-        conn.close()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-8s | %(name)s - %(message)s")
     main()
@@ -3,67 +3,185 @@ Snowflake Connection Manager
 Handles connections to Snowflake and provides query execution utilities.
 """
 
+import io
+import itertools
 import os
-from typing import Optional, Dict, Any, List
+from contextlib import contextmanager
+import shutil
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Mapping, Sequence, Union
+import pyarrow as pa
+import pyarrow.parquet as pq
 import snowflake.connector
 from snowflake.connector import DictCursor
-from loguru import logger
-import yaml
+import logging
 from dotenv import load_dotenv
 
+from ..utils import load_config
+
+logger = logging.getLogger(__name__)
+
+# Loads at or below these sizes use one multi-row INSERT instead of PUT + COPY.
+# The byte bound keeps the interpolated statement well under Snowflake's 1 MB
+# SQL text limit.
+SMALL_LOAD_MAX_ROWS = 1000
+SMALL_LOAD_MAX_BYTES = 512 * 1024
+
+# Session-level QUERY_TAG used outside of a named pipeline stage
+DEFAULT_QUERY_TAG = 'governance_pipeline'
+
+# Process-wide registry of shared connections keyed by everything that shapes
+# the session: (account, user, warehouse, role, database, schema, timeout, tag)
+_shared_connections: Dict[tuple, 'SnowflakeConnection'] = {}
+_shared_connections_lock = threading.Lock()
+
 
 class SnowflakeConnection:
     """Manages Snowflake database connections and query execution."""
     
-    def __init__(self, config_path: str = "config/config.yaml"):
+    def __init__(self, config_path: str = "config/config.yaml", config: Mapping[str, Any] = None):
         """
         Initialize Snowflake connection.
         
         Args:
             config_path: Path to configuration file
+            config: Already-parsed configuration; when given, config_path is not read
         """
         load_dotenv()
-        self.config = self._load_config(config_path)
+        self.config = config if config is not None else self._load_config(os.path.abspath(config_path))
         self.connection: Optional[snowflake.connector.SnowflakeConnection] = None
         
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+    @staticmethod
+    def _load_config(config_path: str) -> Mapping[str, Any]:
+        """
+        Load configuration from YAML file.
+        
+        Parsed configs are cached per file version (see utils.load_config), so
+        every connection built from the same file shares one read-only dict.
+        """
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            return config
+            return load_config(config_path)
         except FileNotFoundError:
-            logger.warning(f"Config file not found at {config_path}, using defaults")
+            logger.warning("Config file not found at %s, using defaults", config_path)
             return {}
     
+    @classmethod
+    def get_shared(cls, config_path: str = "config/config.yaml",
+                   config: Mapping[str, Any] = None) -> 'SnowflakeConnection':
+        """
+        Get a connection shared by every caller with the same session settings.
+        
+        The pipeline stages and example scripts reuse one authenticated
+        session instead of paying the TCP/TLS/auth round-trips per stage.
+        Callers share a session only when account, user, warehouse, role,
+        default database and schema, statement timeout and query tag all
+        match, so unqualified table names and session limits never come from
+        another caller's config. A new instance is only built on a miss.
+        
+        Args:
+            config_path: Path to configuration file
+            config: Already-parsed configuration; when given, config_path is not read
+            
+        Returns:
+            Shared SnowflakeConnection instance
+        """
+        load_dotenv()
+        if config is None:
+            config = cls._load_config(os.path.abspath(config_path))
+        params = cls._params_from_config(config)
+        sf_config = config.get('snowflake', {})
+        key = (
+            params['account'], params['user'], params['warehouse'], params['role'],
+            params['database'], params['schema'],
+            sf_config.get('statement_timeout_seconds', 300),
+            sf_config.get('query_tag', DEFAULT_QUERY_TAG)
+        )
+        
+        with _shared_connections_lock:
+            shared = _shared_connections.get(key)
+            if shared is None:
+                shared = _shared_connections[key] = cls(config_path, config=config)
+            return shared
+    
+    def _connection_params(self) -> Dict[str, Any]:
+        """Resolve connection parameters from the environment, falling back to config."""
+        return self._params_from_config(self.config)
+    
+    @staticmethod
+    def _params_from_config(config: Mapping[str, Any]) -> Dict[str, Any]:
+        """Resolve connection parameters for a config, preferring environment variables."""
+        sf_config = config.get('snowflake', {})
+        
+        return {
+            'account': os.getenv('SNOWFLAKE_ACCOUNT', sf_config.get('account')),
+            'user': os.getenv('SNOWFLAKE_USER', sf_config.get('user')),
+            'password': os.getenv('SNOWFLAKE_PASSWORD', sf_config.get('password')),
+            'warehouse': os.getenv('SNOWFLAKE_WAREHOUSE', sf_config.get('warehouse')),
+            'database': os.getenv('SNOWFLAKE_DATABASE', sf_config.get('database')),
+            'schema': os.getenv('SNOWFLAKE_SCHEMA', sf_config.get('schema')),
+            'role': os.getenv('SNOWFLAKE_ROLE', sf_config.get('role'))
+        }
+    
     def connect(self) -> snowflake.connector.SnowflakeConnection:
         """
         Establish connection to Snowflake.
         
+        An already open connection is reused rather than re-authenticated.
+        
         Returns:
             Snowflake connection object
         """
+        if self.connection and not self.connection.is_closed():
+            return self.connection
+        
+        sf_config = self.config.get('snowflake', {})
+        
         try:
-            sf_config = self.config.get('snowflake', {})
-            
             self.connection = snowflake.connector.connect(
-                account=os.getenv('SNOWFLAKE_ACCOUNT', sf_config.get('account')),
-                user=os.getenv('SNOWFLAKE_USER', sf_config.get('user')),
-                password=os.getenv('SNOWFLAKE_PASSWORD', sf_config.get('password')),
-                warehouse=os.getenv('SNOWFLAKE_WAREHOUSE', sf_config.get('warehouse')),
-                database=os.getenv('SNOWFLAKE_DATABASE', sf_config.get('database')),
-                schema=os.getenv('SNOWFLAKE_SCHEMA', sf_config.get('schema')),
-                role=os.getenv('SNOWFLAKE_ROLE', sf_config.get('role'))
+                **self._connection_params(),
+                client_prefetch_threads=8,
+                session_parameters={
+                    'CLIENT_SESSION_KEEP_ALIVE': True,
+                    'USE_CACHED_RESULT': True,
+                    'STATEMENT_TIMEOUT_IN_SECONDS': sf_config.get('statement_timeout_seconds', 300),
+                    'QUERY_TAG': sf_config.get('query_tag', DEFAULT_QUERY_TAG)
+                }
             )
             
             logger.info("Successfully connected to Snowflake")
             return self.connection
             
         except Exception as e:
-            logger.error(f"Failed to connect to Snowflake: {str(e)}")
+            logger.error("Failed to connect to Snowflake: %s", e)
             raise
     
-    def execute_query(self, query: str, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    @contextmanager
+    def stage(self, name: str) -> Iterator['SnowflakeConnection']:
+        """
+        Tag every query issued inside the block with a stage-specific QUERY_TAG.
+        
+        Per-stage cost can then be grouped by QUERY_TAG in
+        SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY. The session tag is restored on exit.
+        
+        Args:
+            name: Query tag for the stage (e.g. 'metadata_extraction')
+            
+        Yields:
+            This connection
+        """
+        default_tag = self.config.get('snowflake', {}).get('query_tag', DEFAULT_QUERY_TAG)
+        self.execute_query("ALTER SESSION SET QUERY_TAG = %s", (name,))
+        try:
+            yield self
+        finally:
+            if self.connection and not self.connection.is_closed():
+                self.execute_query("ALTER SESSION SET QUERY_TAG = %s", (default_tag,))
+    
+    def execute_query(self, query: str, params: Optional[Union[Dict, Sequence]] = None) -> List[Dict[str, Any]]:
         """
         Execute a SQL query and return results.
         
@@ -88,12 +206,131 @@ class SnowflakeConnection:
             results = cursor.fetchall()
             cursor.close()
             
-            logger.debug(f"Query executed successfully, returned {len(results)} rows")
+            logger.debug("Query executed successfully, returned %s rows", len(results))
             return results
             
         except Exception as e:
-            logger.error(f"Query execution failed: {str(e)}")
+            logger.error("Query execution failed: %s", e)
+            raise
+    
+    def execute_query_arrow(self, query: str, params: Optional[Union[Dict, Sequence]] = None) -> Iterator[pa.Table]:
+        """
+        Execute a SQL query and stream results as Arrow batches.
+        
+        Batches are yielded as Snowflake delivers result chunks, so peak memory
+        is bounded by the chunk size rather than the full result set. Only
+        SELECT-style queries return Arrow results; SHOW/DESCRIBE must go
+        through execute_query.
+        
+        Args:
+            query: SQL query to execute
+            params: Optional parameters for parameterized queries
+            
+        Yields:
+            pyarrow.Table objects, one per downloaded result chunk
+        """
+        if not self.connection:
+            self.connect()
+        
+        cursor = self.connection.cursor()
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            row_count = 0
+            for batch in cursor.fetch_arrow_batches():
+                row_count += batch.num_rows
+                yield batch
+            
+            logger.debug("Query streamed successfully, returned %s rows", row_count)
+            
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
+            raise
+        
+        finally:
+            cursor.close()
+    
+    def execute_query_iter(self, query: str, params: Optional[Union[Dict, Sequence]] = None,
+                           batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute a SQL query and stream results as lists of row dictionaries.
+        
+        Rows are pulled with ``fetchmany`` so at most ``batch_size`` rows are
+        held as Python dictionaries at a time.
+        
+        Args:
+            query: SQL query to execute
+            params: Optional parameters for parameterized queries
+            batch_size: Number of rows per yielded batch
+            
+        Yields:
+            Lists of up to ``batch_size`` row dictionaries
+        """
+        if not self.connection:
+            self.connect()
+        
+        cursor = self.connection.cursor(DictCursor)
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            row_count = 0
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                row_count += len(batch)
+                yield batch
+            
+            logger.debug("Query streamed successfully, returned %s rows", row_count)
+            
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
             raise
+        
+        finally:
+            cursor.close()
+    
+    def execute_query_table(self, query: str, params: Optional[Union[Dict, Sequence]] = None) -> pa.Table:
+        """
+        Execute a SQL query and return results as a columnar Arrow table.
+        
+        Args:
+            query: SQL query to execute
+            params: Optional parameters for parameterized queries
+            
+        Returns:
+            pyarrow.Table containing query results (empty when no rows match)
+        """
+        if not self.connection:
+            self.connect()
+        
+        cursor = self.connection.cursor()
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            table = cursor.fetch_arrow_all()
+            if table is None:
+                # The connector returns None instead of an empty table for zero rows
+                table = pa.table({col.name: pa.array([], type=pa.string()) for col in cursor.description})
+            
+            logger.debug("Query executed successfully, returned %s rows", table.num_rows)
+            return table
+            
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
+            raise
+        
+        finally:
+            cursor.close()
     
     def execute_many(self, query: str, data: List[tuple]) -> None:
         """
@@ -112,13 +349,257 @@ class SnowflakeConnection:
             self.connection.commit()
             cursor.close()
             
-            logger.info(f"Batch insert completed: {len(data)} rows")
+            logger.info("Batch insert completed: %s rows", len(data))
             
         except Exception as e:
-            logger.error(f"Batch execution failed: {str(e)}")
+            logger.error("Batch execution failed: %s", e)
             self.connection.rollback()
             raise
     
+    def bulk_load(self, table_name: str, columns: List[str], rows: Iterable[tuple],
+                  json_columns: Sequence[str] = (),
+                  max_file_bytes: int = 200 * 1024 * 1024,
+                  max_upload_threads: int = 4,
+                  batch_size: int = 10000,
+                  in_memory: bool = None) -> int:
+        """
+        Bulk load rows into a table through a staged Parquet file and COPY INTO.
+        
+        Rows are written to SNAPPY-compressed Parquet files of at most
+        ``max_file_bytes``, uploaded to the table stage with PUT (in parallel
+        when there is more than one file) and loaded with a single COPY INTO.
+        This replaces per-row bind inserts with one server-side bulk load.
+        Small payloads skip the stage and go in one multi-row INSERT, which
+        saves the PUT round trips.
+        
+        ``rows`` may be any iterable, including a generator: it is consumed in
+        batches of ``batch_size`` rows that are appended to the Parquet files
+        as they are produced, so only one batch is held in memory at a time.
+        With ``in_memory`` the Parquet files are built in memory and uploaded
+        with PUT's ``file_stream`` instead of through a temporary directory;
+        this is the default when ``rows`` is already a list or tuple, whose
+        compressed Parquet copy is smaller than the rows themselves.
+        
+        Args:
+            table_name: Target table name (optionally database/schema qualified)
+            columns: Target column names, in the same order as the row values
+            rows: Iterable of tuples containing row values
+            json_columns: Columns holding JSON strings to load into VARIANT columns
+            max_file_bytes: Approximate upper bound on the size of each staged file
+            max_upload_threads: Maximum number of concurrent PUT uploads
+            batch_size: Number of rows converted and written per Parquet row group
+            in_memory: Stage files from memory rather than a temporary directory
+                (defaults to True for list/tuple rows, False otherwise)
+            
+        Returns:
+            Number of rows loaded
+        """
+        if in_memory is None:
+            in_memory = isinstance(rows, (list, tuple))
+        rows = iter(rows)
+        head = list(itertools.islice(rows, SMALL_LOAD_MAX_ROWS + 1))
+        if not head:
+            logger.info("No rows to load into %s", table_name)
+            return 0
+        
+        if not self.connection:
+            self.connect()
+        
+        if len(head) <= SMALL_LOAD_MAX_ROWS and self._payload_bytes(head) <= SMALL_LOAD_MAX_BYTES:
+            return self._insert_values(table_name, columns, head, json_columns)
+        
+        qualifier, _, name = table_name.rpartition('.')
+        stage = f"@{qualifier}.%{name}" if qualifier else f"@%{name}"
+        prefix = f"bulk_{uuid.uuid4().hex}"
+        
+        tmp_dir = None if in_memory else tempfile.mkdtemp(prefix="governance_bulk_")
+        try:
+            files = []
+            total_rows = 0
+            writer = None
+            writer_schema = None
+            file_bytes = 0
+            all_rows = itertools.chain(head, rows)
+            try:
+                while True:
+                    batch = list(itertools.islice(all_rows, batch_size))
+                    if not batch:
+                        break
+                    arrow_table = self._rows_to_arrow(columns, batch)
+                    
+                    # COPY reads columns by name, so a batch whose inferred types
+                    # differ (e.g. an all-NULL column) simply starts a new file
+                    if writer is None or file_bytes >= max_file_bytes or arrow_table.schema != writer_schema:
+                        if writer is not None:
+                            writer.close()
+                        file_name = f"{prefix}_{len(files)}.parquet"
+                        sink = io.BytesIO() if in_memory else os.path.join(tmp_dir, file_name)
+                        writer = pq.ParquetWriter(sink, arrow_table.schema, compression='snappy')
+                        writer_schema = arrow_table.schema
+                        files.append((file_name, sink))
+                        file_bytes = 0
+                    
+                    writer.write_table(arrow_table)
+                    file_bytes += arrow_table.nbytes
+                    total_rows += arrow_table.num_rows
+            finally:
+                if writer is not None:
+                    writer.close()
+            
+            def upload(file: tuple) -> None:
+                file_name, sink = file
+                cursor = self.connection.cursor()
+                try:
+                    if in_memory:
+                        # The connector reads the stream; the URI only names the staged file
+                        sink.seek(0)
+                        cursor.execute(
+                            f"PUT 'file://{file_name}' {stage}/{prefix} AUTO_COMPRESS=FALSE OVERWRITE=TRUE",
+                            file_stream=sink
+                        )
+                    else:
+                        file_uri = 'file://' + sink.replace('\\', '/')
+                        cursor.execute(f"PUT '{file_uri}' {stage}/{prefix} AUTO_COMPRESS=FALSE OVERWRITE=TRUE")
+                finally:
+                    cursor.close()
+            
+            if len(files) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_upload_threads, len(files))) as executor:
+                    list(executor.map(upload, files))
+            else:
+                upload(files[0])
+            
+            select_exprs = ', '.join(
+                f'PARSE_JSON($1:"{col}"::STRING)' if col in json_columns else f'$1:"{col}"'
+                for col in columns
+            )
+            copy_query = f"""
+            COPY INTO {table_name} ({', '.join(columns)})
+            FROM (SELECT {select_exprs} FROM {stage}/{prefix}/)
+            FILE_FORMAT = (TYPE = PARQUET)
+            PURGE = TRUE
+            """
+            
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute(copy_query)
+            finally:
+                cursor.close()
+            
+            logger.info("Bulk load completed: %s rows in %s file(s) into %s", total_rows, len(files), table_name)
+            return total_rows
+            
+        except Exception as e:
+            logger.error("Bulk load into %s failed: %s", table_name, e)
+            raise
+        
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    def _insert_values(self, table_name: str, columns: List[str], rows: List[tuple],
+                       json_columns: Sequence[str] = ()) -> int:
+        """Load rows with a single bound multi-row INSERT ... SELECT FROM VALUES."""
+        # PARSE_JSON is not allowed inside a VALUES clause, so VALUES feeds a SELECT
+        select_exprs = ', '.join(
+            f"PARSE_JSON(${i})" if col in json_columns else f"${i}"
+            for i, col in enumerate(columns, start=1)
+        )
+        row_placeholder = f"({', '.join(['%s'] * len(columns))})"
+        insert_query = f"""
+        INSERT INTO {table_name} ({', '.join(columns)})
+        SELECT {select_exprs}
+        FROM VALUES {', '.join([row_placeholder] * len(rows))}
+        """
+        
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(insert_query, [value for row in rows for value in row])
+            logger.info("Inserted %s rows into %s", len(rows), table_name)
+            return len(rows)
+            
+        except Exception as e:
+            logger.error("Insert into %s failed: %s", table_name, e)
+            raise
+        
+        finally:
+            cursor.close()
+    
+    @staticmethod
+    def _payload_bytes(rows: List[tuple]) -> int:
+        """Approximate the rendered size of row values in a SQL statement."""
+        return sum(len(str(value)) + 4 for row in rows for value in row)
+    
+    def merge_load(self, table_name: str, columns: List[str], rows: Iterable[tuple],
+                   key_columns: Sequence[str], json_columns: Sequence[str] = ()) -> int:
+        """
+        Idempotently upsert rows into a table through a staged MERGE.
+        
+        Rows are bulk loaded into a temporary staging table shaped like the
+        target and merged in one statement: rows whose key columns match
+        (NULL-safe) are updated, the rest inserted. Re-running a load with the
+        same keys therefore replaces rows instead of duplicating them.
+        
+        Args:
+            table_name: Target table name (optionally database/schema qualified)
+            columns: Target column names, in the same order as the row values
+            rows: Iterable of tuples containing row values (streamed to the stage)
+            key_columns: Columns identifying a row in the target table
+            json_columns: Columns holding JSON strings to load into VARIANT columns
+            
+        Returns:
+            Number of rows staged for the merge
+        """
+        in_memory = isinstance(rows, (list, tuple))
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            logger.info("No rows to merge into %s", table_name)
+            return 0
+        rows = itertools.chain([first_row], rows)
+        
+        staging_table = f"{table_name}_STG_{uuid.uuid4().hex[:8].upper()}"
+        key_match = ' AND '.join(f"EQUAL_NULL(t.{col}, s.{col})" for col in key_columns)
+        update_columns = [col for col in columns if col not in key_columns]
+        
+        merge_query = f"""
+        MERGE INTO {table_name} t
+        USING (
+            SELECT * FROM {staging_table}
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY {', '.join(key_columns)} ORDER BY {key_columns[0]}) = 1
+        ) s
+        ON {key_match}
+        WHEN MATCHED THEN UPDATE SET {', '.join(f"t.{col} = s.{col}" for col in update_columns)}
+        WHEN NOT MATCHED THEN INSERT ({', '.join(columns)})
+            VALUES ({', '.join(f"s.{col}" for col in columns)})
+        """
+        
+        try:
+            self.execute_query(f"CREATE TEMPORARY TABLE {staging_table} LIKE {table_name}")
+            staged = self.bulk_load(staging_table, columns, rows, json_columns=json_columns, in_memory=in_memory)
+            self.execute_query(merge_query)
+            logger.info("Merged %s rows into %s", staged, table_name)
+            return staged
+            
+        except Exception as e:
+            logger.error("Merge into %s failed: %s", table_name, e)
+            raise
+        
+        finally:
+            if self.connection and not self.connection.is_closed():
+                self.execute_query(f"DROP TABLE IF EXISTS {staging_table}")
+    
+    @staticmethod
+    def _rows_to_arrow(columns: List[str], rows: List[tuple]) -> pa.Table:
+        """Transpose row tuples into an Arrow table, rendering temporal values as ISO strings."""
+        arrays = {}
+        for i, col in enumerate(columns):
+            values = [row[i] for row in rows]
+            if any(isinstance(v, (datetime, date)) for v in values):
+                values = [v.isoformat() if isinstance(v, (datetime, date)) else v for v in values]
+            arrays[col] = values
+        return pa.table(arrays)
+    
     def create_table_if_not_exists(self, table_name: str, schema_ddl: str) -> None:
         """
         Create a table if it doesn't exist.
@@ -129,14 +610,22 @@ class SnowflakeConnection:
         """
         try:
             self.execute_query(schema_ddl)
-            logger.info(f"Table {table_name} created or already exists")
+            logger.info("Table %s created or already exists", table_name)
         except Exception as e:
-            logger.error(f"Failed to create table {table_name}: {str(e)}")
+            logger.error("Failed to create table %s: %s", table_name, e)
             raise
     
-    def close(self) -> None:
-        """Close the Snowflake connection."""
+    def close(self, flush_telemetry: bool = True) -> None:
+        """
+        Close the Snowflake connection.
+        
+        Args:
+            flush_telemetry: Whether to send the connector's buffered telemetry
+                before closing. Disabling it skips one HTTPS round trip.
+        """
         if self.connection:
+            if not flush_telemetry:
+                self.connection.telemetry_enabled = False
             self.connection.close()
             logger.info("Snowflake connection closed")
             self.connection = None
@@ -147,5 +636,5 @@ class SnowflakeConnection:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
+        """Context manager exit. Skips the final telemetry flush on shutdown."""
+        self.close(flush_telemetry=False)
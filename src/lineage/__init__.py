@@ -1,5 +1,7 @@
 """Lineage module initialization."""
 
 from .lineage_tracker import LineageTracker
+from .lineage_graph import LineageGraph
+from .lineage_records import LineageRecords
 
-__all__ = ['LineageTracker']
+__all__ = ['LineageTracker', 'LineageGraph', 'LineageRecords']
@@ -0,0 +1,164 @@
+"""
+Lineage Graph Module
+Compact directed graph of table lineage backed by integer ids and CSR adjacency.
+"""
+
+from array import array
+from typing import List, Dict, Any, Tuple, Iterator, Optional
+import networkx as nx
+import numpy as np
+
+
+class LineageGraph:
+    """
+    Directed lineage graph with interned node ids and array-backed edges.
+    
+    Table names are interned to integer ids and edges are stored as two
+    parallel ``array('i')`` vectors. Neighbour lookups go through compressed
+    sparse row (CSR) offsets built with numpy on first use after a change, so
+    traversals slice contiguous integer arrays instead of walking per-node
+    Python dictionaries. Adding an existing edge updates its attributes, as
+    with ``networkx.DiGraph.add_edge``. ``version`` increases whenever the
+    graph structure changes, so callers can key cached traversals on it.
+    """
+    
+    def __init__(self):
+        """Initialize an empty graph."""
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._sources = array('i')
+        self._targets = array('i')
+        self._edge_index: Dict[Tuple[int, int], int] = {}
+        self._edge_attributes: List[Dict[str, Any]] = []
+        self._forward: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._reverse: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.version = 0
+    
+    def _intern(self, name: str) -> int:
+        """Return the id of a node, adding it if needed."""
+        node_id = self._ids.get(name)
+        if node_id is None:
+            node_id = len(self._names)
+            self._ids[name] = node_id
+            self._names.append(name)
+        return node_id
+    
+    def add_edge(self, source: str, target: str, **attributes) -> None:
+        """
+        Add a directed edge, or update the attributes of an existing one.
+        
+        Args:
+            source: Upstream node name
+            target: Downstream node name
+            attributes: Edge attributes (e.g. type, query_id)
+        """
+        key = (self._intern(source), self._intern(target))
+        position = self._edge_index.get(key)
+        if position is not None:
+            self._edge_attributes[position].update(attributes)
+            return
+        
+        self._edge_index[key] = len(self._edge_attributes)
+        self._sources.append(key[0])
+        self._targets.append(key[1])
+        self._edge_attributes.append(dict(attributes))
+        self._forward = self._reverse = None
+        self.version += 1
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def number_of_nodes(self) -> int:
+        """Return the number of nodes."""
+        return len(self._names)
+    
+    def number_of_edges(self) -> int:
+        """Return the number of edges."""
+        return len(self._edge_attributes)
+    
+    def nodes(self) -> List[str]:
+        """Return node names in insertion order."""
+        return list(self._names)
+    
+    def edges(self, data: bool = False) -> Iterator[tuple]:
+        """
+        Iterate over edges in insertion order.
+        
+        Args:
+            data: Include the edge attribute dictionary as a third element
+        
+        Yields:
+            (source, target) or (source, target, attributes) tuples
+        """
+        names = self._names
+        for source_id, target_id, attributes in zip(self._sources, self._targets, self._edge_attributes):
+            if data:
+                yield names[source_id], names[target_id], attributes
+            else:
+                yield names[source_id], names[target_id]
+    
+    def edge_attributes(self, source: str, target: str) -> Dict[str, Any]:
+        """Return the attribute dictionary of an edge."""
+        return self._edge_attributes[self._edge_index[(self._ids[source], self._ids[target])]]
+    
+    def _csr(self, reverse: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (indptr, indices) adjacency, building it after graph changes."""
+        cached = self._reverse if reverse else self._forward
+        if cached is not None:
+            return cached
+        
+        sources = np.frombuffer(self._sources, dtype=np.int32) if self._sources else np.empty(0, np.int32)
+        targets = np.frombuffer(self._targets, dtype=np.int32) if self._targets else np.empty(0, np.int32)
+        rows, columns = (targets, sources) if reverse else (sources, targets)
+        
+        # A stable sort keeps neighbours in edge insertion order
+        order = np.argsort(rows, kind='stable')
+        indptr = np.zeros(len(self._names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self._names)), out=indptr[1:])
+        csr = (indptr, columns[order].copy())
+        
+        if reverse:
+            self._reverse = csr
+        else:
+            self._forward = csr
+        return csr
+    
+    def neighbor_ids(self, node_id: int, reverse: bool = False) -> np.ndarray:
+        """
+        Return the ids adjacent to a node.
+        
+        Args:
+            node_id: Node id
+            reverse: Follow edges backwards (predecessors) instead of forwards
+        
+        Returns:
+            Array of neighbour node ids
+        """
+        indptr, indices = self._csr(reverse)
+        return indices[indptr[node_id]:indptr[node_id + 1]]
+    
+    def node_id(self, name: str) -> int:
+        """Return the id of an existing node."""
+        return self._ids[name]
+    
+    def node_name(self, node_id: int) -> str:
+        """Return the name of a node id."""
+        return self._names[node_id]
+    
+    def predecessors(self, name: str) -> List[str]:
+        """Return the direct upstream nodes of ``name``."""
+        return [self._names[i] for i in self.neighbor_ids(self._ids[name], reverse=True)]
+    
+    def successors(self, name: str) -> List[str]:
+        """Return the direct downstream nodes of ``name``."""
+        return [self._names[i] for i in self.neighbor_ids(self._ids[name])]
+    
+    def to_networkx(self) -> nx.DiGraph:
+        """Convert to a ``networkx.DiGraph`` for analysis or visualization."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self._names)
+        graph.add_edges_from(self.edges(data=True))
+        return graph
@@ -0,0 +1,58 @@
+"""
+Lineage Records Module
+Column-oriented container for query-based lineage records.
+"""
+
+from typing import List, Dict, Any, Iterator
+import pyarrow as pa
+
+
+class LineageRecords:
+    """
+    Query lineage records stored as parallel column lists.
+    
+    Appending a record costs one list append per field instead of a dictionary
+    per (source, target) pair. Iterating yields plain dictionaries, so callers
+    written against the list-of-dicts shape keep working.
+    """
+    
+    FIELDS = (
+        'query_id',
+        'source_table',
+        'target_table',
+        'query_type',
+        'user_name',
+        'role_name',
+        'execution_time',
+        'elapsed_time_ms',
+        'extracted_at'
+    )
+    
+    def __init__(self):
+        """Initialize an empty record set."""
+        self.columns: Dict[str, List[Any]] = {field: [] for field in self.FIELDS}
+    
+    def append(self, *values: Any) -> None:
+        """
+        Append one record.
+        
+        Args:
+            values: Field values in FIELDS order
+        """
+        for column, value in zip(self.columns.values(), values):
+            column.append(value)
+    
+    def __len__(self) -> int:
+        return len(self.columns['query_id'])
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for values in zip(*self.columns.values()):
+            yield dict(zip(self.FIELDS, values))
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize the records as a list of dictionaries."""
+        return list(self)
+    
+    def to_arrow(self) -> pa.Table:
+        """Build an Arrow table with one column per field."""
+        return pa.table(self.columns)
@@ -3,13 +3,108 @@ Data Lineage Tracking Module
 Tracks data lineage through Snowflake query history and object dependencies.
 """
 
-from typing import List, Dict, Any, Set, Tuple
+from typing import List, Dict, Any, Set, Tuple, Iterator, Iterable, FrozenSet, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from functools import lru_cache
+import itertools
+import re
+import threading
 from datetime import datetime, timedelta
-from loguru import logger
-import json
-import networkx as nx
+import logging
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import SqlglotError
 
 from ..connection import SnowflakeConnection
+from ..utils import atomic_open, dumps_json, loads_json, qualified_name, stored_identifier, write_json, write_msgpack
+from .lineage_graph import LineageGraph
+from .lineage_records import LineageRecords
+
+logger = logging.getLogger(__name__)
+
+
+# Lineage query types by top-level statement class
+QUERY_TYPES = {
+    exp.Insert: 'INSERT',
+    exp.Create: 'CREATE_TABLE_AS_SELECT',
+    exp.Merge: 'MERGE',
+    exp.Update: 'UPDATE'
+}
+
+# Window queries by lineage source. ACCESS_HISTORY (Enterprise Edition) already
+# lists the objects each query read and wrote, so no SQL parsing is needed.
+# {order} is DESC for full scans and ASC for incremental ones.
+QUERY_HISTORY_SQL = {
+    'access_history': """
+    SELECT 
+        ah.query_id,
+        ah.user_name,
+        qh.role_name,
+        qh.query_type,
+        ah.query_start_time AS start_time,
+        qh.total_elapsed_time,
+        ah.direct_objects_accessed,
+        ah.objects_modified
+    FROM SNOWFLAKE.ACCOUNT_USAGE.ACCESS_HISTORY ah
+    JOIN SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY qh
+      ON qh.query_id = ah.query_id
+     AND qh.start_time >= %(window_start)s
+     AND qh.start_time < %(window_end)s
+    WHERE ah.query_start_time >= %(window_start)s
+      AND ah.query_start_time < %(window_end)s
+      AND ARRAY_SIZE(ah.objects_modified) > 0
+      AND qh.query_type IN ('INSERT', 'CREATE_TABLE_AS_SELECT', 'MERGE', 'UPDATE')
+    ORDER BY ah.query_start_time {order}
+    LIMIT %(limit)s
+    """,
+    'query_history': """
+    SELECT 
+        query_id,
+        query_text,
+        database_name,
+        schema_name,
+        user_name,
+        role_name,
+        execution_status,
+        start_time,
+        end_time,
+        total_elapsed_time
+    FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY
+    WHERE start_time >= %(window_start)s
+      AND start_time < %(window_end)s
+      AND execution_status = 'SUCCESS'
+      AND query_type IN ('INSERT', 'CREATE_TABLE_AS_SELECT', 'MERGE', 'UPDATE')
+    ORDER BY start_time {order}
+    LIMIT %(limit)s
+    """
+}
+
+# ACCOUNT_USAGE rows land up to ~3 hours after a query starts (ACCESS_HISTORY is
+# the slowest), so the incremental watermark is moved back by this much to pick
+# up long queries that started before the last saved one but landed after it.
+# Re-fetched queries are absorbed by the MERGE on (source, target, query_id).
+WATERMARK_OVERLAP = timedelta(hours=3)
+
+# ACCESS_HISTORY object domains that are lineage nodes
+LINEAGE_OBJECT_DOMAINS = {'Table', 'View', 'Materialized view', 'External table', 'Dynamic table'}
+
+# Keywords that introduce a table read; matched in one case-insensitive pass
+SOURCE_KEYWORDS = re.compile(r'\b(?:FROM|USING)\b', re.IGNORECASE)
+
+# Maximum memoized traversals per direction
+TRAVERSAL_CACHE_SIZE = 10000
+
+# Below this many distinct statements, parsing in-process beats pool startup
+PARALLEL_PARSE_MIN_QUERIES = 256
+
+
+def _parse_query(query_text: str) -> Tuple[FrozenSet[str], FrozenSet[str], str]:
+    """Process-pool entry point for LineageTracker._parse_query_lineage."""
+    return LineageTracker._parse_query_lineage(query_text)
 
 
 class LineageTracker:
@@ -23,7 +118,34 @@ class LineageTracker:
             connection: Snowflake connection instance
         """
         self.connection = connection
-        self.lineage_graph = nx.DiGraph()
+        self.lineage_graph = LineageGraph()
+        
+        # Extraction methods may run concurrently (e.g. one thread per database)
+        self._graph_lock = threading.Lock()
+        
+        # Traversal results keyed by (table_name, max_depth), valid for the
+        # graph version they were computed against
+        self._upstream_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._downstream_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._cache_version = self.lineage_graph.version
+    
+    def _add_edge(self, source: str, target: str, **attributes) -> None:
+        """Add an edge to the lineage graph (bumping its version on structural change)."""
+        with self._graph_lock:
+            self.lineage_graph.add_edge(source, target, **attributes)
+    
+    def _traversal_cache(self, upstream: bool) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """Return the traversal cache, dropping entries computed before the last graph change."""
+        if self._cache_version != self.lineage_graph.version:
+            self._upstream_cache.clear()
+            self._downstream_cache.clear()
+            self._cache_version = self.lineage_graph.version
+        
+        cache = self._upstream_cache if upstream else self._downstream_cache
+        if len(cache) >= TRAVERSAL_CACHE_SIZE:
+            # Evict the oldest entry
+            del cache[next(iter(cache))]
+        return cache
     
     def extract_table_dependencies(self, database_name: str, schema_name: str = None) -> List[Dict[str, Any]]:
         """
@@ -36,200 +158,399 @@ class LineageTracker:
         Returns:
             List of table dependencies
         """
+        query = f"""
+        SELECT 
+            table_catalog as database_name,
+            table_schema as schema_name,
+            table_name,
+            referenced_database,
+            referenced_schema,
+            referenced_object_name,
+            referenced_object_domain
+        FROM {qualified_name(database_name)}.INFORMATION_SCHEMA.OBJECT_DEPENDENCIES
+        """
+        params = None
         if schema_name:
-            query = f"""
-            SELECT 
-                table_catalog as database_name,
-                table_schema as schema_name,
-                table_name,
-                referenced_database,
-                referenced_schema,
-                referenced_object_name,
-                referenced_object_domain
-            FROM {database_name}.INFORMATION_SCHEMA.OBJECT_DEPENDENCIES
-            WHERE table_schema = '{schema_name}'
-            """
-        else:
-            query = f"""
-            SELECT 
-                table_catalog as database_name,
-                table_schema as schema_name,
-                table_name,
-                referenced_database,
-                referenced_schema,
-                referenced_object_name,
-                referenced_object_domain
-            FROM {database_name}.INFORMATION_SCHEMA.OBJECT_DEPENDENCIES
-            """
+            query += "WHERE table_schema = %s"
+            params = (stored_identifier(schema_name),)
         
         try:
-            results = self.connection.execute_query(query)
+            table = self.connection.execute_query_table(query, params)
+            
+            # Build fully qualified node names column-wise in Arrow
+            sources = self._qualified_names(
+                table, 'REFERENCED_DATABASE', 'REFERENCED_SCHEMA', 'REFERENCED_OBJECT_NAME'
+            )
+            targets = self._qualified_names(table, 'DATABASE_NAME', 'SCHEMA_NAME', 'TABLE_NAME')
+            columns = {name: table.column(name).to_pylist() for name in table.column_names}
+            
             dependencies = []
+            extracted_at = datetime.utcnow().isoformat()
             
-            for dep in results:
+            for i in range(table.num_rows):
                 dependency = {
-                    'source_database': dep.get('REFERENCED_DATABASE'),
-                    'source_schema': dep.get('REFERENCED_SCHEMA'),
-                    'source_object': dep.get('REFERENCED_OBJECT_NAME'),
-                    'source_type': dep.get('REFERENCED_OBJECT_DOMAIN'),
-                    'target_database': dep.get('DATABASE_NAME'),
-                    'target_schema': dep.get('SCHEMA_NAME'),
-                    'target_object': dep.get('TABLE_NAME'),
+                    'source_table': sources[i],
+                    'target_table': targets[i],
+                    'source_database': columns['REFERENCED_DATABASE'][i],
+                    'source_schema': columns['REFERENCED_SCHEMA'][i],
+                    'source_object': columns['REFERENCED_OBJECT_NAME'][i],
+                    'source_type': columns['REFERENCED_OBJECT_DOMAIN'][i],
+                    'target_database': columns['DATABASE_NAME'][i],
+                    'target_schema': columns['SCHEMA_NAME'][i],
+                    'target_object': columns['TABLE_NAME'][i],
                     'dependency_type': 'DIRECT',
-                    'extracted_at': datetime.utcnow().isoformat()
+                    'extracted_at': extracted_at
                 }
                 dependencies.append(dependency)
                 
                 # Add to graph
-                source = f"{dep.get('REFERENCED_DATABASE')}.{dep.get('REFERENCED_SCHEMA')}.{dep.get('REFERENCED_OBJECT_NAME')}"
-                target = f"{dep.get('DATABASE_NAME')}.{dep.get('SCHEMA_NAME')}.{dep.get('TABLE_NAME')}"
-                self.lineage_graph.add_edge(source, target, type='DIRECT')
+                self._add_edge(sources[i], targets[i], type='DIRECT')
             
-            logger.info(f"Extracted {len(dependencies)} table dependencies")
+            logger.info("Extracted %s table dependencies", len(dependencies))
             return dependencies
             
         except Exception as e:
-            logger.error(f"Failed to extract table dependencies: {str(e)}")
+            logger.error("Failed to extract table dependencies: %s", e)
             raise
     
-    def extract_query_history_lineage(self, days: int = 7, limit: int = 10000) -> List[Dict[str, Any]]:
+    def extract_query_history_lineage(self, days: int = 7, limit: int = 10000,
+                                      window_days: int = 1, max_workers: int = 4,
+                                      parse_workers: int = None,
+                                      source: str = 'access_history',
+                                      output_table: str = None,
+                                      force_full: bool = False) -> LineageRecords:
         """
         Extract lineage from query history.
         
+        The lookback period is split into windows of ``window_days`` which are
+        fetched concurrently (newest first, or oldest first when incremental)
+        on separate cursors. With
+        ``source='access_history'`` Snowflake returns the objects each query
+        read and modified, filtered server-side to writing queries. If
+        ACCESS_HISTORY is unavailable (it requires Enterprise Edition), or with
+        ``source='query_history'``, query text is parsed instead: each distinct
+        text once, large batches across a process pool. Graph edges are added
+        serially in this process afterwards.
+        
+        With ``output_table``, extraction is incremental: only queries that
+        started at or after the latest execution_time already saved there,
+        less WATERMARK_OVERLAP, are fetched, and ``days`` applies only when the
+        table is empty or missing. Incremental scans run oldest first, so when
+        ``limit`` cuts a scan short the next run resumes where it stopped.
+        
         Args:
             days: Number of days to look back
             limit: Maximum number of queries to analyze
+            window_days: Size of each query history window in days
+            max_workers: Maximum number of windows fetched concurrently
+            parse_workers: Processes used for parsing (None for one per CPU,
+                1 to parse in-process)
+            source: 'access_history' or 'query_history'
+            output_table: Lineage table written by save_lineage_to_snowflake,
+                used as the high-watermark for incremental extraction
+            force_full: Ignore the watermark and re-scan the full ``days``
             
         Returns:
-            List of lineage relationships from query history
+            Lineage relationships from query history, stored column-wise
+            (iterates as dictionaries)
         """
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(days=days)
-        
+        try:
+            lineage_records = LineageRecords()
+            
+            if source not in QUERY_HISTORY_SQL:
+                raise ValueError(f"Unknown lineage source: {source}")
+            
+            since = None
+            if output_table and not force_full:
+                since = self._lineage_watermark(output_table)
+            
+            batches = self._iter_query_history(days, limit, window_days, max_workers, source, since=since)
+            first_batch = []
+            if source == 'access_history':
+                try:
+                    first_batch = next(batches, [])
+                except Exception as e:
+                    logger.warning("ACCESS_HISTORY unavailable, parsing QUERY_HISTORY instead: %s", e)
+                    source = 'query_history'
+                    batches = self._iter_query_history(days, limit, window_days, max_workers, source,
+                                                       since=since)
+            
+            extracted_at = datetime.utcnow().isoformat()
+            executor = None
+            if source == 'query_history' and parse_workers != 1:
+                executor = ProcessPoolExecutor(max_workers=parse_workers)
+            
+            try:
+                for batch in itertools.chain([first_batch], batches):
+                    if source == 'access_history':
+                        parsed_records = [self._access_history_lineage(query_record) for query_record in batch]
+                    else:
+                        query_texts = [query_record.get('QUERY_TEXT') or '' for query_record in batch]
+                        parsed = self._parse_query_texts(query_texts, executor)
+                        parsed_records = [parsed[query_text] for query_text in query_texts]
+                    
+                    for query_record, (source_tables, target_tables, query_type) in zip(batch, parsed_records):
+                        for target in target_tables:
+                            for source_table in source_tables:
+                                lineage_records.append(
+                                    query_record.get('QUERY_ID'),
+                                    source_table,
+                                    target,
+                                    query_type,
+                                    query_record.get('USER_NAME'),
+                                    query_record.get('ROLE_NAME'),
+                                    str(query_record.get('START_TIME')),
+                                    query_record.get('TOTAL_ELAPSED_TIME'),
+                                    extracted_at
+                                )
+                                
+                                # Add to graph
+                                self._add_edge(source_table, target,
+                                               type='QUERY_BASED',
+                                               query_id=query_record.get('QUERY_ID'))
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            
+            logger.info("Extracted %s lineage records from query history", len(lineage_records))
+            return lineage_records
+            
+        except Exception as e:
+            logger.error("Failed to extract query history lineage: %s", e)
+            raise
+    
+    def _lineage_watermark(self, output_table: str) -> Optional[datetime]:
+        """Return the latest saved query execution time less WATERMARK_OVERLAP, or None if nothing was saved yet."""
         query = f"""
-        SELECT 
-            query_id,
-            query_text,
-            database_name,
-            schema_name,
-            user_name,
-            role_name,
-            execution_status,
-            start_time,
-            end_time,
-            total_elapsed_time
-        FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY
-        WHERE start_time >= '{start_time.isoformat()}'
-          AND start_time <= '{end_time.isoformat()}'
-          AND execution_status = 'SUCCESS'
-          AND query_type IN ('INSERT', 'CREATE_TABLE_AS_SELECT', 'MERGE', 'UPDATE')
-        ORDER BY start_time DESC
-        LIMIT {limit}
+        SELECT MAX(execution_time) AS watermark
+        FROM {output_table}
+        WHERE query_id <> ''
         """
         
         try:
             results = self.connection.execute_query(query)
-            lineage_records = []
+        except Exception as e:
+            logger.warning("No lineage watermark in %s, running full extraction: %s", output_table, e)
+            return None
+        
+        watermark = results[0].get('WATERMARK') if results else None
+        if watermark is not None:
+            watermark -= WATERMARK_OVERLAP
+            logger.info("Extracting query lineage incrementally since %s", watermark)
+        return watermark
+    
+    @staticmethod
+    def _parse_query_texts(query_texts: List[str],
+                           executor: ProcessPoolExecutor = None) -> Dict[str, Tuple[FrozenSet[str], FrozenSet[str], str]]:
+        """Parse each distinct query text, on the process pool for large batches."""
+        unique_texts = list(dict.fromkeys(query_texts))
+        
+        if executor is None or len(unique_texts) < PARALLEL_PARSE_MIN_QUERIES:
+            return {text: LineageTracker._parse_query_lineage(text) for text in unique_texts}
+        
+        return dict(zip(unique_texts, executor.map(_parse_query, unique_texts, chunksize=64)))
+    
+    @staticmethod
+    def _qualified_names(table: pa.Table, database_col: str, schema_col: str, object_col: str) -> List[str]:
+        """Join database, schema and object columns into dotted names with Arrow compute."""
+        parts = [pc.cast(table.column(col), pa.string()) for col in (database_col, schema_col, object_col)]
+        return pc.binary_join_element_wise(
+            *parts, '.', null_handling='replace', null_replacement='None'
+        ).to_pylist()
+    
+    def _iter_query_history(self, days: int, limit: int, window_days: int, max_workers: int,
+                            source: str = 'query_history',
+                            batch_size: int = 1000,
+                            since: datetime = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream ACCESS_HISTORY or QUERY_HISTORY rows over sliding windows.
+        
+        Up to ``max_workers`` window queries run ahead concurrently; each worker
+        executes its query and fetches only the first batch, and the remaining
+        rows are pulled lazily with ``fetchmany``. Batches are yielded in window
+        order until ``limit`` rows have been produced, so memory is bounded by
+        the in-flight batches rather than the full history. ``since`` replaces
+        the ``days`` lookback as the start of the scanned range and switches
+        to oldest-first order, so a scan truncated by ``limit`` never skips
+        queries older than those it returned.
+        """
+        end_time = datetime.utcnow()
+        start_time = since if since is not None else end_time - timedelta(days=days)
+        
+        windows = []
+        window_end = end_time
+        while window_end > start_time:
+            window_start = max(window_end - timedelta(days=window_days), start_time)
+            windows.append((window_start, window_end))
+            window_end = window_start
+        
+        order = 'DESC'
+        if since is not None:
+            windows.reverse()
+            order = 'ASC'
+        query = QUERY_HISTORY_SQL[source].format(order=order)
+        
+        def open_window(window: Tuple[datetime, datetime]) -> Tuple[List[Dict[str, Any]], Iterator]:
+            window_start, window_end = window
+            params = {'window_start': window_start, 'window_end': window_end, 'limit': limit}
+            rows = self.connection.execute_query_iter(query, params, batch_size)
+            return next(rows, []), rows
+        
+        workers = max(1, min(max_workers, len(windows)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = deque()
+        pending = iter(windows)
+        try:
+            for window in itertools.islice(pending, workers):
+                futures.append(executor.submit(open_window, window))
             
-            for query_record in results:
-                query_text = query_record.get('QUERY_TEXT', '').upper()
+            produced = 0
+            while futures:
+                first_batch, rows = futures.popleft().result()
+                try:
+                    for batch in itertools.chain([first_batch], rows):
+                        if produced + len(batch) >= limit:
+                            yield batch[:limit - produced]
+                            return
+                        produced += len(batch)
+                        yield batch
+                finally:
+                    rows.close()
                 
-                # Parse query to extract source and target tables
-                source_tables = self._extract_source_tables(query_text)
-                target_tables = self._extract_target_tables(query_text)
-                
-                for target in target_tables:
-                    for source in source_tables:
-                        lineage = {
-                            'query_id': query_record.get('QUERY_ID'),
-                            'source_table': source,
-                            'target_table': target,
-                            'query_type': self._determine_query_type(query_text),
-                            'user_name': query_record.get('USER_NAME'),
-                            'role_name': query_record.get('ROLE_NAME'),
-                            'execution_time': str(query_record.get('START_TIME')),
-                            'elapsed_time_ms': query_record.get('TOTAL_ELAPSED_TIME'),
-                            'extracted_at': datetime.utcnow().isoformat()
-                        }
-                        lineage_records.append(lineage)
-                        
-                        # Add to graph
-                        self.lineage_graph.add_edge(source, target, 
-                                                   type='QUERY_BASED',
-                                                   query_id=query_record.get('QUERY_ID'))
-            
-            logger.info(f"Extracted {len(lineage_records)} lineage records from query history")
-            return lineage_records
+                next_window = next(pending, None)
+                if next_window is not None:
+                    futures.append(executor.submit(open_window, next_window))
+        finally:
+            for future in futures:
+                if not future.cancel() and future.exception() is None:
+                    future.result()[1].close()
+            executor.shutdown(wait=True)
+    
+    @staticmethod
+    def _access_history_lineage(query_record: Dict[str, Any]) -> Tuple[FrozenSet[str], FrozenSet[str], str]:
+        """Unpack source tables, target tables and query type from an ACCESS_HISTORY row."""
+        def object_names(value: Any) -> FrozenSet[str]:
+            objects = loads_json(value) if isinstance(value, str) else (value or [])
+            return frozenset(
+                obj['objectName'] for obj in objects
+                if obj.get('objectName') and obj.get('objectDomain') in LINEAGE_OBJECT_DOMAINS
+            )
+        
+        query_type = query_record.get('QUERY_TYPE') or 'UNKNOWN'
+        targets = object_names(query_record.get('OBJECTS_MODIFIED'))
+        if not targets:
+            # e.g. only a stage was written; the accessed list cannot yield edges
+            return frozenset(), frozenset(), query_type
+        
+        # MERGE and UPDATE read their own target; that is not a lineage edge
+        return object_names(query_record.get('DIRECT_OBJECTS_ACCESSED')) - targets, targets, query_type
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_query_lineage(query_text: str) -> Tuple[FrozenSet[str], FrozenSet[str], str]:
+        """
+        Extract source tables, target tables and query type from query text.
+        
+        The query is parsed once with sqlglot's Snowflake dialect and the AST is
+        shared by the source/target/type helpers, so CTEs, subqueries and
+        comments do not produce spurious edges. Results are memoized by query
+        text because scheduled ETL statements recur verbatim in query history.
+        
+        Args:
+            query_text: SQL text from query history
             
-        except Exception as e:
-            logger.error(f"Failed to extract query history lineage: {str(e)}")
-            raise
+        Returns:
+            Tuple of (source tables, target tables, query type)
+        """
+        # A statement without FROM or USING cannot read a table (e.g.
+        # INSERT ... VALUES), so it yields no edges and is not worth parsing
+        if not SOURCE_KEYWORDS.search(query_text):
+            return frozenset(), frozenset(), 'UNKNOWN'
+        
+        try:
+            ast = sqlglot.parse_one(query_text, dialect='snowflake', error_level=sqlglot.ErrorLevel.IGNORE)
+        except SqlglotError:
+            return frozenset(), frozenset(), 'UNKNOWN'
+        
+        query_type = LineageTracker._query_type(ast)
+        target = LineageTracker._target_table(ast)
+        if target is None:
+            return frozenset(), frozenset(), query_type
+        
+        return (
+            LineageTracker._source_tables(ast, target),
+            frozenset([LineageTracker._table_name(target)]),
+            query_type
+        )
+    
+    @staticmethod
+    def _query_type(ast: exp.Expression) -> str:
+        """Determine the lineage query type of a parsed statement."""
+        return QUERY_TYPES.get(type(ast), 'UNKNOWN')
     
-    def _extract_source_tables(self, query_text: str) -> Set[str]:
-        """Extract source table names from query text."""
-        sources = set()
-        
-        # Simple pattern matching (can be enhanced with SQL parser)
-        keywords = ['FROM', 'JOIN', 'INNER JOIN', 'LEFT JOIN', 'RIGHT JOIN', 'FULL JOIN']
-        
-        for keyword in keywords:
-            if keyword in query_text:
-                parts = query_text.split(keyword)
-                for i in range(1, len(parts)):
-                    # Extract table name (simplified)
-                    tokens = parts[i].strip().split()
-                    if tokens:
-                        table_name = tokens[0].strip('(),;')
-                        if '.' in table_name:
-                            sources.add(table_name)
-        
-        return sources
+    @staticmethod
+    def _target_table(ast: exp.Expression) -> Optional[exp.Table]:
+        """Return the table node written by a parsed statement, if any."""
+        if type(ast) not in QUERY_TYPES or (isinstance(ast, exp.Create) and ast.kind != 'TABLE'):
+            return None
+        target = ast.this.find(exp.Table) if ast.this else None
+        return target if target is not None and target.name else None
     
-    def _extract_target_tables(self, query_text: str) -> Set[str]:
-        """Extract target table names from query text."""
-        targets = set()
-        
-        # Look for INSERT INTO, CREATE TABLE, MERGE INTO patterns
-        if 'INSERT INTO' in query_text:
-            parts = query_text.split('INSERT INTO')
-            for i in range(1, len(parts)):
-                tokens = parts[i].strip().split()
-                if tokens:
-                    targets.add(tokens[0].strip('(),;'))
-        
-        if 'CREATE TABLE' in query_text:
-            parts = query_text.split('CREATE TABLE')
-            for i in range(1, len(parts)):
-                tokens = parts[i].strip().split()
-                if tokens and tokens[0] not in ['IF', 'OR']:
-                    targets.add(tokens[0].strip('(),;'))
-        
-        if 'MERGE INTO' in query_text:
-            parts = query_text.split('MERGE INTO')
-            for i in range(1, len(parts)):
-                tokens = parts[i].strip().split()
-                if tokens:
-                    targets.add(tokens[0].strip('(),;'))
-        
-        return targets
+    @staticmethod
+    def _source_tables(ast: exp.Expression, target: exp.Table) -> FrozenSet[str]:
+        """Return the qualified tables read by a parsed statement."""
+        # Only qualified (schema.table or db.schema.table) sources are kept
+        return frozenset(
+            LineageTracker._table_name(table)
+            for table in ast.find_all(exp.Table)
+            if table is not target and table.db
+        )
+    
+    @staticmethod
+    def _table_name(table: exp.Table) -> str:
+        """Render a table node as a dotted name, upper-casing unquoted identifiers like Snowflake."""
+        return '.'.join(part.name if part.quoted else part.name.upper() for part in table.parts)
     
-    def _determine_query_type(self, query_text: str) -> str:
-        """Determine the type of query."""
-        if 'INSERT' in query_text:
-            return 'INSERT'
-        elif 'CREATE TABLE' in query_text:
-            return 'CREATE_TABLE_AS_SELECT'
-        elif 'MERGE' in query_text:
-            return 'MERGE'
-        elif 'UPDATE' in query_text:
-            return 'UPDATE'
-        else:
-            return 'UNKNOWN'
+    def _bfs(self, table_name: str, max_depth: int, reverse: bool = False) -> List[Tuple[str, int]]:
+        """
+        Breadth-first walk from a table up to ``max_depth`` hops.
+        
+        Each reachable table is reported once, at its shortest distance.
+        
+        Args:
+            table_name: Fully qualified table name to start from
+            max_depth: Maximum number of hops to follow
+            reverse: Walk upstream (predecessors) instead of downstream
+            
+        Returns:
+            List of (table name, depth) tuples in BFS order
+        """
+        graph = self.lineage_graph
+        start = graph.node_id(table_name)
+        visited = bytearray(graph.number_of_nodes())
+        visited[start] = 1
+        queue = deque([(start, 0)])
+        reached = []
+        
+        while queue:
+            node_id, depth = queue.popleft()
+            if depth >= max_depth:
+                continue
+            for neighbor_id in graph.neighbor_ids(node_id, reverse).tolist():
+                if not visited[neighbor_id]:
+                    visited[neighbor_id] = 1
+                    reached.append((graph.node_name(neighbor_id), depth + 1))
+                    queue.append((neighbor_id, depth + 1))
+        
+        return reached
     
     def get_upstream_lineage(self, table_name: str, max_depth: int = 5) -> Dict[str, Any]:
         """
         Get upstream lineage for a table.
         
+        Results are memoized until the lineage graph changes; callers must
+        treat the returned dictionary as read-only.
+        
         Args:
             table_name: Fully qualified table name
             max_depth: Maximum depth to traverse
@@ -238,9 +559,14 @@ class LineageTracker:
             Upstream lineage tree
         """
         if table_name not in self.lineage_graph:
-            logger.warning(f"Table {table_name} not found in lineage graph")
+            logger.warning("Table %s not found in lineage graph", table_name)
             return {}
         
+        cache = self._traversal_cache(upstream=True)
+        cache_key = (table_name, max_depth)
+        if cache_key in cache:
+            return cache[cache_key]
+        
         upstream = {
             'table': table_name,
             'ancestors': []
@@ -248,23 +574,28 @@ class LineageTracker:
         
         try:
             # Get all ancestors up to max_depth
-            for predecessor in self.lineage_graph.predecessors(table_name):
+            for ancestor, depth in self._bfs(table_name, max_depth, reverse=True):
                 upstream['ancestors'].append({
-                    'table': predecessor,
-                    'relationship': 'DIRECT_UPSTREAM'
+                    'table': ancestor,
+                    'depth': depth,
+                    'relationship': 'DIRECT_UPSTREAM' if depth == 1 else 'INDIRECT_UPSTREAM'
                 })
             
-            logger.info(f"Retrieved upstream lineage for {table_name}")
+            cache[cache_key] = upstream
+            logger.info("Retrieved upstream lineage for %s", table_name)
             return upstream
             
         except Exception as e:
-            logger.error(f"Failed to get upstream lineage: {str(e)}")
+            logger.error("Failed to get upstream lineage: %s", e)
             return upstream
     
     def get_downstream_lineage(self, table_name: str, max_depth: int = 5) -> Dict[str, Any]:
         """
         Get downstream lineage for a table.
         
+        Results are memoized until the lineage graph changes; callers must
+        treat the returned dictionary as read-only.
+        
         Args:
             table_name: Fully qualified table name
             max_depth: Maximum depth to traverse
@@ -273,9 +604,14 @@ class LineageTracker:
             Downstream lineage tree
         """
         if table_name not in self.lineage_graph:
-            logger.warning(f"Table {table_name} not found in lineage graph")
+            logger.warning("Table %s not found in lineage graph", table_name)
             return {}
         
+        cache = self._traversal_cache(upstream=False)
+        cache_key = (table_name, max_depth)
+        if cache_key in cache:
+            return cache[cache_key]
+        
         downstream = {
             'table': table_name,
             'descendants': []
@@ -283,17 +619,19 @@ class LineageTracker:
         
         try:
             # Get all descendants up to max_depth
-            for successor in self.lineage_graph.successors(table_name):
+            for descendant, depth in self._bfs(table_name, max_depth):
                 downstream['descendants'].append({
-                    'table': successor,
-                    'relationship': 'DIRECT_DOWNSTREAM'
+                    'table': descendant,
+                    'depth': depth,
+                    'relationship': 'DIRECT_DOWNSTREAM' if depth == 1 else 'INDIRECT_DOWNSTREAM'
                 })
             
-            logger.info(f"Retrieved downstream lineage for {table_name}")
+            cache[cache_key] = downstream
+            logger.info("Retrieved downstream lineage for %s", table_name)
             return downstream
             
         except Exception as e:
-            logger.error(f"Failed to get downstream lineage: {str(e)}")
+            logger.error("Failed to get downstream lineage: %s", e)
             return downstream
     
     def get_full_lineage(self, table_name: str) -> Dict[str, Any]:
@@ -313,13 +651,60 @@ class LineageTracker:
             'extracted_at': datetime.utcnow().isoformat()
         }
     
-    def save_lineage_to_snowflake(self, lineage_records: List[Dict[str, Any]], output_table: str) -> None:
+    @staticmethod
+    def deduplicate_lineage(*record_lists: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge lineage record lists, dropping repeated edges.
+        
+        Records are keyed by (source_table, target_table, query_id), so the same
+        view dependency seen from several tracked databases, or the same query
+        edge seen twice, is only saved once. The first occurrence wins and input
+        order is preserved.
+        
+        Args:
+            record_lists: Lineage record lists (dependencies, query lineage, ...)
+            
+        Returns:
+            Deduplicated list of lineage records
+        """
+        return list(LineageTracker.iter_unique_lineage(*record_lists))
+    
+    @staticmethod
+    def iter_unique_lineage(*record_lists: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily chain lineage record lists, skipping repeated edges.
+        
+        Same keys and first-occurrence semantics as deduplicate_lineage, but
+        only the seen keys are held, so the combined records are never
+        materialized as a second list.
+        
+        Args:
+            record_lists: Lineage record iterables (dependencies, query lineage, ...)
+            
+        Yields:
+            Unique lineage records in input order
+        """
+        seen = set()
+        for record in itertools.chain.from_iterable(record_lists):
+            key = (record.get('source_table'), record.get('target_table'), record.get('query_id'))
+            if key not in seen:
+                seen.add(key)
+                yield record
+    
+    def save_lineage_to_snowflake(self, lineage_records: Iterable[Dict[str, Any]], output_table: str) -> int:
         """
         Save lineage records to Snowflake table.
         
+        Records are converted to rows lazily and streamed to the bulk loader in
+        batches, so any iterable (e.g. iter_unique_lineage) is saved without
+        building a full list of rows.
+        
         Args:
-            lineage_records: List of lineage records
+            lineage_records: Iterable of lineage records
             output_table: Name of the output table
+            
+        Returns:
+            Number of records saved
         """
         # Create lineage table if not exists
         create_table_ddl = f"""
@@ -339,56 +724,183 @@ class LineageTracker:
         
         self.connection.create_table_if_not_exists(output_table, create_table_ddl)
         
-        # Prepare data for insertion
-        insert_data = []
-        
-        for record in lineage_records:
-            insert_data.append((
-                record.get('query_id', ''),
-                record.get('source_table', ''),
-                record.get('target_table', ''),
-                record.get('query_type', 'UNKNOWN'),
-                record.get('query_id', ''),
-                record.get('user_name', ''),
-                datetime.fromisoformat(record.get('execution_time', datetime.utcnow().isoformat())),
-                json.dumps(record),
-                datetime.utcnow()
-            ))
-        
-        # Insert data
-        insert_query = f"""
-        INSERT INTO {output_table}
-        (lineage_id, source_table, target_table, lineage_type, query_id, user_name, execution_time, lineage_json, extracted_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, PARSE_JSON(%s), %s)
-        """
-        
-        self.connection.execute_many(insert_query, insert_data)
-        logger.info(f"Saved {len(insert_data)} lineage records to {output_table}")
+        saved_at = datetime.utcnow()
+        
+        def rows() -> Iterator[tuple]:
+            for record in lineage_records:
+                execution_time = record.get('execution_time')
+                yield (
+                    record.get('query_id', ''),
+                    record.get('source_table', ''),
+                    record.get('target_table', ''),
+                    record.get('query_type', record.get('dependency_type', 'UNKNOWN')),
+                    record.get('query_id', ''),
+                    record.get('user_name', ''),
+                    datetime.fromisoformat(execution_time) if execution_time else saved_at,
+                    dumps_json(record),
+                    saved_at
+                )
+        
+        # Upsert so re-running the pipeline replaces rows instead of duplicating them
+        saved = self.connection.merge_load(
+            output_table,
+            ['lineage_id', 'source_table', 'target_table', 'lineage_type', 'query_id',
+             'user_name', 'execution_time', 'lineage_json', 'extracted_at'],
+            rows(),
+            key_columns=['source_table', 'target_table', 'query_id'],
+            json_columns=['lineage_json']
+        )
+        logger.info("Saved %s lineage records to %s", saved, output_table)
+        return saved
     
-    def export_lineage_graph(self, output_file: str = "lineage_graph.json") -> None:
+    def rebuild_closure(self, lineage_table: str, closure_table: str, max_depth: int = 10) -> None:
         """
-        Export lineage graph to JSON file.
+        Materialize the transitive closure of the saved lineage graph.
+        
+        Each (ancestor, descendant) pair reachable within ``max_depth`` hops is
+        stored once with its shortest distance, so full upstream/downstream
+        lookups become a single filtered read instead of a graph walk.
         
         Args:
-            output_file: Path to output file
+            lineage_table: Name of the table populated by save_lineage_to_snowflake
+            closure_table: Name of the closure table to (re)create
+            max_depth: Maximum path length to follow
         """
+        closure_ddl = f"""
+        CREATE OR REPLACE TABLE {closure_table} AS
+        WITH RECURSIVE closure (ancestor, descendant, depth) AS (
+            SELECT DISTINCT source_table, target_table, 1
+            FROM {lineage_table}
+            WHERE source_table <> '' AND target_table <> ''
+            UNION ALL
+            SELECT c.ancestor, e.target_table, c.depth + 1
+            FROM closure c
+            JOIN (SELECT DISTINCT source_table, target_table FROM {lineage_table}) e
+              ON c.descendant = e.source_table
+            WHERE c.depth < {max_depth}
+        )
+        SELECT ancestor, descendant, MIN(depth) AS depth
+        FROM closure
+        GROUP BY ancestor, descendant
+        """
+        
         try:
-            graph_data = {
-                'nodes': list(self.lineage_graph.nodes()),
-                'edges': [
-                    {
-                        'source': edge[0],
-                        'target': edge[1],
-                        'attributes': self.lineage_graph.edges[edge]
-                    }
-                    for edge in self.lineage_graph.edges()
-                ]
-            }
+            self.connection.execute_query(closure_ddl)
+            logger.info("Rebuilt lineage closure %s from %s", closure_table, lineage_table)
+        except Exception as e:
+            logger.error("Failed to rebuild lineage closure: %s", e)
+            raise
+    
+    def get_upstream_from_closure(self, table_name: str, closure_table: str) -> Dict[str, Any]:
+        """
+        Get all upstream tables for a table from the materialized closure.
+        
+        Args:
+            table_name: Fully qualified table name
+            closure_table: Name of the closure table built by rebuild_closure
             
-            with open(output_file, 'w') as f:
-                json.dump(graph_data, f, indent=2)
+        Returns:
+            Upstream lineage tree
+        """
+        query = f"""
+        SELECT ancestor, depth
+        FROM {closure_table}
+        WHERE descendant = %s
+        ORDER BY depth
+        """
+        
+        results = self.connection.execute_query(query, (table_name,))
+        return {
+            'table': table_name,
+            'ancestors': [
+                {
+                    'table': row['ANCESTOR'],
+                    'depth': row['DEPTH'],
+                    'relationship': 'DIRECT_UPSTREAM' if row['DEPTH'] == 1 else 'INDIRECT_UPSTREAM'
+                }
+                for row in results
+            ]
+        }
+    
+    def get_downstream_from_closure(self, table_name: str, closure_table: str) -> Dict[str, Any]:
+        """
+        Get all downstream tables for a table from the materialized closure.
+        
+        Args:
+            table_name: Fully qualified table name
+            closure_table: Name of the closure table built by rebuild_closure
+            
+        Returns:
+            Downstream lineage tree
+        """
+        query = f"""
+        SELECT descendant, depth
+        FROM {closure_table}
+        WHERE ancestor = %s
+        ORDER BY depth
+        """
+        
+        results = self.connection.execute_query(query, (table_name,))
+        return {
+            'table': table_name,
+            'descendants': [
+                {
+                    'table': row['DESCENDANT'],
+                    'depth': row['DEPTH'],
+                    'relationship': 'DIRECT_DOWNSTREAM' if row['DEPTH'] == 1 else 'INDIRECT_DOWNSTREAM'
+                }
+                for row in results
+            ]
+        }
+    
+    def export_lineage_graph(self, output_file: str = "lineage_graph.parquet",
+                             format: str = 'parquet', pretty: bool = False) -> None:
+        """
+        Export lineage graph to a Parquet, msgpack or JSON file.
+        
+        Parquet output holds one row per edge (source, target, type, query_id)
+        and is written by Arrow's native encoder with SNAPPY compression.
+        msgpack and JSON output hold the same {'nodes', 'edges'} document.
+        
+        Args:
+            output_file: Path to output file
+            format: 'parquet', 'msgpack' or 'json'
+            pretty: Indent JSON output (compact by default)
+        """
+        if format not in ('parquet', 'msgpack', 'json'):
+            raise ValueError(f"Unsupported lineage export format: {format}")
+        
+        try:
+            if format == 'parquet':
+                edges = list(self.lineage_graph.edges(data=True))
+                edge_table = pa.table({
+                    'source': pa.array([edge[0] for edge in edges], type=pa.string()),
+                    'target': pa.array([edge[1] for edge in edges], type=pa.string()),
+                    'type': pa.array([edge[2].get('type') for edge in edges], type=pa.string()),
+                    'query_id': pa.array([edge[2].get('query_id') for edge in edges], type=pa.string())
+                })
+                with atomic_open(output_file) as f:
+                    pq.write_table(edge_table, f, compression='snappy')
+            else:
+                graph_data = {
+                    'nodes': list(self.lineage_graph.nodes()),
+                    'edges': (
+                        {
+                            'source': source,
+                            'target': target,
+                            'attributes': attributes
+                        }
+                        for source, target, attributes in self.lineage_graph.edges(data=True)
+                    )
+                }
+                
+                # Edges are encoded and written one at a time
+                if format == 'msgpack':
+                    write_msgpack(graph_data, output_file)
+                else:
+                    write_json(graph_data, output_file, indent=pretty)
             
-            logger.info(f"Exported lineage graph to {output_file}")
+            logger.info("Exported lineage graph to %s", output_file)
             
         except Exception as e:
-            logger.error(f"Failed to export lineage graph: {str(e)}")
+            logger.error("Failed to export lineage graph: %s", e)
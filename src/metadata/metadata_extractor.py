@@ -3,12 +3,15 @@ Metadata Extraction Module
 Extracts and catalogs metadata from Snowflake databases, tables, and columns.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Sequence, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from loguru import logger
-import json
+import logging
 
 from ..connection import SnowflakeConnection
+from ..utils import dumps_json, qualified_name, quote_stored_identifier, stored_identifier
+
+logger = logging.getLogger(__name__)
 
 
 class MetadataExtractor:
@@ -34,12 +37,12 @@ class MetadataExtractor:
         Returns:
             Dictionary containing database metadata
         """
-        query = f"""
-        SHOW DATABASES LIKE '{database_name}'
+        query = """
+        SHOW DATABASES LIKE %s
         """
         
         try:
-            results = self.connection.execute_query(query)
+            results = self.connection.execute_query(query, (database_name,))
             if results:
                 db_info = results[0]
                 metadata = {
@@ -50,116 +53,296 @@ class MetadataExtractor:
                     'retention_time': db_info.get('retention_time'),
                     'extracted_at': datetime.utcnow().isoformat()
                 }
-                logger.info(f"Extracted metadata for database: {database_name}")
+                logger.info("Extracted metadata for database: %s", database_name)
                 return metadata
         except Exception as e:
-            logger.error(f"Failed to extract database metadata: {str(e)}")
+            logger.error("Failed to extract database metadata: %s", e)
             raise
     
-    def extract_schema_metadata(self, database_name: str, schema_name: str = None) -> List[Dict[str, Any]]:
+    def extract_schema_metadata(self, database_name: str, schema_name: str = None,
+                                schema_pattern: str = None) -> List[Dict[str, Any]]:
         """
         Extract metadata for schemas in a database.
         
+        Filters are evaluated by Snowflake against INFORMATION_SCHEMA.SCHEMATA,
+        so only matching schemas are returned over the wire.
+        
         Args:
             database_name: Name of the database
             schema_name: Optional specific schema name
+            schema_pattern: Optional regex the full schema name must match (RLIKE)
             
         Returns:
             List of dictionaries containing schema metadata
         """
+        conditions = ["schema_name <> 'INFORMATION_SCHEMA'"]
+        params = []
+        
         if schema_name:
-            query = f"SHOW SCHEMAS LIKE '{schema_name}' IN DATABASE {database_name}"
-        else:
-            query = f"SHOW SCHEMAS IN DATABASE {database_name}"
+            conditions.append("schema_name = %s")
+            params.append(stored_identifier(schema_name))
+        if schema_pattern:
+            conditions.append("schema_name RLIKE %s")
+            params.append(schema_pattern)
+        
+        query = f"""
+        SELECT schema_name, created, schema_owner, comment
+        FROM {qualified_name(database_name)}.INFORMATION_SCHEMA.SCHEMATA
+        WHERE {' AND '.join(conditions)}
+        """
         
         try:
-            results = self.connection.execute_query(query)
+            results = self.connection.execute_query(query, tuple(params))
             schemas = []
+            extracted_at = datetime.utcnow().isoformat()
             
             for schema in results:
-                schema_metadata = {
-                    'database_name': database_name,
-                    'schema_name': schema.get('name'),
-                    'created_on': str(schema.get('created_on')),
-                    'owner': schema.get('owner'),
-                    'comment': schema.get('comment'),
-                    'extracted_at': datetime.utcnow().isoformat()
-                }
-                schemas.append(schema_metadata)
+                schemas.append(self._schema_record(database_name, schema, extracted_at))
             
-            logger.info(f"Extracted metadata for {len(schemas)} schemas in {database_name}")
+            logger.info("Extracted metadata for %s schemas in %s", len(schemas), database_name)
             return schemas
             
         except Exception as e:
-            logger.error(f"Failed to extract schema metadata: {str(e)}")
+            logger.error("Failed to extract schema metadata: %s", e)
             raise
     
-    def extract_table_metadata(self, database_name: str, schema_name: str = None) -> List[Dict[str, Any]]:
+    def extract_table_metadata(self, database_name: str, schema_name: str = None,
+                               schema_pattern: str = None, table_pattern: str = None,
+                               exclude_external_tables: bool = True) -> List[Dict[str, Any]]:
         """
         Extract metadata for tables in a database/schema.
         
+        Filters are evaluated by Snowflake against INFORMATION_SCHEMA.TABLES,
+        so only matching tables are returned over the wire.
+        
         Args:
             database_name: Name of the database
             schema_name: Optional specific schema name
+            schema_pattern: Optional regex the full schema name must match (RLIKE)
+            table_pattern: Optional regex the full table name must match (RLIKE)
+            exclude_external_tables: Skip external tables
             
         Returns:
             List of dictionaries containing table metadata
         """
-        if schema_name:
-            query = f"SHOW TABLES IN {database_name}.{schema_name}"
-        else:
-            query = f"SHOW TABLES IN DATABASE {database_name}"
+        conditions, params = self._table_filters(
+            schema_name, schema_pattern, table_pattern, exclude_external_tables
+        )
+        
+        query = f"""
+        SELECT 
+            table_catalog,
+            table_schema,
+            table_name,
+            table_type,
+            row_count,
+            bytes,
+            created,
+            table_owner,
+            comment,
+            clustering_key
+        FROM {qualified_name(database_name)}.INFORMATION_SCHEMA.TABLES
+        WHERE {' AND '.join(conditions)}
+        """
         
         try:
-            results = self.connection.execute_query(query)
+            results = self.connection.execute_query(query, params)
             tables = []
+            extracted_at = datetime.utcnow().isoformat()
             
             for table in results:
-                table_metadata = {
-                    'database_name': table.get('database_name'),
-                    'schema_name': table.get('schema_name'),
-                    'table_name': table.get('name'),
-                    'table_type': table.get('kind'),
-                    'row_count': table.get('rows'),
-                    'bytes': table.get('bytes'),
-                    'created_on': str(table.get('created_on')),
-                    'owner': table.get('owner'),
-                    'comment': table.get('comment'),
-                    'cluster_by': table.get('cluster_by'),
-                    'extracted_at': datetime.utcnow().isoformat()
-                }
-                tables.append(table_metadata)
+                tables.append(self._table_record(table, extracted_at))
             
-            logger.info(f"Extracted metadata for {len(tables)} tables")
+            logger.info("Extracted metadata for %s tables", len(tables))
             return tables
             
         except Exception as e:
-            logger.error(f"Failed to extract table metadata: {str(e)}")
+            logger.error("Failed to extract table metadata: %s", e)
+            raise
+    
+    @staticmethod
+    def _table_filters(schema_name: str = None, schema_pattern: str = None,
+                       table_pattern: str = None, exclude_external_tables: bool = True,
+                       alias: str = '') -> Tuple[List[str], List[Any]]:
+        """Build WHERE conditions and bind parameters for TABLES view queries."""
+        prefix = f"{alias}." if alias else ''
+        
+        if exclude_external_tables:
+            conditions = [f"{prefix}table_type = 'BASE TABLE'"]
+        else:
+            conditions = [f"{prefix}table_type IN ('BASE TABLE', 'EXTERNAL TABLE')"]
+        conditions.append(f"{prefix}table_schema <> 'INFORMATION_SCHEMA'")
+        params = []
+        
+        if schema_name:
+            conditions.append(f"{prefix}table_schema = %s")
+            params.append(stored_identifier(schema_name))
+        if schema_pattern:
+            conditions.append(f"{prefix}table_schema RLIKE %s")
+            params.append(schema_pattern)
+        if table_pattern:
+            conditions.append(f"{prefix}table_name RLIKE %s")
+            params.append(table_pattern)
+        
+        return conditions, params
+    
+    @staticmethod
+    def _schema_record(database_name: str, schema: Dict[str, Any], extracted_at: str = None) -> Dict[str, Any]:
+        """Build a schema metadata record from a SCHEMATA row."""
+        return {
+            'database_name': database_name,
+            'schema_name': schema.get('SCHEMA_NAME'),
+            'created_on': str(schema.get('CREATED')),
+            'owner': schema.get('SCHEMA_OWNER'),
+            'comment': schema.get('COMMENT'),
+            'extracted_at': extracted_at or datetime.utcnow().isoformat()
+        }
+    
+    @staticmethod
+    def _table_record(table: Dict[str, Any], extracted_at: str = None) -> Dict[str, Any]:
+        """Build a table metadata record from a TABLES row."""
+        return {
+            'database_name': table.get('TABLE_CATALOG'),
+            'schema_name': table.get('TABLE_SCHEMA'),
+            'table_name': table.get('TABLE_NAME'),
+            'table_type': table.get('TABLE_TYPE'),
+            'row_count': table.get('ROW_COUNT'),
+            'bytes': table.get('BYTES'),
+            'created_on': str(table.get('CREATED')),
+            'owner': table.get('TABLE_OWNER'),
+            'comment': table.get('COMMENT'),
+            'cluster_by': table.get('CLUSTERING_KEY'),
+            'extracted_at': extracted_at or datetime.utcnow().isoformat()
+        }
+    
+    @staticmethod
+    def _column_record(col: Dict[str, Any], extracted_at: str = None) -> Dict[str, Any]:
+        """Build a column metadata record from a COLUMNS view row."""
+        # COLUMNS views do not expose key constraints
+        return {
+            'database_name': col.get('TABLE_CATALOG'),
+            'schema_name': col.get('TABLE_SCHEMA'),
+            'table_name': col.get('TABLE_NAME'),
+            'column_name': col.get('COLUMN_NAME'),
+            'data_type': col.get('DATA_TYPE'),
+            'nullable': col.get('IS_NULLABLE') == 'YES',
+            'default_value': col.get('COLUMN_DEFAULT'),
+            'primary_key': None,
+            'unique_key': None,
+            'comment': col.get('COMMENT'),
+            'extracted_at': extracted_at or datetime.utcnow().isoformat()
+        }
+    
+    def _fetch_all_columns(self, database_name: str, schema_pattern: str = None,
+                           table_pattern: str = None,
+                           exclude_external_tables: bool = True) -> List[Dict[str, Any]]:
+        """
+        Extract column metadata for every matching table in a database with one query.
+        
+        Replaces a DESCRIBE TABLE round-trip per table with a single read of
+        INFORMATION_SCHEMA.COLUMNS, joined to TABLES so the same schema, table
+        and table-type filters apply.
+        
+        Args:
+            database_name: Name of the database
+            schema_pattern: Optional regex the full schema name must match (RLIKE)
+            table_pattern: Optional regex the full table name must match (RLIKE)
+            exclude_external_tables: Skip external tables
+            
+        Returns:
+            List of dictionaries containing column metadata
+        """
+        conditions, params = self._table_filters(
+            schema_pattern=schema_pattern,
+            table_pattern=table_pattern,
+            exclude_external_tables=exclude_external_tables,
+            alias='t'
+        )
+        
+        query = f"""
+        SELECT 
+            c.table_catalog,
+            c.table_schema,
+            c.table_name,
+            c.column_name,
+            c.data_type,
+            c.is_nullable,
+            c.column_default,
+            c.comment
+        FROM {qualified_name(database_name)}.INFORMATION_SCHEMA.COLUMNS c
+        JOIN {qualified_name(database_name)}.INFORMATION_SCHEMA.TABLES t
+          ON c.table_schema = t.table_schema
+         AND c.table_name = t.table_name
+        WHERE {' AND '.join(conditions)}
+        ORDER BY c.table_schema, c.table_name, c.ordinal_position
+        """
+        
+        try:
+            extracted_at = datetime.utcnow().isoformat()
+            columns = [self._column_record(col, extracted_at) for col in self._iter_rows(query, params)]
+            logger.info("Extracted metadata for %s columns in %s", len(columns), database_name)
+            return columns
+            
+        except Exception as e:
+            logger.error("Failed to extract column metadata: %s", e)
             raise
     
+    def _describe_tables(self, database_name: str, tables: List[Dict[str, Any]],
+                         max_workers: int = 16) -> List[Dict[str, Any]]:
+        """
+        Extract column metadata with one DESCRIBE per table, run concurrently.
+        
+        Each DESCRIBE is a latency-bound round trip on its own cursor, so a
+        thread pool overlaps them despite the GIL. Results keep table order.
+        
+        Args:
+            database_name: Name of the database
+            tables: Table metadata records to describe
+            max_workers: Maximum number of concurrent DESCRIBE calls
+            
+        Returns:
+            List of dictionaries containing column metadata
+        """
+        if not tables:
+            return []
+        
+        def describe(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+            # Catalog names are exact, so they are quoted rather than resolved
+            return self.extract_column_metadata(
+                database_name,
+                quote_stored_identifier(table['schema_name']),
+                quote_stored_identifier(table['table_name'])
+            )
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tables))) as executor:
+            return [column for columns in executor.map(describe, tables) for column in columns]
+    
     def extract_column_metadata(self, database_name: str, schema_name: str, table_name: str) -> List[Dict[str, Any]]:
         """
         Extract metadata for columns in a table.
         
         Args:
             database_name: Name of the database
-            schema_name: Name of the schema
-            table_name: Name of the table
+            schema_name: Name of the schema (quoted names are exact)
+            table_name: Name of the table (quoted names are exact)
             
         Returns:
-            List of dictionaries containing column metadata
+            List of dictionaries containing column metadata, with stored names
         """
-        query = f"DESCRIBE TABLE {database_name}.{schema_name}.{table_name}"
+        query = f"DESCRIBE TABLE {qualified_name(database_name, schema_name, table_name)}"
+        # Records carry stored names, like those read from INFORMATION_SCHEMA
+        stored_schema, stored_table = stored_identifier(schema_name), stored_identifier(table_name)
         
         try:
             results = self.connection.execute_query(query)
             columns = []
+            extracted_at = datetime.utcnow().isoformat()
             
             for col in results:
                 column_metadata = {
                     'database_name': database_name,
-                    'schema_name': schema_name,
-                    'table_name': table_name,
+                    'schema_name': stored_schema,
+                    'table_name': stored_table,
                     'column_name': col.get('name'),
                     'data_type': col.get('type'),
                     'nullable': col.get('null?') == 'Y',
@@ -167,60 +350,316 @@ class MetadataExtractor:
                     'primary_key': col.get('primary key') == 'Y',
                     'unique_key': col.get('unique key') == 'Y',
                     'comment': col.get('comment'),
-                    'extracted_at': datetime.utcnow().isoformat()
+                    'extracted_at': extracted_at
                 }
                 columns.append(column_metadata)
             
-            logger.info(f"Extracted metadata for {len(columns)} columns in {table_name}")
+            logger.info("Extracted metadata for %s columns in %s", len(columns), table_name)
             return columns
             
         except Exception as e:
-            logger.error(f"Failed to extract column metadata: {str(e)}")
+            logger.error("Failed to extract column metadata: %s", e)
             raise
     
-    def extract_table_statistics(self, database_name: str, schema_name: str, table_name: str) -> Dict[str, Any]:
+    def extract_table_statistics(self, database_name: str, schema_name: str, table_name: str,
+                                 deep_stats: bool = False,
+                                 sample_percent: float = None) -> Dict[str, Any]:
         """
         Extract statistics for a table.
         
+        Row count and size come from INFORMATION_SCHEMA.TABLES, which Snowflake
+        maintains as metadata and serves without warehouse compute. With
+        ``deep_stats`` the table is also scanned for a HyperLogLog estimate of
+        its distinct rows.
+        
         Args:
             database_name: Name of the database
             schema_name: Name of the schema
             table_name: Name of the table
+            deep_stats: Also estimate distinct rows by scanning the table
+            sample_percent: Estimate distinct rows from a row sample of this
+                percentage (e.g. 1) instead of the full table
             
         Returns:
             Dictionary containing table statistics
         """
         query = f"""
-        SELECT 
-            COUNT(*) as row_count,
-            COUNT(DISTINCT *) as distinct_rows
-        FROM {database_name}.{schema_name}.{table_name}
+        SELECT row_count, bytes
+        FROM {qualified_name(database_name)}.INFORMATION_SCHEMA.TABLES
+        WHERE table_schema = %s AND table_name = %s
+        """
+        
+        try:
+            results = self.connection.execute_query(
+                query, (stored_identifier(schema_name), stored_identifier(table_name))
+            )
+            if not results:
+                logger.warning("No statistics found for %s.%s.%s", database_name, schema_name, table_name)
+                return {}
+            
+            stats = results[0]
+            statistics = {
+                'database_name': database_name,
+                'schema_name': schema_name,
+                'table_name': table_name,
+                'row_count': stats.get('ROW_COUNT'),
+                'bytes': stats.get('BYTES'),
+                'extracted_at': datetime.utcnow().isoformat()
+            }
+            
+            if deep_stats:
+                sample_clause = f" SAMPLE ({float(sample_percent)})" if sample_percent else ""
+                distinct_query = f"""
+                SELECT HLL(HASH(*)) as distinct_rows
+                FROM {qualified_name(database_name, schema_name, table_name)}{sample_clause}
+                """
+                distinct = self.connection.execute_query(distinct_query)
+                statistics['distinct_rows'] = distinct[0].get('DISTINCT_ROWS') if distinct else None
+                statistics['distinct_rows_approx'] = True
+                statistics['sample_percent'] = sample_percent
+            
+            logger.info("Extracted statistics for %s", table_name)
+            return statistics
+        except Exception as e:
+            logger.warning("Failed to extract table statistics: %s", e)
+            return {}
+    
+    def extract_column_statistics(self, database_name: str, schema_name: str, table_name: str,
+                                  columns: List[Dict[str, Any]] = None,
+                                  approximate: bool = True) -> List[Dict[str, Any]]:
+        """
+        Profile every column of a table in a single scan.
+        
+        All per-column aggregates are projected from one CTE over the table, so
+        the table is read once per call regardless of column count instead of
+        once per column.
+        
+        Args:
+            database_name: Name of the database
+            schema_name: Name of the schema
+            table_name: Name of the table
+            columns: Column metadata from extract_column_metadata (fetched if omitted)
+            approximate: Use APPROX_COUNT_DISTINCT instead of exact COUNT(DISTINCT)
+            
+        Returns:
+            List of dictionaries containing per-column statistics
+        """
+        if columns is None:
+            columns = self.extract_column_metadata(database_name, schema_name, table_name)
+        if not columns:
+            return []
+        
+        distinct_fn = "APPROX_COUNT_DISTINCT({})" if approximate else "COUNT(DISTINCT {})"
+        projections = ["COUNT(*) AS ROW_COUNT"]
+        for i, col in enumerate(columns):
+            quoted = '"{}"'.format(col['column_name'].replace('"', '""'))
+            projections.append(f"COUNT({quoted}) AS C{i}_NN")
+            projections.append(f"{distinct_fn.format(quoted)} AS C{i}_ND")
+        
+        query = f"""
+        WITH src AS (SELECT * FROM {qualified_name(database_name, schema_name, table_name)})
+        SELECT {', '.join(projections)}
+        FROM src
         """
         
         try:
             results = self.connection.execute_query(query)
-            if results:
-                stats = results[0]
-                statistics = {
+            if not results:
+                return []
+            
+            row = results[0]
+            row_count = row.get('ROW_COUNT')
+            extracted_at = datetime.utcnow().isoformat()
+            statistics = []
+            for i, col in enumerate(columns):
+                non_null = row.get(f'C{i}_NN')
+                statistics.append({
                     'database_name': database_name,
                     'schema_name': schema_name,
                     'table_name': table_name,
-                    'row_count': stats.get('ROW_COUNT'),
-                    'distinct_rows': stats.get('DISTINCT_ROWS'),
-                    'extracted_at': datetime.utcnow().isoformat()
-                }
-                logger.info(f"Extracted statistics for {table_name}")
-                return statistics
+                    'column_name': col['column_name'],
+                    'row_count': row_count,
+                    'non_null_count': non_null,
+                    'null_count': row_count - non_null if row_count is not None and non_null is not None else None,
+                    'distinct_count': row.get(f'C{i}_ND'),
+                    'distinct_count_approx': approximate,
+                    'extracted_at': extracted_at
+                })
+            
+            logger.info("Extracted statistics for %s columns in %s", len(statistics), table_name)
+            return statistics
         except Exception as e:
-            logger.warning(f"Failed to extract table statistics: {str(e)}")
-            return {}
+            logger.warning("Failed to extract column statistics: %s", e)
+            return []
+    
+    def extract_account_usage_metadata(self, databases: List[str], schema_pattern: str = None,
+                                       table_pattern: str = None,
+                                       exclude_external_tables: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Extract database, schema, table and column metadata for many databases at once.
+        
+        Issues one query per object type against SNOWFLAKE.ACCOUNT_USAGE
+        filtered by the database list, instead of one round-trip per database
+        and per table. ACCOUNT_USAGE views lag live DDL by up to a few hours.
+        
+        Args:
+            databases: List of database names to extract metadata from
+            schema_pattern: Optional regex schema names must match
+            table_pattern: Optional regex table names must match
+            exclude_external_tables: Skip external tables
+            
+        Returns:
+            Dictionary with 'databases', 'schemas', 'tables' and 'columns' lists
+        """
+        db_placeholders = ', '.join(['%s'] * len(databases))
+        
+        database_query = f"""
+        SELECT database_name, created, database_owner, comment, retention_time
+        FROM SNOWFLAKE.ACCOUNT_USAGE.DATABASES
+        WHERE deleted IS NULL
+          AND database_name IN ({db_placeholders})
+        """
+        
+        schema_conditions = ["deleted IS NULL", f"catalog_name IN ({db_placeholders})",
+                             "schema_name <> 'INFORMATION_SCHEMA'"]
+        schema_params = list(databases)
+        if schema_pattern:
+            schema_conditions.append("schema_name RLIKE %s")
+            schema_params.append(schema_pattern)
+        
+        schema_query = f"""
+        SELECT catalog_name, schema_name, created, schema_owner, comment
+        FROM SNOWFLAKE.ACCOUNT_USAGE.SCHEMATA
+        WHERE {' AND '.join(schema_conditions)}
+        """
+        
+        table_conditions, table_params = self._table_filters(
+            schema_pattern=schema_pattern,
+            table_pattern=table_pattern,
+            exclude_external_tables=exclude_external_tables,
+            alias='t'
+        )
+        table_conditions = ["t.deleted IS NULL", f"t.table_catalog IN ({db_placeholders})"] + table_conditions
+        table_params = list(databases) + table_params
+        
+        table_query = f"""
+        SELECT 
+            t.table_catalog,
+            t.table_schema,
+            t.table_name,
+            t.table_type,
+            t.row_count,
+            t.bytes,
+            t.created,
+            t.table_owner,
+            t.comment,
+            t.clustering_key
+        FROM SNOWFLAKE.ACCOUNT_USAGE.TABLES t
+        WHERE {' AND '.join(table_conditions)}
+        """
+        
+        column_query = f"""
+        SELECT 
+            c.table_catalog,
+            c.table_schema,
+            c.table_name,
+            c.column_name,
+            c.data_type,
+            c.is_nullable,
+            c.column_default,
+            c.comment
+        FROM SNOWFLAKE.ACCOUNT_USAGE.COLUMNS c
+        JOIN SNOWFLAKE.ACCOUNT_USAGE.TABLES t
+          ON c.table_id = t.table_id
+        WHERE c.deleted IS NULL
+          AND {' AND '.join(table_conditions)}
+        ORDER BY c.table_catalog, c.table_schema, c.table_name, c.ordinal_position
+        """
+        
+        try:
+            extracted_at = datetime.utcnow().isoformat()
+            metadata = {
+                'databases': [
+                    {
+                        'database_name': db.get('DATABASE_NAME'),
+                        'created_on': str(db.get('CREATED')),
+                        'owner': db.get('DATABASE_OWNER'),
+                        'comment': db.get('COMMENT'),
+                        'retention_time': db.get('RETENTION_TIME'),
+                        'extracted_at': extracted_at
+                    }
+                    for db in self._iter_rows(database_query, databases)
+                ],
+                'schemas': [
+                    self._schema_record(schema.get('CATALOG_NAME'), schema, extracted_at)
+                    for schema in self._iter_rows(schema_query, schema_params)
+                ],
+                'tables': [
+                    self._table_record(table, extracted_at)
+                    for table in self._iter_rows(table_query, table_params)
+                ],
+                'columns': [
+                    self._column_record(col, extracted_at)
+                    for col in self._iter_rows(column_query, table_params)
+                ]
+            }
+            
+            logger.info(
+                "Extracted ACCOUNT_USAGE metadata for %s databases: %s schemas, %s tables, %s columns",
+                len(metadata['databases']), len(metadata['schemas']),
+                len(metadata['tables']), len(metadata['columns'])
+            )
+            return metadata
+            
+        except Exception as e:
+            logger.error("Failed to extract ACCOUNT_USAGE metadata: %s", e)
+            raise
     
-    def extract_full_metadata(self, databases: List[str]) -> Dict[str, Any]:
+    def _iter_rows(self, query: str, params: Sequence[Any]) -> Iterator[Dict[str, Any]]:
+        """Stream query result rows from Arrow batches."""
+        for batch in self.connection.execute_query_arrow(query, params):
+            yield from batch.to_pylist()
+    
+    def list_databases(self, database_pattern: str) -> List[str]:
+        """
+        List databases whose name matches a pattern.
+        
+        Args:
+            database_pattern: Regex the full database name must match (RLIKE)
+            
+        Returns:
+            List of matching database names
+        """
+        query = """
+        SELECT database_name
+        FROM SNOWFLAKE.INFORMATION_SCHEMA.DATABASES
+        WHERE database_name RLIKE %s
+        """
+        
+        results = self.connection.execute_query(query, (database_pattern,))
+        return [row['DATABASE_NAME'] for row in results]
+    
+    def extract_full_metadata(self, databases: List[str] = None, database_pattern: str = None,
+                              schema_pattern: str = None, table_pattern: str = None,
+                              exclude_external_tables: bool = True,
+                              source: str = 'account_usage') -> Dict[str, Any]:
         """
         Extract complete metadata catalog for specified databases.
         
+        Name patterns are regular expressions evaluated server-side with
+        RLIKE (which matches the whole name), so filtered-out objects are
+        never transferred.
+        
         Args:
             databases: List of database names to extract metadata from
+            database_pattern: Regex used to discover databases when no list is given
+            schema_pattern: Optional regex schema names must match
+            table_pattern: Optional regex table names must match
+            exclude_external_tables: Skip external tables
+            source: 'account_usage' to fetch every object type for all databases in
+                one bulk query each, or 'information_schema' to query each
+                database live. 'account_usage' falls back to
+                'information_schema' when the views cannot be read.
             
         Returns:
             Complete metadata catalog
@@ -233,6 +672,25 @@ class MetadataExtractor:
             'extraction_timestamp': datetime.utcnow().isoformat()
         }
         
+        if not databases and database_pattern:
+            databases = self.list_databases(database_pattern)
+        
+        if not databases:
+            return catalog
+        
+        if source == 'account_usage':
+            try:
+                catalog.update(self.extract_account_usage_metadata(
+                    databases,
+                    schema_pattern=schema_pattern,
+                    table_pattern=table_pattern,
+                    exclude_external_tables=exclude_external_tables
+                ))
+                return catalog
+            except Exception as e:
+                # Reading ACCOUNT_USAGE needs IMPORTED PRIVILEGES on the SNOWFLAKE database
+                logger.warning("ACCOUNT_USAGE unavailable, querying INFORMATION_SCHEMA instead: %s", e)
+        
         for db in databases:
             try:
                 # Extract database metadata
@@ -240,25 +698,36 @@ class MetadataExtractor:
                 catalog['databases'].append(db_metadata)
                 
                 # Extract schema metadata
-                schemas = self.extract_schema_metadata(db)
+                schemas = self.extract_schema_metadata(db, schema_pattern=schema_pattern)
                 catalog['schemas'].extend(schemas)
                 
                 # Extract table and column metadata
-                tables = self.extract_table_metadata(db)
+                tables = self.extract_table_metadata(
+                    db,
+                    schema_pattern=schema_pattern,
+                    table_pattern=table_pattern,
+                    exclude_external_tables=exclude_external_tables
+                )
                 catalog['tables'].extend(tables)
                 
-                for table in tables:
-                    schema = table['schema_name']
-                    table_name = table['table_name']
-                    
-                    # Extract column metadata
-                    columns = self.extract_column_metadata(db, schema, table_name)
-                    catalog['columns'].extend(columns)
+                # Extract column metadata for all tables in one query, falling
+                # back to concurrent per-table DESCRIBE calls
+                try:
+                    columns = self._fetch_all_columns(
+                        db,
+                        schema_pattern=schema_pattern,
+                        table_pattern=table_pattern,
+                        exclude_external_tables=exclude_external_tables
+                    )
+                except Exception as e:
+                    logger.warning("Batched column query failed for %s, describing tables instead: %s", db, e)
+                    columns = self._describe_tables(db, tables)
+                catalog['columns'].extend(columns)
                 
-                logger.info(f"Completed metadata extraction for database: {db}")
+                logger.info("Completed metadata extraction for database: %s", db)
                 
             except Exception as e:
-                logger.error(f"Error extracting metadata for {db}: {str(e)}")
+                logger.error("Error extracting metadata for %s: %s", db, e)
                 continue
         
         return catalog
@@ -286,55 +755,31 @@ class MetadataExtractor:
         
         self.connection.create_table_if_not_exists(output_table, create_table_ddl)
         
-        # Prepare data for insertion
-        insert_data = []
-        
+        # Upsert so re-running the pipeline replaces rows instead of duplicating them
+        # Rows are encoded lazily and streamed to the stage in batches
+        saved = self.connection.merge_load(
+            output_table,
+            ['metadata_type', 'database_name', 'schema_name', 'object_name', 'metadata_json', 'extracted_at'],
+            self._iter_catalog_rows(catalog, datetime.utcnow()),
+            key_columns=['metadata_type', 'database_name', 'schema_name', 'object_name'],
+            json_columns=['metadata_json']
+        )
+        logger.info("Saved %s metadata records to %s", saved, output_table)
+    
+    @staticmethod
+    def _iter_catalog_rows(catalog: Dict[str, Any], extracted_at: datetime) -> Iterator[tuple]:
+        """Yield one metadata table row per catalog object, JSON-encoding each on demand."""
         for db in catalog.get('databases', []):
-            insert_data.append((
-                'DATABASE',
-                db['database_name'],
-                None,
-                db['database_name'],
-                json.dumps(db),
-                datetime.utcnow()
-            ))
+            yield ('DATABASE', db['database_name'], None, db['database_name'], dumps_json(db), extracted_at)
         
         for schema in catalog.get('schemas', []):
-            insert_data.append((
-                'SCHEMA',
-                schema['database_name'],
-                schema['schema_name'],
-                schema['schema_name'],
-                json.dumps(schema),
-                datetime.utcnow()
-            ))
+            yield ('SCHEMA', schema['database_name'], schema['schema_name'], schema['schema_name'],
+                   dumps_json(schema), extracted_at)
         
         for table in catalog.get('tables', []):
-            insert_data.append((
-                'TABLE',
-                table['database_name'],
-                table['schema_name'],
-                table['table_name'],
-                json.dumps(table),
-                datetime.utcnow()
-            ))
+            yield ('TABLE', table['database_name'], table['schema_name'], table['table_name'],
+                   dumps_json(table), extracted_at)
         
         for column in catalog.get('columns', []):
-            insert_data.append((
-                'COLUMN',
-                column['database_name'],
-                column['schema_name'],
-                f"{column['table_name']}.{column['column_name']}",
-                json.dumps(column),
-                datetime.utcnow()
-            ))
-        
-        # Insert data
-        insert_query = f"""
-        INSERT INTO {output_table} 
-        (metadata_type, database_name, schema_name, object_name, metadata_json, extracted_at)
-        VALUES (%s, %s, %s, %s, PARSE_JSON(%s), %s)
-        """
-        
-        self.connection.execute_many(insert_query, insert_data)
-        logger.info(f"Saved {len(insert_data)} metadata records to {output_table}")
+            yield ('COLUMN', column['database_name'], column['schema_name'],
+                   f"{column['table_name']}.{column['column_name']}", dumps_json(column), extracted_at)
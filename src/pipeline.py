@@ -3,176 +3,255 @@ Main Data Governance Pipeline
 Orchestrates metadata extraction, lineage tracking, and data quality validation.
 """
 
+import argparse
+import itertools
+import os
 import sys
-from typing import Dict, Any, List
-from datetime import datetime
-from loguru import logger
-import yaml
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Mapping, Optional, Tuple
+from datetime import datetime, timezone
+import logging
+from logging.handlers import RotatingFileHandler
 
-from connection import SnowflakeConnection
-from metadata import MetadataExtractor
-from lineage import LineageTracker
-from quality import DataQualityValidator
+# The stage modules pull in snowflake.connector, pyarrow and sqlglot, so they
+# are imported where first used rather than at startup (keeps --help fast).
+if TYPE_CHECKING:
+    from connection import SnowflakeConnection
+    from quality import DataQualityValidator
+
+logger = logging.getLogger(__name__)
+
+# Timestamp format used in exported artefact file names
+RUN_STAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# QUERY_TAG applied to each stage's queries
+STAGE_QUERY_TAGS = {
+    'metadata': 'metadata_extraction',
+    'lineage': 'lineage_tracking',
+    'data_quality': 'data_quality_validation'
+}
+
+# Stage names in execution order, with the labels logged for each step
+PIPELINE_STAGES = {
+    'metadata': 'Metadata Extraction',
+    'lineage': 'Lineage Tracking',
+    'data_quality': 'Data Quality Validation'
+}
+
+# Short stage names accepted by --only
+STAGE_ALIASES = {'dq': 'data_quality'}
 
 
 class GovernancePipeline:
     """Main pipeline orchestrator for data governance framework."""
     
-    def __init__(self, config_path: str = "config/config.yaml"):
+    def __init__(self, config_path: str = "config/config.yaml", export_json: bool = None):
         """
         Initialize governance pipeline.
         
         Args:
             config_path: Path to configuration file
+            export_json: Also export JSON artefacts, overriding output.export_json
         """
         self.config_path = config_path
         self.config = self._load_config()
         self._setup_logging()
         
+        # Config sections and per-table DQ switches resolved once, not per table
+        self._metadata_config = self.config.get('metadata', {})
+        self._lineage_config = self.config.get('lineage', {})
+        self._dq_config = self.config.get('data_quality', {})
+        self._output_config = self.config.get('output', {})
+        self._tracked_dbs = tuple(self._metadata_config.get('tracked_databases', []))
+        self._stages = self._resolve_stages(self.config.get('pipeline', {}).get('stages'))
+        self._pretty_json = self._output_config.get('pretty_json', False)
+        # Artefacts for downstream steps are msgpack; JSON is an opt-in debug format
+        self._export_msgpack = self._output_config.get('export_msgpack', False)
+        self._export_json = self._output_config.get('export_json', False) if export_json is None else export_json
+        dq_rules = self._dq_config.get('rules', {})
+        self._uniqueness_enabled = dq_rules.get('uniqueness', {}).get('enabled', False)
+        self._uniqueness_mode = dq_rules.get('uniqueness', {}).get('mode', 'exact')
+        self._recheck_threshold = dq_rules.get('uniqueness', {}).get('recheck_threshold', 0.05)
+        self._timeliness_enabled = dq_rules.get('timeliness', {}).get('enabled', False)
+        self._max_age_hours = dq_rules.get('timeliness', {}).get('max_age_hours', 24)
+        
         # Initialize connection
         self.connection = None
         
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
+        # Shared artefact timestamp for the duration of run_full_pipeline
+        self._run_stamp = None
+        
+    def _load_config(self) -> Mapping[str, Any]:
+        """Load configuration from file. The returned config is shared and must not be mutated."""
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            logger.info(f"Configuration loaded from {self.config_path}")
+            from utils import load_config
+            config = load_config(self.config_path)
+            logger.info("Configuration loaded from %s", self.config_path)
             return config
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {self.config_path}")
+            logger.error("Configuration file not found: %s", self.config_path)
             raise
         except Exception as e:
-            logger.error(f"Failed to load configuration: {str(e)}")
+            logger.error("Failed to load configuration: %s", e)
             raise
     
+    def _output_stamp(self) -> str:
+        """Return the artefact timestamp of the current full run, or of now for a standalone stage."""
+        return self._run_stamp or datetime.now(timezone.utc).strftime(RUN_STAMP_FORMAT)
+    
     def _setup_logging(self) -> None:
         """Setup logging configuration."""
         log_config = self.config.get('logging', {})
         log_level = log_config.get('level', 'INFO')
         log_file = log_config.get('file', 'logs/governance.log')
         
-        # Remove default handler
-        logger.remove()
-        
-        # Add console handler
-        logger.add(
-            sys.stderr,
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-            level=log_level
-        )
+        log_dir = os.path.dirname(log_file)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
         
-        # Add file handler
-        logger.add(
-            log_file,
-            rotation="100 MB",
-            retention="30 days",
+        # Replace any existing root handlers with console and rotating file handlers
+        logging.basicConfig(
             level=log_level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} - {message}"
+            format="%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+            handlers=[
+                logging.StreamHandler(sys.stderr),
+                RotatingFileHandler(log_file, maxBytes=100 * 2 ** 20, backupCount=30)
+            ],
+            force=True
         )
         
+        # The connector logs every request at INFO; keep only its warnings
+        logging.getLogger('snowflake.connector').setLevel(logging.WARNING)
+        
         logger.info("Logging configured")
     
-    def run_metadata_extraction(self) -> Dict[str, Any]:
+    def run_metadata_extraction(self, connection: 'SnowflakeConnection' = None) -> Dict[str, Any]:
         """
         Run metadata extraction pipeline.
         
+        Args:
+            connection: Optional connection to use instead of the pipeline's own
+            
         Returns:
             Metadata catalog
         """
         logger.info("Starting metadata extraction pipeline...")
         
         try:
-            metadata_config = self.config.get('metadata', {})
-            output_config = self.config.get('output', {})
+            metadata_config = self._metadata_config
+            output_config = self._output_config
             
             # Initialize metadata extractor
-            extractor = MetadataExtractor(self.connection)
+            from metadata import MetadataExtractor
+            extractor = MetadataExtractor(connection or self.connection)
             
-            # Get tracked databases
-            tracked_databases = metadata_config.get('tracked_databases', [])
+            tracked_databases = self._tracked_dbs
             
-            # Extract full metadata
-            catalog = extractor.extract_full_metadata(tracked_databases)
+            # Extract full metadata, pushing name filters into Snowflake
+            catalog = extractor.extract_full_metadata(
+                tracked_databases,
+                database_pattern=metadata_config.get('database_pattern'),
+                schema_pattern=metadata_config.get('schema_pattern'),
+                table_pattern=metadata_config.get('table_pattern'),
+                exclude_external_tables=metadata_config.get('exclude_external_tables', True),
+                source=metadata_config.get('source', 'account_usage')
+            )
             
             # Save to Snowflake
             output_table = output_config.get('metadata_table', 'METADATA_CATALOG')
             extractor.save_metadata_to_snowflake(catalog, output_table)
             
-            # Export to JSON if configured
-            if output_config.get('export_json', False):
-                output_file = f"output/metadata_catalog_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-                with open(output_file, 'w') as f:
-                    json.dump(catalog, f, indent=2)
-                logger.info(f"Metadata catalog exported to {output_file}")
+            # Export catalog artefacts if configured
+            for export_format in self._export_formats():
+                output_file = f"output/metadata_catalog_{self._output_stamp()}.{export_format}"
+                self._write_artefact(catalog, output_file, export_format)
+                logger.info("Metadata catalog exported to %s", output_file)
             
             logger.info("Metadata extraction pipeline completed successfully")
             return catalog
             
         except Exception as e:
-            logger.error(f"Metadata extraction pipeline failed: {str(e)}")
+            logger.error("Metadata extraction pipeline failed: %s", e)
             raise
     
-    def run_lineage_tracking(self) -> Dict[str, Any]:
+    def run_lineage_tracking(self, connection: 'SnowflakeConnection' = None) -> Dict[str, Any]:
         """
         Run lineage tracking pipeline.
         
+        Args:
+            connection: Optional connection to use instead of the pipeline's own
+            
         Returns:
             Lineage information
         """
         logger.info("Starting lineage tracking pipeline...")
         
         try:
-            lineage_config = self.config.get('lineage', {})
-            output_config = self.config.get('output', {})
-            metadata_config = self.config.get('metadata', {})
+            lineage_config = self._lineage_config
+            output_config = self._output_config
             
             # Initialize lineage tracker
-            tracker = LineageTracker(self.connection)
+            from lineage import LineageTracker
+            tracker = LineageTracker(connection or self.connection)
             
-            # Get tracked databases
-            tracked_databases = metadata_config.get('tracked_databases', [])
+            tracked_databases = self._tracked_dbs
             
-            # Extract table dependencies
+            # Extract table dependencies, one concurrent round trip per database
             all_dependencies = []
-            for database in tracked_databases:
-                dependencies = tracker.extract_table_dependencies(database)
-                all_dependencies.extend(dependencies)
+            if tracked_databases:
+                workers = min(lineage_config.get('parallelism', 8), len(tracked_databases))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    per_database = list(executor.map(tracker.extract_table_dependencies, tracked_databases))
+                all_dependencies = list(itertools.chain.from_iterable(per_database))
             
-            # Extract query history lineage
+            # Extract query history lineage, continuing from the last saved run
+            output_table = output_config.get('lineage_table', 'LINEAGE_GRAPH')
             query_history_days = lineage_config.get('query_history_days', 7)
-            query_lineage = tracker.extract_query_history_lineage(days=query_history_days)
+            query_lineage = tracker.extract_query_history_lineage(
+                days=query_history_days,
+                source=lineage_config.get('source', 'access_history'),
+                output_table=output_table if lineage_config.get('incremental', True) else None
+            )
             
-            # Combine all lineage records
-            all_lineage = all_dependencies + query_lineage
+            # Combine all lineage records lazily, dropping edges seen more than once
+            all_lineage = tracker.iter_unique_lineage(all_dependencies, query_lineage)
             
             # Save to Snowflake
-            output_table = output_config.get('lineage_table', 'LINEAGE_GRAPH')
-            tracker.save_lineage_to_snowflake(all_lineage, output_table)
+            saved_records = tracker.save_lineage_to_snowflake(all_lineage, output_table)
+            
+            # Materialize transitive closure for full upstream/downstream lookups
+            closure_table = output_config.get('lineage_closure_table')
+            if closure_table:
+                tracker.rebuild_closure(output_table, closure_table)
             
-            # Export lineage graph if configured
-            if output_config.get('export_json', False):
-                output_file = f"output/lineage_graph_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-                tracker.export_lineage_graph(output_file)
+            # Export lineage graph if configured; the binary artefact uses
+            # lineage_export_format, the JSON debug export is always JSON
+            for export_format in self._export_formats():
+                if export_format == 'msgpack':
+                    export_format = output_config.get('lineage_export_format', 'parquet')
+                output_file = f"output/lineage_graph_{self._output_stamp()}.{export_format}"
+                tracker.export_lineage_graph(output_file, format=export_format, pretty=self._pretty_json)
             
             logger.info("Lineage tracking pipeline completed successfully")
             return {
                 'dependencies': all_dependencies,
                 'query_lineage': query_lineage,
-                'total_lineage_records': len(all_lineage)
+                'total_lineage_records': saved_records
             }
             
         except Exception as e:
-            logger.error(f"Lineage tracking pipeline failed: {str(e)}")
+            logger.error("Lineage tracking pipeline failed: %s", e)
             raise
     
-    def run_data_quality_validation(self, tables: List[Dict[str, str]] = None) -> Dict[str, Any]:
+    def run_data_quality_validation(self, tables: List[Dict[str, str]] = None,
+                                    connection: 'SnowflakeConnection' = None) -> Dict[str, Any]:
         """
         Run data quality validation pipeline.
         
         Args:
             tables: List of tables to validate (dict with database, schema, table keys)
+            connection: Optional connection to use instead of the pipeline's own
             
         Returns:
             Validation results
@@ -180,99 +259,324 @@ class GovernancePipeline:
         logger.info("Starting data quality validation pipeline...")
         
         try:
-            dq_config = self.config.get('data_quality', {})
-            output_config = self.config.get('output', {})
+            dq_config = self._dq_config
+            output_config = self._output_config
             
             # Initialize validator
-            validator = DataQualityValidator(self.connection, self.config)
+            from quality import DataQualityValidator
+            validator = DataQualityValidator(connection or self.connection, self.config)
             
             # If no tables specified, use metadata to get all tables
             if not tables:
-                tables = self._get_tables_from_metadata()
-            
-            # Run validation for each table
-            all_results = []
-            for table_info in tables:
-                database = table_info.get('database')
-                schema = table_info.get('schema')
-                table = table_info.get('table')
-                
-                logger.info(f"Validating table: {database}.{schema}.{table}")
-                
-                # Run comprehensive validation
-                result = validator.run_comprehensive_validation(database, schema, table)
-                all_results.append(result)
-                
-                # Run specific checks based on config
-                if dq_config.get('rules', {}).get('uniqueness', {}).get('enabled', False):
-                    # Example: Check primary key uniqueness
-                    uniqueness_result = validator.check_uniqueness(
-                        database, schema, table,
-                        columns=[table_info.get('primary_key', 'id')]
-                    )
-                    all_results.append(uniqueness_result)
-                
-                if dq_config.get('rules', {}).get('timeliness', {}).get('enabled', False):
-                    # Example: Check data freshness
-                    max_age = dq_config.get('rules', {}).get('timeliness', {}).get('max_age_hours', 24)
-                    timeliness_result = validator.check_timeliness(
-                        database, schema, table,
-                        timestamp_column=table_info.get('timestamp_column', 'created_at'),
-                        max_age_hours=max_age
-                    )
-                    all_results.append(timeliness_result)
+                tables = self._get_tables_from_metadata(connection)
+            
+            # Reuse comprehensive results for tables unchanged since they were memoized
+            memo_table = output_config.get('dq_memo_table', 'DQ_MEMO')
+            fingerprints = {}
+            memoized = {}
+            if tables and dq_config.get('memoize', True):
+                fingerprints = validator.table_fingerprints(tables)
+                memoized = validator.load_memoized_results(memo_table, fingerprints)
+            
+            # Validate tables concurrently; each table's queries are independent
+            per_table: List[List[Dict[str, Any]]] = [[] for _ in tables]
+            if tables:
+                workers = min(dq_config.get('parallelism', 8), len(tables))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(
+                            self._validate_one, validator, table_info,
+                            memoized.get(self._table_key(table_info))
+                        ): i
+                        for i, table_info in enumerate(tables)
+                    }
+                    for future in as_completed(futures):
+                        per_table[futures[future]] = future.result()
+            
+            # Keep results in table order regardless of completion order
+            all_results = list(itertools.chain.from_iterable(per_table))
+            
+            if fingerprints:
+                fresh_results = [
+                    results[0] for table_info, results in zip(tables, per_table)
+                    if self._table_key(table_info) not in memoized
+                ]
+                validator.save_memoized_results(memo_table, fresh_results, fingerprints)
             
             # Save results to Snowflake
             output_table = output_config.get('dq_results_table', 'DQ_VALIDATION_RESULTS')
             validator.save_validation_results(all_results, output_table)
             
-            # Generate report
-            report = validator.generate_dq_report(all_results)
-            
-            # Export report if configured
-            if output_config.get('export_json', False):
-                output_file = f"output/dq_report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-                with open(output_file, 'w') as f:
-                    json.dump(report, f, indent=2)
-                logger.info(f"DQ report exported to {output_file}")
+            # Generate report, or reuse the exported one for identical results
+            report = None
+            for export_format in self._export_formats():
+                output_file = f"output/dq_report_{self._output_stamp()}.{export_format}"
+                report = self._export_dq_report(validator, all_results, output_file, export_format, report)
+                logger.info("DQ report exported to %s", output_file)
+            if report is None:
+                report = validator.generate_dq_report(all_results)
             
             logger.info("Data quality validation pipeline completed successfully")
             return report
             
         except Exception as e:
-            logger.error(f"Data quality validation pipeline failed: {str(e)}")
+            logger.error("Data quality validation pipeline failed: %s", e)
             raise
     
-    def _get_tables_from_metadata(self) -> List[Dict[str, str]]:
+    def _export_formats(self) -> List[str]:
+        """Return the artefact formats enabled in the output configuration."""
+        return [name for name, enabled in (('msgpack', self._export_msgpack), ('json', self._export_json)) if enabled]
+    
+    def _write_artefact(self, obj: Any, output_file: str, export_format: str) -> None:
+        """Write an artefact as msgpack or JSON."""
+        from utils import write_json, write_msgpack
+        if export_format == 'msgpack':
+            write_msgpack(obj, output_file)
+        else:
+            write_json(obj, output_file, indent=self._pretty_json)
+    
+    def _export_dq_report(self, validator: 'DataQualityValidator', all_results: List[Dict[str, Any]],
+                          output_file: str, export_format: str = 'json',
+                          report: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Export the DQ report, reusing a stored report when the results match.
+        
+        Reports are stored as output/dq_report_<hash>.<format>, keyed on
+        validator.report_key. On a hit, the stored report is read back instead
+        of regenerated, given this run's report_timestamp and written to the
+        timestamped file. On a miss, the timestamped file is linked to the
+        newly stored report.
+        
+        Args:
+            validator: Validator that produced the results
+            all_results: Validation results of this run
+            output_file: Timestamped report path to create
+            export_format: 'msgpack' or 'json'
+            report: Report already built for another format, if any
+            
+        Returns:
+            DQ report
+        """
+        from utils import loads_json, read_msgpack
+        
+        memo_file = os.path.join(
+            os.path.dirname(output_file), f"dq_report_{validator.report_key(all_results)}.{export_format}"
+        )
+        if os.path.exists(memo_file):
+            if report is None:
+                if export_format == 'msgpack':
+                    report = read_msgpack(memo_file)
+                else:
+                    with open(memo_file, 'rb') as f:
+                        report = loads_json(f.read())
+                # report_key ignores the timestamp, so the stored one is from an earlier run
+                report['report_timestamp'] = datetime.utcnow().isoformat()
+            logger.info("Reusing DQ report %s for unchanged results", memo_file)
+            self._write_artefact(report, output_file, export_format)
+            return report
+        
+        if report is None:
+            report = validator.generate_dq_report(all_results)
+        self._write_artefact(report, memo_file, export_format)
+        
+        try:
+            if os.path.lexists(output_file):
+                os.remove(output_file)
+            os.symlink(os.path.basename(memo_file), output_file)
+        except OSError:
+            # e.g. symlinks unavailable on this filesystem
+            self._write_artefact(report, output_file, export_format)
+        return report
+    
+    @staticmethod
+    def _table_key(table_info: Dict[str, Any]) -> str:
+        """Return the "database.schema.table" name DQ results are keyed on."""
+        return f"{table_info.get('database')}.{table_info.get('schema')}.{table_info.get('table')}"
+    
+    def _validate_one(self, validator: 'DataQualityValidator', table_info: Dict[str, Any],
+                      memoized_result: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Run the configured DQ checks for one table.
+        
+        Args:
+            validator: Validator to run the checks with
+            table_info: Dict with database, schema, table and optional
+                primary_key / timestamp_column keys
+            memoized_result: Stored comprehensive result to reuse instead of
+                re-running it (the table is unchanged since it was computed)
+            
+        Returns:
+            Check results for the table, starting with the comprehensive result
+        """
+        database = table_info.get('database')
+        schema = table_info.get('schema')
+        table = table_info.get('table')
+        
+        logger.info("Validating table: %s.%s.%s", database, schema, table)
+        
+        uniqueness_cols = None
+        if self._uniqueness_enabled:
+            # Example: Check primary key uniqueness
+            uniqueness_cols = [table_info.get('primary_key', 'id')]
+        
+        timestamp_column = None
+        if self._timeliness_enabled:
+            # Example: Check data freshness
+            timestamp_column = table_info.get('timestamp_column', 'created_at')
+        
+        if memoized_result is None:
+            # Completeness, uniqueness and timeliness share one table scan;
+            # uniqueness and timeliness are reported as separate results, and
+            # keeping timeliness out of the comprehensive result keeps it out
+            # of the memo
+            comprehensive = validator.run_comprehensive_validation(
+                database, schema, table,
+                uniqueness_cols=uniqueness_cols,
+                timestamp_column=timestamp_column
+            )
+            return [comprehensive] + validator.detach_checks(comprehensive, ('UNIQUENESS', 'TIMELINESS'))
+        
+        # Uniqueness and timeliness share one table scan
+        return [memoized_result] + validator.check_all(
+            database, schema, table,
+            uniqueness_cols=uniqueness_cols,
+            uniqueness_mode=self._uniqueness_mode,
+            timestamp_column=timestamp_column,
+            max_age_hours=self._max_age_hours,
+            recheck_threshold=self._recheck_threshold
+        )
+    
+    def _get_tables_from_metadata(self, connection: 'SnowflakeConnection' = None) -> List[Dict[str, Any]]:
         """
         Get list of tables from metadata catalog.
         
+        Each tracked database's base tables are listed with one
+        INFORMATION_SCHEMA.TABLES query, which also returns the metadata used
+        to fingerprint them for DQ memoization.
+        
+        Args:
+            connection: Optional connection to use instead of the pipeline's own
+            
         Returns:
             List of table information dictionaries
         """
-        # This is a placeholder - in a real implementation, you would query
-        # the metadata catalog table to get the list of tables
-        metadata_config = self.config.get('metadata', {})
-        tracked_databases = metadata_config.get('tracked_databases', [])
+        from utils import qualified_name, quote_stored_identifier
+        connection = connection or self.connection
+        tracked_databases = self._tracked_dbs
         
         tables = []
-        # Example: return empty list if no specific tables configured
-        # In production, this would query the metadata catalog
+        for database in tracked_databases:
+            query = f"""
+            SELECT table_schema, table_name, last_altered, row_count, bytes
+            FROM {qualified_name(database)}.INFORMATION_SCHEMA.TABLES
+            WHERE table_type = 'BASE TABLE'
+              AND table_schema <> 'INFORMATION_SCHEMA'
+            """
+            for row in connection.execute_query(query):
+                # Stored names are exact, so they are kept quoted
+                tables.append({
+                    'database': database,
+                    'schema': quote_stored_identifier(row['TABLE_SCHEMA']),
+                    'table': quote_stored_identifier(row['TABLE_NAME']),
+                    'last_altered': row['LAST_ALTERED'],
+                    'row_count': row['ROW_COUNT'],
+                    'bytes': row['BYTES']
+                })
         
+        logger.info("Found %s tables in %s tracked databases", len(tables), len(tracked_databases))
         return tables
     
-    def run_full_pipeline(self) -> Dict[str, Any]:
+    @staticmethod
+    def _resolve_stages(stages: Optional[Iterable[str]]) -> Tuple[str, ...]:
+        """
+        Normalize a stage selection to known stage names in execution order.
+        
+        Args:
+            stages: Stage names or aliases (e.g. 'dq'); None selects every stage
+            
+        Returns:
+            Selected stage names
+            
+        Raises:
+            ValueError: If a stage name is not recognized
+        """
+        if stages is None:
+            return tuple(PIPELINE_STAGES)
+        
+        selected = {STAGE_ALIASES.get(stage.strip(), stage.strip()) for stage in stages if stage.strip()}
+        unknown = selected - PIPELINE_STAGES.keys()
+        if unknown:
+            raise ValueError(f"Unknown pipeline stages: {', '.join(sorted(unknown))}")
+        return tuple(stage for stage in PIPELINE_STAGES if stage in selected)
+    
+    def _run_stages_parallel(self, selected: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Run the selected pipeline stages concurrently on independent sessions.
+        
+        The stages read largely independent INFORMATION_SCHEMA/ACCOUNT_USAGE
+        views and spend most of their time waiting on Snowflake, so threads
+        overlap warehouse work despite the GIL.
+        
+        Args:
+            selected: Stage names to run
+        
+        Returns:
+            Stage results keyed by stage name
+        """
+        stages = {name: self._stage_function(name) for name in selected}
+        
+        from connection import SnowflakeConnection
+        
+        def run_stage(name, stage_fn):
+            connection = SnowflakeConnection(config=self.config)
+            try:
+                connection.connect()
+                with connection.stage(STAGE_QUERY_TAGS[name]):
+                    return stage_fn(connection=connection)
+            finally:
+                connection.close()
+        
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = {name: executor.submit(run_stage, name, stage_fn) for name, stage_fn in stages.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
+    def _stage_function(self, name: str):
+        """Return the run method of a pipeline stage."""
+        return {
+            'metadata': self.run_metadata_extraction,
+            'lineage': self.run_lineage_tracking,
+            'data_quality': self.run_data_quality_validation
+        }[name]
+    
+    def run_full_pipeline(self, parallel: bool = None, stages: Iterable[str] = None) -> Dict[str, Any]:
         """
         Run the complete data governance pipeline.
         
+        Stages left out of the selection are skipped entirely and report None.
+        
+        Args:
+            parallel: Run the stages concurrently on separate sessions
+                (defaults to pipeline.parallel_stages in the configuration)
+            stages: Stages to run, e.g. ['metadata', 'dq']
+                (defaults to pipeline.stages in the configuration, else all)
+        
         Returns:
             Complete pipeline results
         """
+        if parallel is None:
+            parallel = self.config.get('pipeline', {}).get('parallel_stages', False)
+        selected = self._stages if stages is None else self._resolve_stages(stages)
+        
         logger.info("=" * 80)
         logger.info("Starting FULL Data Governance Pipeline")
         logger.info("=" * 80)
+        skipped = [name for name in PIPELINE_STAGES if name not in selected]
+        if skipped:
+            logger.info("Skipping disabled stages: %s", ", ".join(skipped))
         
-        start_time = datetime.utcnow()
+        start_time = datetime.now(timezone.utc)
+        # All stages of this run name their artefacts with the same timestamp
+        self._run_stamp = start_time.strftime(RUN_STAMP_FORMAT)
         results = {
             'pipeline_start': start_time.isoformat(),
             'metadata': None,
@@ -282,23 +586,24 @@ class GovernancePipeline:
         }
         
         try:
-            # Connect to Snowflake
-            self.connection = SnowflakeConnection(self.config_path)
-            self.connection.connect()
-            
-            # Step 1: Metadata Extraction
-            logger.info("STEP 1/3: Metadata Extraction")
-            results['metadata'] = self.run_metadata_extraction()
-            
-            # Step 2: Lineage Tracking
-            logger.info("STEP 2/3: Lineage Tracking")
-            results['lineage'] = self.run_lineage_tracking()
-            
-            # Step 3: Data Quality Validation
-            logger.info("STEP 3/3: Data Quality Validation")
-            results['data_quality'] = self.run_data_quality_validation()
+            if not selected:
+                logger.info("No pipeline stages selected")
+            elif parallel:
+                logger.info("Running %s in parallel", ", ".join(PIPELINE_STAGES[name] for name in selected))
+                results.update(self._run_stages_parallel(selected))
+            else:
+                # Connect to Snowflake
+                from connection import SnowflakeConnection
+                # One shared, keep-alive session serves all selected stages
+                self.connection = SnowflakeConnection.get_shared(config=self.config)
+                self.connection.connect()
+                
+                for step, name in enumerate(selected, 1):
+                    logger.info("STEP %s/%s: %s", step, len(selected), PIPELINE_STAGES[name])
+                    with self.connection.stage(STAGE_QUERY_TAGS[name]):
+                        results[name] = self._stage_function(name)()
             
-            end_time = datetime.utcnow()
+            end_time = datetime.now(timezone.utc)
             duration = (end_time - start_time).total_seconds()
             
             results['pipeline_end'] = end_time.isoformat()
@@ -306,7 +611,7 @@ class GovernancePipeline:
             results['status'] = 'COMPLETED'
             
             logger.info("=" * 80)
-            logger.info(f"Data Governance Pipeline completed successfully in {duration:.2f} seconds")
+            logger.info("Data Governance Pipeline completed successfully in %.2f seconds", duration)
             logger.info("=" * 80)
             
             return results
@@ -314,10 +619,12 @@ class GovernancePipeline:
         except Exception as e:
             results['status'] = 'FAILED'
             results['error'] = str(e)
-            logger.error(f"Pipeline failed: {str(e)}")
+            logger.error("Pipeline failed: %s", e)
             raise
             
         finally:
+            self._run_stamp = None
+            
             # Close connection
             if self.connection:
                 self.connection.close()
@@ -325,10 +632,33 @@ class GovernancePipeline:
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run the data governance pipeline.")
+    parser.add_argument('--config', default="config/config.yaml", help="Path to configuration file")
+    parser.add_argument('--pretty', metavar='ARTEFACT_FILE',
+                        help="Print an exported JSON or msgpack artefact as indented JSON, then exit")
+    parser.add_argument('--export-json', action='store_true', default=None,
+                        help="Also export JSON artefacts, overriding output.export_json")
+    parser.add_argument('--only', metavar='STAGES',
+                        help="Comma-separated stages to run (metadata, lineage, data_quality/dq), "
+                             "overriding pipeline.stages")
+    args = parser.parse_args()
+    
+    if args.pretty:
+        import orjson
+        if args.pretty.endswith('.msgpack'):
+            from utils import read_msgpack
+            artefact = read_msgpack(args.pretty)
+        else:
+            with open(args.pretty, 'rb') as f:
+                artefact = orjson.loads(f.read())
+        sys.stdout.write(orjson.dumps(artefact, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode() + "\n")
+        return
+    
     try:
         # Initialize and run pipeline
-        pipeline = GovernancePipeline()
-        results = pipeline.run_full_pipeline()
+        pipeline = GovernancePipeline(config_path=args.config, export_json=args.export_json)
+        stages = args.only.split(',') if args.only else None
+        results = pipeline.run_full_pipeline(stages=stages)
         
         # Print summary
         print("\n" + "=" * 80)
@@ -341,7 +671,7 @@ def main():
         print("=" * 80)
         
     except Exception as e:
-        logger.error(f"Pipeline execution failed: {str(e)}")
+        logger.error("Pipeline execution failed: %s", e)
         sys.exit(1)
 
 
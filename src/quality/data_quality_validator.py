@@ -3,16 +3,267 @@ Data Quality Validation Module
 Performs comprehensive data quality checks on Snowflake tables.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from loguru import logger
-import json
+from functools import lru_cache, wraps
+from operator import itemgetter
+import copy
+import hashlib
+import inspect
+import logging
+import math
+import threading
+import time
 
 from ..connection import SnowflakeConnection
+from ..utils import dumps_json, loads_json, qualified_name, quote_stored_identifier, stored_identifier
+
+logger = logging.getLogger(__name__)
+
+
+# Distinct-count aggregates by uniqueness mode. APPROX_COUNT_DISTINCT is
+# Snowflake's HyperLogLog estimate (average relative error ~1.6%). 'recheck'
+# scans with the estimate first and recounts near-unique columns exactly.
+DISTINCT_COUNT_EXPRESSIONS = {
+    'exact': "COUNT(DISTINCT {column})",
+    'approx': "APPROX_COUNT_DISTINCT({column})",
+    'recheck': "APPROX_COUNT_DISTINCT({column})"
+}
+
+# In 'recheck' mode, columns whose estimated duplicate ratio is above this are
+# clearly not unique (about 3x the HLL average error) and keep the estimate.
+DEFAULT_RECHECK_THRESHOLD = 0.05
+
+# Sampled completeness only applies to tables with at least this many times
+# the requested sample size; smaller tables are scanned in full.
+SAMPLE_MIN_TABLE_FACTOR = 10
+
+# Reports over more results than this are aggregated column-wise with pandas
+PANDAS_REPORT_MIN_RESULTS = 1000
+
+# Snowflake SAMPLE methods: BERNOULLI draws individual rows (unbiased, still
+# reads every micro-partition); SYSTEM draws whole blocks (reads fewer bytes,
+# but nulls clustered in few partitions widen the real error).
+SAMPLE_METHODS = ('BERNOULLI', 'SYSTEM')
+
+# Check types in the order check_all reports them
+CHECK_TYPES = ('COMPLETENESS', 'UNIQUENESS', 'VALIDITY', 'TIMELINESS')
+
+# Per-column aggregates packed into one statement. Wider column lists are
+# split into several statements to stay clear of Snowflake's expression and
+# statement size limits.
+MAX_AGGREGATES_PER_QUERY = 250
+
+
+# SQL builders are memoized on the check shape (columns, rules, mode) and bind
+# the table through IDENTIFIER(%s), so validating many tables with the same
+# shape builds each statement text only once per process. Because the table is
+# bound with pyformat parameters, literal '%' in rule text is escaped as '%%'.
+# Columns are stored names (see stored_identifier) and are always quoted.
+
+# Per-table metadata lookups bind every name, so their text is identical for
+# all tables. INFORMATION_SCHEMA names are bound as stored (stored_identifier),
+# so quoted case variants of a table never match each other.
+_DESCRIBE_SQL = "DESCRIBE TABLE IDENTIFIER(%s)"
+
+_TABLE_STATS_SQL = """
+    SELECT last_altered, row_count
+    FROM IDENTIFIER(%s)
+    WHERE table_schema = %s AND table_name = %s
+    """
+
+
+def _null_count_expression(column: str) -> str:
+    """
+    Return the null-count aggregate for a column.
+    
+    COUNT(*) - COUNT(column) equals COUNT_IF(column IS NULL), but unlike a
+    predicate it only needs per-micro-partition row and null counts, which
+    Snowflake can read from partition metadata without scanning the column
+    when the query has no filter or sample.
+    """
+    return f"COUNT(*) - COUNT({quote_stored_identifier(column)})"
+
+
+@lru_cache(maxsize=256)
+def _completeness_sql(columns: Tuple[str, ...], sample_clause: str = '') -> str:
+    """Build the single-scan row/null count query for a column tuple, optionally over a sample."""
+    select_exprs = ["COUNT(*) AS total_rows"]
+    select_exprs.extend(f"{_null_count_expression(column)} AS null_{i}" for i, column in enumerate(columns))
+    return f"""
+    SELECT 
+        {', '.join(select_exprs)}
+    FROM IDENTIFIER(%s) {sample_clause}
+    """
+
+
+@lru_cache(maxsize=256)
+def _uniqueness_sql(columns: Tuple[str, ...], uniqueness_mode: str) -> str:
+    """Build the single-scan row/distinct count query for a column tuple."""
+    distinct_expression = DataQualityValidator._distinct_count_expression(uniqueness_mode)
+    distinct_exprs = ', '.join(
+        f"{distinct_expression.format(column=quote_stored_identifier(column))} AS distinct_{i}"
+        for i, column in enumerate(columns)
+    )
+    return f"""
+    SELECT 
+        COUNT(*) as total_count,
+        {distinct_exprs}
+    FROM IDENTIFIER(%s)
+    """
+
+
+@lru_cache(maxsize=256)
+def _grouped_distinct_sql(columns: Tuple[str, ...]) -> str:
+    """
+    Build an exact row/distinct count query that counts GROUP BY groups.
+    
+    Same result shape as ``_uniqueness_sql(columns, 'exact')``, but each
+    distinct count is a COUNT(*) over a grouped subquery, which Snowflake can
+    run as a partitioned hash aggregate instead of one global COUNT(DISTINCT)
+    hash set. The table is bound once as the named parameter ``table``.
+    """
+    ctes = ["total AS (SELECT COUNT(*) AS total_count FROM IDENTIFIER(%(table)s))"]
+    for i, column in enumerate(columns):
+        column = quote_stored_identifier(column)
+        ctes.append(
+            f"d{i} AS (SELECT COUNT(*) AS distinct_{i} FROM "
+            f"(SELECT {column} FROM IDENTIFIER(%(table)s) WHERE {column} IS NOT NULL GROUP BY {column}))"
+        )
+    select_exprs = ["total.total_count"] + [f"d{i}.distinct_{i}" for i in range(len(columns))]
+    sources = ["total"] + [f"d{i}" for i in range(len(columns))]
+    return f"""
+    WITH {', '.join(ctes)}
+    SELECT {', '.join(select_exprs)}
+    FROM {' CROSS JOIN '.join(sources)}
+    """
+
+
+@lru_cache(maxsize=256)
+def _validity_sql(validity_rules: Tuple[Tuple[str, str], ...]) -> str:
+    """Build the single-scan non-null/invalid count query for (column, rule) pairs."""
+    select_exprs = []
+    for i, (column, rule) in enumerate(validity_rules):
+        column = quote_stored_identifier(column)
+        select_exprs.append(f"COUNT_IF({column} IS NOT NULL) AS valid_total_{i}")
+        select_exprs.append(f"COUNT_IF({column} IS NOT NULL AND NOT ({rule.replace('%', '%%')})) AS invalid_{i}")
+    return f"""
+    SELECT 
+        {', '.join(select_exprs)}
+    FROM IDENTIFIER(%s)
+    """
+
+
+@lru_cache(maxsize=256)
+def _timeliness_sql(timestamp_column: str) -> str:
+    """Build the freshness query for a timestamp column."""
+    # The inner query is a bare MAX over one column with no filter, which
+    # Snowflake answers from micro-partition min/max metadata without
+    # scanning table data.
+    return f"""
+    SELECT 
+        latest_timestamp,
+        DATEDIFF('hour', latest_timestamp, CURRENT_TIMESTAMP()) as age_hours
+    FROM (
+        SELECT MAX({quote_stored_identifier(timestamp_column)}) as latest_timestamp
+        FROM IDENTIFIER(%s)
+    )
+    """
+
+
+@lru_cache(maxsize=256)
+def _fused_sql(completeness_cols: Tuple[str, ...], uniqueness_cols: Tuple[str, ...],
+               uniqueness_mode: str, validity_rules: Tuple[Tuple[str, str], ...],
+               timestamp_column: Optional[str]) -> str:
+    """Build the single-scan query backing check_all()."""
+    select_exprs = ["COUNT(*) AS total_rows"]
+    for i, column in enumerate(completeness_cols):
+        select_exprs.append(f"{_null_count_expression(column)} AS null_{i}")
+    distinct_expression = DataQualityValidator._distinct_count_expression(uniqueness_mode)
+    for i, column in enumerate(uniqueness_cols):
+        select_exprs.append(f"{distinct_expression.format(column=quote_stored_identifier(column))} AS distinct_{i}")
+    for i, (column, rule) in enumerate(validity_rules):
+        column = quote_stored_identifier(column)
+        select_exprs.append(f"COUNT_IF({column} IS NOT NULL) AS valid_total_{i}")
+        select_exprs.append(
+            f"COUNT_IF({column} IS NOT NULL AND NOT ({rule.replace('%', '%%')})) AS invalid_{i}"
+        )
+    if timestamp_column:
+        timestamp_column = quote_stored_identifier(timestamp_column)
+        select_exprs.append(f"MAX({timestamp_column}) AS latest_timestamp")
+        select_exprs.append(
+            f"DATEDIFF('hour', MAX({timestamp_column}), CURRENT_TIMESTAMP()) AS age_hours"
+        )
+    return f"""
+    SELECT
+        {', '.join(select_exprs)}
+    FROM IDENTIFIER(%s)
+    """
+
+
+# Per-result summary fields read by reports and saved rows. Check results carry
+# their status as 'overall_status' (timeliness and errors use 'status'), so the
+# two common shapes go through C-level getters; anything else falls back to
+# dict.get with the same defaults.
+_SUMMARY_WITH_STATUS = itemgetter('table', 'check_type', 'status')
+_SUMMARY_WITH_OVERALL_STATUS = itemgetter('table', 'check_type', 'overall_status')
+
+
+def _summary_fields(result: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    """Return (table, check_type, status) of a validation result."""
+    if 'table' in result and 'check_type' in result:
+        if 'status' in result:
+            return _SUMMARY_WITH_STATUS(result)
+        if 'overall_status' in result:
+            return _SUMMARY_WITH_OVERALL_STATUS(result)
+    return (
+        result.get('table'),
+        result.get('check_type'),
+        result.get('status', result.get('overall_status', 'UNKNOWN'))
+    )
+
+
+def _cached_on_last_altered(check_type: str):
+    """
+    Cache a check's result until the table's LAST_ALTERED changes.
+    
+    The wrapped method must take (self, database, schema, table, ...); its
+    remaining arguments are part of the cache key. Calls passing a
+    timestamp_column are not cached, since freshness depends on the current
+    time. See DataQualityValidator._cached_check.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+        
+        @wraps(method)
+        def wrapper(self, database, schema, table, *args, **kwargs):
+            bound = signature.bind(self, database, schema, table, *args, **kwargs)
+            bound.apply_defaults()
+            check_args = {
+                name: value for name, value in bound.arguments.items()
+                if name not in ('self', 'database', 'schema', 'table')
+            }
+            if not self._result_cache_enabled or check_args.get('timestamp_column'):
+                return method(self, database, schema, table, *args, **kwargs)
+            return self._cached_check(
+                database, schema, table, check_type, check_args,
+                lambda: method(self, database, schema, table, *args, **kwargs)
+            )
+        return wrapper
+    return decorator
 
 
 class DataQualityValidator:
-    """Performs data quality validations."""
+    """
+    Performs data quality validations.
+    
+    Table and column names follow quote_identifier: plain names resolve
+    case-insensitively and quoted names (e.g. '"orders"', as produced by
+    quote_stored_identifier for names read from Snowflake) are exact. Results
+    report columns by their stored names.
+    """
     
     def __init__(self, connection: SnowflakeConnection, config: Dict[str, Any] = None):
         """
@@ -24,80 +275,94 @@ class DataQualityValidator:
         """
         self.connection = connection
         self.config = config or {}
+        # Count exact distinct values through GROUP BY subqueries
+        self._exact_distinct_rewrite = self.config.get('data_quality', {}).get('exact_distinct_rewrite', False)
+        # DESCRIBE TABLE results: full table name -> (expires_at, columns, NOT NULL columns)
+        self._schema_cache: Dict[str, Tuple[float, List[str], frozenset]] = {}
+        self._schema_cache_ttl = self.config.get('data_quality', {}).get('schema_cache_ttl', 300)
+        self._schema_cache_lock = threading.Lock()
+        # Check results: (table, check type, args hash) -> (last_altered, result)
+        self._result_cache_enabled = self.config.get('data_quality', {}).get('result_cache', False)
+        self._result_cache: Dict[Tuple[str, str, str], Tuple[Any, Any]] = {}
+        self._pending_checks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._result_cache_lock = threading.Lock()
+        # Metadata lookups currently executing: (sql, params) -> Future of rows
+        self._inflight: Dict[Tuple[str, Any], Future] = {}
+        self._inflight_lock = threading.Lock()
         self.validation_results = []
     
+    @_cached_on_last_altered('COMPLETENESS')
     def check_completeness(self, database: str, schema: str, table: str, 
-                          columns: List[str] = None, threshold: float = 0.95) -> Dict[str, Any]:
+                          columns: List[str] = None, threshold: float = 0.95,
+                          sample_rows: int = None, sample_method: str = 'BERNOULLI',
+                          confidence: float = 0.95) -> Dict[str, Any]:
         """
         Check data completeness (null values).
         
+        When the columns come from DESCRIBE TABLE (``columns`` is None),
+        columns declared NOT NULL are reported complete without counting.
+        
+        With ``sample_rows``, tables at least SAMPLE_MIN_TABLE_FACTOR times
+        that size are checked on a SAMPLE of about ``sample_rows`` rows. Each
+        column's completeness then carries a Hoeffding confidence interval;
+        columns whose interval contains the threshold are recounted exactly,
+        so pass/fail is only taken from the sample when it is decisive.
+        
         Args:
             database: Database name
             schema: Schema name
             table: Table name
             columns: List of columns to check (None for all)
             threshold: Acceptable completeness threshold
+            sample_rows: Target sample size (None scans the full table)
+            sample_method: 'BERNOULLI' or 'SYSTEM' (see SAMPLE_METHODS)
+            confidence: Confidence level of the reported intervals
             
         Returns:
             Completeness check results
         """
-        full_table_name = f"{database}.{schema}.{table}"
+        full_table_name = qualified_name(database, schema, table)
         
         try:
             # Get all columns if not specified
+            not_null = frozenset()
             if not columns:
-                col_query = f"DESCRIBE TABLE {full_table_name}"
-                col_results = self.connection.execute_query(col_query)
-                columns = [col['name'] for col in col_results]
+                columns, not_null = self._describe_columns(full_table_name)
+            else:
+                columns = [stored_identifier(column) for column in columns]
+            nullable = [column for column in columns if column not in not_null]
+            
+            sample_plan = self._sample_plan(database, schema, table, sample_rows) if nullable else None
+            if sample_plan is not None:
+                return self._sampled_completeness(
+                    full_table_name, columns, nullable, threshold, *sample_plan, sample_method, confidence
+                )
+            
+            # Count rows and per-column nulls in a single scan (one scan per
+            # MAX_AGGREGATES_PER_QUERY columns on very wide tables)
+            total_rows, null_counts = self._count_nulls(full_table_name, nullable)
             
-            # Get total row count
-            count_query = f"SELECT COUNT(*) as total_rows FROM {full_table_name}"
-            total_rows_result = self.connection.execute_query(count_query)
-            total_rows = total_rows_result[0]['TOTAL_ROWS']
+            column_results = [
+                self._completeness_column_result(column, null_counts.get(column, 0), total_rows, threshold)
+                for column in columns
+            ]
             
             completeness_results = {
                 'check_type': 'COMPLETENESS',
                 'table': full_table_name,
                 'total_rows': total_rows,
-                'columns': [],
-                'overall_status': 'PASSED',
+                'columns': column_results,
+                'overall_status': self._overall_status(column_results),
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            for column in columns:
-                # Count null values
-                null_query = f"""
-                SELECT 
-                    COUNT(*) as null_count,
-                    COUNT(*) * 100.0 / {total_rows} as null_percentage
-                FROM {full_table_name}
-                WHERE {column} IS NULL
-                """
-                
-                null_result = self.connection.execute_query(null_query)
-                null_count = null_result[0]['NULL_COUNT']
-                null_percentage = null_result[0]['NULL_PERCENTAGE']
-                
-                completeness = 1 - (null_percentage / 100.0)
-                status = 'PASSED' if completeness >= threshold else 'FAILED'
-                
-                if status == 'FAILED':
-                    completeness_results['overall_status'] = 'FAILED'
-                
-                completeness_results['columns'].append({
-                    'column_name': column,
-                    'null_count': null_count,
-                    'null_percentage': round(null_percentage, 2),
-                    'completeness': round(completeness, 4),
-                    'threshold': threshold,
-                    'status': status
-                })
-            
-            logger.info(f"Completeness check completed for {full_table_name}")
+            logger.info("Completeness check completed for %s", full_table_name)
             return completeness_results
             
         except Exception as e:
-            logger.error(f"Completeness check failed: {str(e)}")
+            logger.error("Completeness check failed: %s", e)
+            # The cached column list may predate DDL on the table
+            self.invalidate_schema_cache(full_table_name)
             return {
                 'check_type': 'COMPLETENESS',
                 'table': full_table_name,
@@ -105,66 +370,326 @@ class DataQualityValidator:
                 'error': str(e)
             }
     
+    def _coalesced_query(self, query: str, params: Tuple) -> List[Dict[str, Any]]:
+        """
+        Execute a read-only query, sharing the result with identical concurrent calls.
+        
+        The first caller for a (query, params) pair runs it and publishes the
+        rows (or the exception) through a pending Future; callers arriving
+        while it runs wait on that Future instead of sending the same
+        statement. The entry is dropped once the query finishes, so later
+        calls always see fresh results. Callers must not mutate the rows.
+        
+        Args:
+            query: SQL query text
+            params: Query parameters (hashable)
+            
+        Returns:
+            Query result rows
+        """
+        key = (query, params)
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._inflight[key] = Future()
+        
+        if not leader:
+            return pending.result()
+        
+        try:
+            rows = self.connection.execute_query(query, params)
+        except Exception as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(rows)
+            return rows
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _table_stats(self, database: str, schema: str, table: str) -> Optional[Dict[str, Any]]:
+        """Return a table's INFORMATION_SCHEMA.TABLES LAST_ALTERED and ROW_COUNT, or None if unavailable."""
+        params = (f"{qualified_name(database)}.INFORMATION_SCHEMA.TABLES",
+                  stored_identifier(schema), stored_identifier(table))
+        try:
+            rows = self._coalesced_query(_TABLE_STATS_SQL, params)
+        except Exception as e:
+            logger.warning("Failed to read table statistics for %s.%s.%s: %s", database, schema, table, e)
+            return None
+        return rows[0] if rows else None
+    
+    def _table_last_altered(self, database: str, schema: str, table: str) -> Any:
+        """Return a table's INFORMATION_SCHEMA.TABLES LAST_ALTERED, or None if unavailable."""
+        stats = self._table_stats(database, schema, table)
+        return stats['LAST_ALTERED'] if stats else None
+    
+    def _sample_plan(self, database: str, schema: str, table: str,
+                     sample_rows: Optional[int]) -> Optional[Tuple[float, int]]:
+        """
+        Decide whether to sample a table for completeness.
+        
+        Returns:
+            Tuple of (SAMPLE percentage yielding about ``sample_rows`` rows,
+            table row count), or None to scan the table in full
+        """
+        if not sample_rows:
+            return None
+        stats = self._table_stats(database, schema, table)
+        row_count = stats.get('ROW_COUNT') if stats else None
+        if not row_count or row_count < SAMPLE_MIN_TABLE_FACTOR * sample_rows:
+            return None
+        return 100.0 * sample_rows / row_count, row_count
+    
+    def _count_nulls(self, full_table_name: str, columns: List[str],
+                     sample_clause: str = '') -> Tuple[int, Dict[str, int]]:
+        """
+        Count rows and per-column nulls, one statement per MAX_AGGREGATES_PER_QUERY columns.
+        
+        Returns:
+            Tuple of (row count, column -> null count)
+        """
+        total_rows = 0
+        null_counts = {}
+        for start in range(0, len(columns) or 1, MAX_AGGREGATES_PER_QUERY):
+            chunk = tuple(columns[start:start + MAX_AGGREGATES_PER_QUERY])
+            null_result = self.connection.execute_query(_completeness_sql(chunk, sample_clause), (full_table_name,))[0]
+            total_rows = null_result['TOTAL_ROWS']
+            null_counts.update((column, null_result[f'NULL_{i}']) for i, column in enumerate(chunk))
+        return total_rows, null_counts
+    
+    def _cached_check(self, database: str, schema: str, table: str, check_type: str,
+                      check_args: Dict[str, Any], compute) -> Any:
+        """
+        Return a cached check result while the table is unchanged, else compute it.
+        
+        Entries are keyed on the table, check type and a hash of the check
+        arguments, and are only reused while the table's LAST_ALTERED matches
+        the value read when they were computed. Concurrent calls for the same
+        key wait for the first one instead of scanning the table again.
+        Results containing an ERROR status are never cached.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table: Table name
+            check_type: Check type the result belongs to
+            check_args: Remaining check arguments
+            compute: Zero-argument callable running the check
+            
+        Returns:
+            Check result (a copy of the cached one on a hit)
+        """
+        last_altered = self._table_last_altered(database, schema, table)
+        if last_altered is None:
+            return compute()
+        
+        args_hash = hashlib.blake2b(dumps_json(check_args).encode(), digest_size=16).hexdigest()
+        key = (qualified_name(database, schema, table), check_type, args_hash)
+        with self._result_cache_lock:
+            pending = self._pending_checks.setdefault(key, threading.Lock())
+        
+        with pending:
+            with self._result_cache_lock:
+                cached = self._result_cache.get(key)
+            if cached is not None and cached[0] == last_altered:
+                logger.debug("Reusing %s result for unchanged %s", check_type, key[0])
+                return copy.deepcopy(cached[1])
+            
+            result = compute()
+            entries = result if isinstance(result, list) else [result]
+            if not any(entry.get('status') == 'ERROR' for entry in entries):
+                with self._result_cache_lock:
+                    self._result_cache[key] = (last_altered, copy.deepcopy(result))
+            return result
+    
+    def _sampled_completeness(self, full_table_name: str, columns: List[str], nullable: List[str],
+                              threshold: float, sample_percent: float, row_count: int,
+                              sample_method: str, confidence: float) -> Dict[str, Any]:
+        """
+        Estimate completeness from a table sample, recounting undecided columns exactly.
+        
+        Args:
+            full_table_name: Fully qualified table name
+            columns: All columns to report
+            nullable: Columns to count (the rest are NOT NULL)
+            threshold: Acceptable completeness threshold
+            sample_percent: Percentage of rows (or blocks) to sample
+            row_count: Table row count from INFORMATION_SCHEMA.TABLES
+            sample_method: 'BERNOULLI' or 'SYSTEM'
+            confidence: Confidence level of the reported intervals
+            
+        Returns:
+            Completeness check results
+        """
+        sample_method = sample_method.upper()
+        if sample_method not in SAMPLE_METHODS:
+            raise ValueError(f"Unknown sample method: {sample_method}")
+        
+        sample_clause = f"SAMPLE {sample_method} ({sample_percent:.6g})"
+        sample_size, sample_nulls = self._count_nulls(full_table_name, nullable, sample_clause)
+        
+        total_rows = row_count
+        estimates = {}
+        margin = 0.0
+        if sample_size:
+            # Hoeffding: P(|estimate - true| >= margin) <= 2 * exp(-2 * n * margin^2)
+            margin = math.sqrt(math.log(2 / (1 - confidence)) / (2 * sample_size))
+            estimates = {column: 1 - sample_nulls[column] / sample_size for column in nullable}
+            undecided = [
+                column for column in nullable
+                if estimates[column] - margin < threshold <= estimates[column] + margin
+            ]
+        else:
+            # An empty sample decides nothing
+            undecided = nullable
+        
+        exact_counts = {}
+        if undecided:
+            total_rows, exact_counts = self._count_nulls(full_table_name, undecided)
+        
+        column_results = []
+        for column in columns:
+            if column not in estimates or column in exact_counts:
+                column_results.append(
+                    self._completeness_column_result(column, exact_counts.get(column, 0), total_rows, threshold)
+                )
+                continue
+            
+            estimate = estimates[column]
+            result = self._completeness_column_result(column, round((1 - estimate) * total_rows), total_rows, threshold)
+            result.update({
+                'null_percentage': round((1 - estimate) * 100.0, 2),
+                'completeness': round(estimate, 4),
+                'status': 'PASSED' if estimate >= threshold else 'FAILED',
+                'approximate': True,
+                'confidence_interval': [round(max(0.0, estimate - margin), 4), round(min(1.0, estimate + margin), 4)]
+            })
+            column_results.append(result)
+        
+        logger.info(
+            "Sampled completeness check completed for %s (%s sampled rows, %s of %s columns recounted)",
+            full_table_name, sample_size, len(exact_counts), len(nullable)
+        )
+        return {
+            'check_type': 'COMPLETENESS',
+            'table': full_table_name,
+            'total_rows': total_rows,
+            'sample_size': sample_size,
+            'sample_method': sample_method,
+            'confidence': confidence,
+            'columns': column_results,
+            'overall_status': self._overall_status(column_results),
+            'timestamp': datetime.utcnow().isoformat()
+        }
+    
+    def _describe_columns(self, full_table_name: str) -> Tuple[List[str], frozenset]:
+        """
+        Return a table's columns and NOT NULL columns, caching DESCRIBE TABLE results.
+        
+        Entries expire after data_quality.schema_cache_ttl seconds (default
+        300; 0 disables the cache) and are dropped when a check on the table
+        fails, since that may be caused by DDL since the lookup.
+        
+        Args:
+            full_table_name: Fully qualified table name
+            
+        Returns:
+            Tuple of (column names in table order, names of NOT NULL columns)
+        """
+        now = time.monotonic()
+        with self._schema_cache_lock:
+            cached = self._schema_cache.get(full_table_name)
+        if cached is not None and cached[0] > now:
+            return cached[1], cached[2]
+        
+        described = self._coalesced_query(_DESCRIBE_SQL, (full_table_name,))
+        columns = [col['name'] for col in described]
+        not_null = frozenset(col['name'] for col in described if col.get('null?') == 'N')
+        if self._schema_cache_ttl > 0:
+            with self._schema_cache_lock:
+                self._schema_cache[full_table_name] = (now + self._schema_cache_ttl, columns, not_null)
+        return columns, not_null
+    
+    def invalidate_schema_cache(self, full_table_name: str = None) -> None:
+        """
+        Drop cached DESCRIBE TABLE results.
+        
+        Args:
+            full_table_name: Table to drop (None drops every table)
+        """
+        with self._schema_cache_lock:
+            if full_table_name is None:
+                self._schema_cache.clear()
+            else:
+                self._schema_cache.pop(full_table_name, None)
+    
+    @_cached_on_last_altered('UNIQUENESS')
     def check_uniqueness(self, database: str, schema: str, table: str, 
-                        columns: List[str]) -> Dict[str, Any]:
+                        columns: List[str], uniqueness_mode: str = 'exact',
+                        recheck_threshold: float = DEFAULT_RECHECK_THRESHOLD) -> Dict[str, Any]:
         """
         Check data uniqueness (duplicate values).
         
+        With ``uniqueness_mode='approx'`` distinct counts come from HyperLogLog
+        (APPROX_COUNT_DISTINCT), which avoids an exact hash aggregate on large
+        tables at the cost of a ~1.6% average relative error; small duplicate
+        counts may then be estimation noise. ``uniqueness_mode='recheck'`` runs
+        the same estimate, then recounts exactly only the columns whose
+        estimated duplicate ratio is at most ``recheck_threshold``, the ones
+        whose status could be decided by estimation error. Clearly duplicated
+        columns keep their (approximate) counts and fail without an exact scan.
+        
         Args:
             database: Database name
             schema: Schema name
             table: Table name
             columns: List of columns to check for uniqueness
+            uniqueness_mode: 'exact', 'approx' or 'recheck'
+            recheck_threshold: Estimated duplicate ratio up to which 'recheck'
+                mode recounts a column exactly
             
         Returns:
             Uniqueness check results
         """
-        full_table_name = f"{database}.{schema}.{table}"
+        full_table_name = qualified_name(database, schema, table)
         
-        try:
-            uniqueness_results = {
+        if not columns:
+            return {
                 'check_type': 'UNIQUENESS',
                 'table': full_table_name,
                 'columns': [],
                 'overall_status': 'PASSED',
                 'timestamp': datetime.utcnow().isoformat()
             }
+        columns = [stored_identifier(column) for column in columns]
+        
+        try:
+            # Count rows and per-column distinct values in a single statement
+            dup_result = self._distinct_counts(full_table_name, tuple(columns), uniqueness_mode)
+            total_count = dup_result['TOTAL_COUNT']
             
-            for column in columns:
-                # Check for duplicates
-                dup_query = f"""
-                SELECT 
-                    COUNT(*) as total_count,
-                    COUNT(DISTINCT {column}) as distinct_count,
-                    COUNT(*) - COUNT(DISTINCT {column}) as duplicate_count
-                FROM {full_table_name}
-                """
-                
-                dup_result = self.connection.execute_query(dup_query)
-                total_count = dup_result[0]['TOTAL_COUNT']
-                distinct_count = dup_result[0]['DISTINCT_COUNT']
-                duplicate_count = dup_result[0]['DUPLICATE_COUNT']
-                
-                uniqueness_ratio = distinct_count / total_count if total_count > 0 else 0
-                status = 'PASSED' if duplicate_count == 0 else 'FAILED'
-                
-                if status == 'FAILED':
-                    uniqueness_results['overall_status'] = 'FAILED'
-                
-                uniqueness_results['columns'].append({
-                    'column_name': column,
-                    'total_count': total_count,
-                    'distinct_count': distinct_count,
-                    'duplicate_count': duplicate_count,
-                    'uniqueness_ratio': round(uniqueness_ratio, 4),
-                    'status': status
-                })
+            column_results = [
+                self._uniqueness_column_result(column, total_count, dup_result[f'DISTINCT_{i}'], uniqueness_mode)
+                for i, column in enumerate(columns)
+            ]
+            if uniqueness_mode == 'recheck':
+                self._recheck_exact_distinct(full_table_name, column_results, recheck_threshold)
             
-            logger.info(f"Uniqueness check completed for {full_table_name}")
+            uniqueness_results = {
+                'check_type': 'UNIQUENESS',
+                'table': full_table_name,
+                'columns': column_results,
+                'overall_status': self._overall_status(column_results),
+                'timestamp': datetime.utcnow().isoformat()
+            }
+            
+            logger.info("Uniqueness check completed for %s", full_table_name)
             return uniqueness_results
             
         except Exception as e:
-            logger.error(f"Uniqueness check failed: {str(e)}")
+            logger.error("Uniqueness check failed: %s", e)
             return {
                 'check_type': 'UNIQUENESS',
                 'table': full_table_name,
@@ -172,6 +697,7 @@ class DataQualityValidator:
                 'error': str(e)
             }
     
+    @_cached_on_last_altered('VALIDITY')
     def check_validity(self, database: str, schema: str, table: str,
                       validation_rules: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -186,51 +712,35 @@ class DataQualityValidator:
         Returns:
             Validity check results
         """
-        full_table_name = f"{database}.{schema}.{table}"
+        full_table_name = qualified_name(database, schema, table)
         
         try:
+            # Count non-null and invalid records for every rule in a single
+            # scan (one scan per MAX_AGGREGATES_PER_QUERY aggregates)
+            rules = tuple((stored_identifier(column), rule) for column, rule in validation_rules.items())
+            rules_per_query = MAX_AGGREGATES_PER_QUERY // 2
+            rule_results = []
+            for start in range(0, len(rules), rules_per_query):
+                chunk = rules[start:start + rules_per_query]
+                row = self.connection.execute_query(_validity_sql(chunk), (full_table_name,))[0]
+                rule_results.extend(
+                    self._validity_rule_result(column, rule, row[f'VALID_TOTAL_{i}'], row[f'INVALID_{i}'])
+                    for i, (column, rule) in enumerate(chunk)
+                )
+            
             validity_results = {
                 'check_type': 'VALIDITY',
                 'table': full_table_name,
-                'rules': [],
-                'overall_status': 'PASSED',
+                'rules': rule_results,
+                'overall_status': self._overall_status(rule_results),
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            for column, rule in validation_rules.items():
-                # Count invalid records
-                invalid_query = f"""
-                SELECT 
-                    COUNT(*) as total_count,
-                    SUM(CASE WHEN NOT ({rule}) THEN 1 ELSE 0 END) as invalid_count
-                FROM {full_table_name}
-                WHERE {column} IS NOT NULL
-                """
-                
-                invalid_result = self.connection.execute_query(invalid_query)
-                total_count = invalid_result[0]['TOTAL_COUNT']
-                invalid_count = invalid_result[0]['INVALID_COUNT']
-                
-                validity_ratio = (total_count - invalid_count) / total_count if total_count > 0 else 0
-                status = 'PASSED' if invalid_count == 0 else 'FAILED'
-                
-                if status == 'FAILED':
-                    validity_results['overall_status'] = 'FAILED'
-                
-                validity_results['rules'].append({
-                    'column_name': column,
-                    'rule': rule,
-                    'total_count': total_count,
-                    'invalid_count': invalid_count,
-                    'validity_ratio': round(validity_ratio, 4),
-                    'status': status
-                })
-            
-            logger.info(f"Validity check completed for {full_table_name}")
+            logger.info("Validity check completed for %s", full_table_name)
             return validity_results
             
         except Exception as e:
-            logger.error(f"Validity check failed: {str(e)}")
+            logger.error("Validity check failed: %s", e)
             return {
                 'check_type': 'VALIDITY',
                 'table': full_table_name,
@@ -243,6 +753,10 @@ class DataQualityValidator:
         """
         Check data consistency (referential integrity, business rules).
         
+        Each check is arbitrary SQL returning an INCONSISTENT_COUNT column, so
+        the queries cannot be merged into one statement safely; when there are
+        several they are issued concurrently instead of one after another.
+        
         Args:
             database: Database name
             schema: Schema name
@@ -252,7 +766,7 @@ class DataQualityValidator:
         Returns:
             Consistency check results
         """
-        full_table_name = f"{database}.{schema}.{table}"
+        full_table_name = qualified_name(database, schema, table)
         
         try:
             consistency_results = {
@@ -263,15 +777,22 @@ class DataQualityValidator:
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            for check in consistency_checks:
-                check_name = check.get('name', 'unnamed_check')
-                check_query = check.get('query')
-                
-                if not check_query:
-                    continue
-                
-                # Execute consistency check query
-                result = self.connection.execute_query(check_query)
+            runnable = [
+                (check.get('name', 'unnamed_check'), check['query'])
+                for check in consistency_checks or [] if check.get('query')
+            ]
+            if not runnable:
+                return consistency_results
+            
+            # Execute consistency check queries
+            if len(runnable) == 1:
+                query_results = [self.connection.execute_query(runnable[0][1])]
+            else:
+                max_workers = min(self.config.get('data_quality', {}).get('parallelism', 8), len(runnable))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    query_results = list(executor.map(self.connection.execute_query, [query for _, query in runnable]))
+            
+            for (check_name, _), result in zip(runnable, query_results):
                 inconsistent_count = result[0].get('INCONSISTENT_COUNT', 0) if result else 0
                 
                 status = 'PASSED' if inconsistent_count == 0 else 'FAILED'
@@ -285,11 +806,11 @@ class DataQualityValidator:
                     'status': status
                 })
             
-            logger.info(f"Consistency check completed for {full_table_name}")
+            logger.info("Consistency check completed for %s", full_table_name)
             return consistency_results
             
         except Exception as e:
-            logger.error(f"Consistency check failed: {str(e)}")
+            logger.error("Consistency check failed: %s", e)
             return {
                 'check_type': 'CONSISTENCY',
                 'table': full_table_name,
@@ -312,22 +833,18 @@ class DataQualityValidator:
         Returns:
             Timeliness check results
         """
-        full_table_name = f"{database}.{schema}.{table}"
+        full_table_name = qualified_name(database, schema, table)
+        
+        timestamp_column = stored_identifier(timestamp_column)
         
         try:
             # Get latest timestamp
-            freshness_query = f"""
-            SELECT 
-                MAX({timestamp_column}) as latest_timestamp,
-                DATEDIFF('hour', MAX({timestamp_column}), CURRENT_TIMESTAMP()) as age_hours
-            FROM {full_table_name}
-            """
-            
-            freshness_result = self.connection.execute_query(freshness_query)
+            freshness_query = _timeliness_sql(timestamp_column)
+            freshness_result = self.connection.execute_query(freshness_query, (full_table_name,))
             latest_timestamp = freshness_result[0]['LATEST_TIMESTAMP']
             age_hours = freshness_result[0]['AGE_HOURS']
             
-            status = 'PASSED' if age_hours <= max_age_hours else 'FAILED'
+            status = 'PASSED' if age_hours is not None and age_hours <= max_age_hours else 'FAILED'
             
             timeliness_results = {
                 'check_type': 'TIMELINESS',
@@ -340,11 +857,11 @@ class DataQualityValidator:
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            logger.info(f"Timeliness check completed for {full_table_name}")
+            logger.info("Timeliness check completed for %s", full_table_name)
             return timeliness_results
             
         except Exception as e:
-            logger.error(f"Timeliness check failed: {str(e)}")
+            logger.error("Timeliness check failed: %s", e)
             return {
                 'check_type': 'TIMELINESS',
                 'table': full_table_name,
@@ -352,21 +869,348 @@ class DataQualityValidator:
                 'error': str(e)
             }
     
+    @_cached_on_last_altered('ALL')
+    def check_all(self, database: str, schema: str, table: str,
+                  completeness_cols: List[str] = None,
+                  validity_rules: Dict[str, str] = None,
+                  uniqueness_cols: List[str] = None,
+                  uniqueness_mode: str = 'exact',
+                  timestamp_column: str = None,
+                  threshold: float = 0.95,
+                  max_age_hours: int = 24,
+                  recheck_threshold: float = DEFAULT_RECHECK_THRESHOLD,
+                  not_null_cols: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """
+        Run completeness, uniqueness, validity and timeliness checks in one table scan.
+        
+        All requested predicates are pushed into a single aggregate query so the
+        table is read once, regardless of how many columns and rules are checked.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table: Table name
+            completeness_cols: Columns to check for null values
+            validity_rules: Dictionary of column -> validation SQL condition
+            uniqueness_cols: Columns to check for duplicate values
+            uniqueness_mode: 'exact', 'approx' (HyperLogLog) or 'recheck'
+                distinct counting (see check_uniqueness)
+            timestamp_column: Column containing timestamp for the freshness check
+            threshold: Acceptable completeness threshold
+            max_age_hours: Maximum acceptable age in hours
+            recheck_threshold: Estimated duplicate ratio up to which 'recheck'
+                mode recounts a column exactly
+            not_null_cols: Columns declared NOT NULL; completeness columns among
+                them are reported complete without counting
+            
+        Returns:
+            List of check results shaped like the individual check_* results,
+            in the order completeness, uniqueness, validity, timeliness
+        """
+        full_table_name = qualified_name(database, schema, table)
+        completeness_cols = [stored_identifier(column) for column in completeness_cols or []]
+        validity_rules = {stored_identifier(column): rule for column, rule in (validity_rules or {}).items()}
+        uniqueness_cols = [stored_identifier(column) for column in uniqueness_cols or []]
+        timestamp_column = stored_identifier(timestamp_column) if timestamp_column else None
+        
+        requested = []
+        if completeness_cols:
+            requested.append('COMPLETENESS')
+        if uniqueness_cols:
+            requested.append('UNIQUENESS')
+        if validity_rules:
+            requested.append('VALIDITY')
+        if timestamp_column:
+            requested.append('TIMELINESS')
+        
+        if not requested:
+            return []
+        
+        not_null_cols = frozenset(stored_identifier(column) for column in not_null_cols)
+        counted_cols = tuple(column for column in completeness_cols if column not in not_null_cols)
+        fused_query = _fused_sql(
+            counted_cols, tuple(uniqueness_cols), uniqueness_mode,
+            tuple(validity_rules.items()), timestamp_column
+        )
+        
+        try:
+            row = self.connection.execute_query(fused_query, (full_table_name,))[0]
+            total_rows = row['TOTAL_ROWS']
+            timestamp = datetime.utcnow().isoformat()
+            results = []
+            
+            if completeness_cols:
+                null_counts = {column: row[f'NULL_{i}'] for i, column in enumerate(counted_cols)}
+                completeness_results = {
+                    'check_type': 'COMPLETENESS',
+                    'table': full_table_name,
+                    'total_rows': total_rows,
+                    'columns': [
+                        self._completeness_column_result(column, null_counts.get(column, 0), total_rows, threshold)
+                        for column in completeness_cols
+                    ],
+                    'timestamp': timestamp
+                }
+                completeness_results['overall_status'] = self._overall_status(completeness_results['columns'])
+                results.append(completeness_results)
+            
+            if uniqueness_cols:
+                uniqueness_results = {
+                    'check_type': 'UNIQUENESS',
+                    'table': full_table_name,
+                    'columns': [
+                        self._uniqueness_column_result(column, total_rows, row[f'DISTINCT_{i}'], uniqueness_mode)
+                        for i, column in enumerate(uniqueness_cols)
+                    ],
+                    'timestamp': timestamp
+                }
+                if uniqueness_mode == 'recheck':
+                    self._recheck_exact_distinct(full_table_name, uniqueness_results['columns'], recheck_threshold)
+                uniqueness_results['overall_status'] = self._overall_status(uniqueness_results['columns'])
+                results.append(uniqueness_results)
+            
+            if validity_rules:
+                validity_results = {
+                    'check_type': 'VALIDITY',
+                    'table': full_table_name,
+                    'rules': [
+                        self._validity_rule_result(column, rule, row[f'VALID_TOTAL_{i}'], row[f'INVALID_{i}'])
+                        for i, (column, rule) in enumerate(validity_rules.items())
+                    ],
+                    'timestamp': timestamp
+                }
+                validity_results['overall_status'] = self._overall_status(validity_results['rules'])
+                results.append(validity_results)
+            
+            if timestamp_column:
+                age_hours = row['AGE_HOURS']
+                results.append({
+                    'check_type': 'TIMELINESS',
+                    'table': full_table_name,
+                    'timestamp_column': timestamp_column,
+                    'latest_timestamp': str(row['LATEST_TIMESTAMP']),
+                    'age_hours': age_hours,
+                    'max_age_hours': max_age_hours,
+                    'status': 'PASSED' if age_hours is not None and age_hours <= max_age_hours else 'FAILED',
+                    'timestamp': timestamp
+                })
+            
+            logger.info("Fused validation (%s) completed for %s", ', '.join(requested), full_table_name)
+            return results
+            
+        except Exception as e:
+            logger.error("Fused validation failed: %s", e)
+            return [
+                {
+                    'check_type': check_type,
+                    'table': full_table_name,
+                    'status': 'ERROR',
+                    'error': str(e)
+                }
+                for check_type in requested
+            ]
+    
+    @staticmethod
+    def detach_checks(results: Dict[str, Any], check_types: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """
+        Move checks of the given types out of a comprehensive result.
+        
+        The comprehensive result's overall_status is recomputed from the checks
+        that remain, unless the validation itself failed.
+        
+        Args:
+            results: Comprehensive validation results
+            check_types: Check types to detach (e.g. ('UNIQUENESS', 'TIMELINESS'))
+            
+        Returns:
+            Detached check results, in their original order
+        """
+        checks = results.get('checks', [])
+        detached = [check for check in checks if check.get('check_type') in check_types]
+        if detached:
+            results['checks'] = [check for check in checks if check.get('check_type') not in check_types]
+            if 'error' not in results:
+                results['overall_status'] = DataQualityValidator._checks_status(results['checks'])
+        return detached
+    
+    @staticmethod
+    def _checks_status(checks: List[Dict[str, Any]]) -> str:
+        """Roll up check results (overall_status or status) into an overall status, ERROR first."""
+        statuses = {check.get('overall_status', check.get('status')) for check in checks}
+        statuses.update(check.get('status') for check in checks)
+        if 'ERROR' in statuses:
+            return 'ERROR'
+        return 'FAILED' if 'FAILED' in statuses else 'PASSED'
+    
+    @staticmethod
+    def _overall_status(items: List[Dict[str, Any]]) -> str:
+        """Roll up per-column/per-rule statuses into an overall status."""
+        return 'FAILED' if any(item['status'] == 'FAILED' for item in items) else 'PASSED'
+    
+    @staticmethod
+    def _completeness_column_result(column: str, null_count: int, total_rows: int,
+                                    threshold: float) -> Dict[str, Any]:
+        """Build the completeness result entry for a single column."""
+        null_percentage = null_count * 100.0 / total_rows if total_rows else 0.0
+        completeness = 1 - (null_percentage / 100.0)
+        return {
+            'column_name': column,
+            'null_count': null_count,
+            'null_percentage': round(null_percentage, 2),
+            'completeness': round(completeness, 4),
+            'threshold': threshold,
+            'status': 'PASSED' if completeness >= threshold else 'FAILED'
+        }
+    
+    @staticmethod
+    def _distinct_count_expression(uniqueness_mode: str) -> str:
+        """Return the distinct-count SQL template for a uniqueness mode."""
+        if uniqueness_mode not in DISTINCT_COUNT_EXPRESSIONS:
+            raise ValueError(f"Unknown uniqueness mode: {uniqueness_mode}")
+        return DISTINCT_COUNT_EXPRESSIONS[uniqueness_mode]
+    
+    def _distinct_counts(self, full_table_name: str, columns: Tuple[str, ...],
+                         uniqueness_mode: str) -> Dict[str, Any]:
+        """
+        Return TOTAL_COUNT and DISTINCT_<i> counts for columns in one statement.
+        
+        Exact counts use GROUP BY subqueries instead of COUNT(DISTINCT) when
+        data_quality.exact_distinct_rewrite is enabled.
+        """
+        if uniqueness_mode == 'exact' and self._exact_distinct_rewrite:
+            return self.connection.execute_query(_grouped_distinct_sql(columns), {'table': full_table_name})[0]
+        return self.connection.execute_query(_uniqueness_sql(columns, uniqueness_mode), (full_table_name,))[0]
+    
+    def _recheck_exact_distinct(self, full_table_name: str, column_results: List[Dict[str, Any]],
+                                recheck_threshold: float) -> None:
+        """
+        Replace approximate uniqueness results with exact counts where they matter.
+        
+        Columns whose estimated duplicate ratio is at most ``recheck_threshold``
+        are recounted with COUNT(DISTINCT) in one query; their entries in
+        ``column_results`` are replaced in place.
+        
+        Args:
+            full_table_name: Fully qualified table name
+            column_results: Approximate per-column uniqueness results
+            recheck_threshold: Estimated duplicate ratio up to which a column is recounted
+        """
+        positions = [
+            i for i, result in enumerate(column_results)
+            if result['total_count'] and result['duplicate_count'] / result['total_count'] <= recheck_threshold
+        ]
+        if not positions:
+            return
+        
+        columns = tuple(column_results[i]['column_name'] for i in positions)
+        exact_result = self._distinct_counts(full_table_name, columns, 'exact')
+        for j, i in enumerate(positions):
+            column_results[i] = self._uniqueness_column_result(
+                columns[j], exact_result['TOTAL_COUNT'], exact_result[f'DISTINCT_{j}']
+            )
+        logger.debug("Rechecked %s of %s columns exactly for %s", len(positions), len(column_results), full_table_name)
+    
+    @staticmethod
+    def _uniqueness_column_result(column: str, total_count: int, distinct_count: int,
+                                  uniqueness_mode: str = 'exact') -> Dict[str, Any]:
+        """Build the uniqueness result entry for a single column."""
+        # An HLL estimate can slightly exceed the row count
+        distinct_count = min(distinct_count, total_count)
+        duplicate_count = total_count - distinct_count
+        uniqueness_ratio = distinct_count / total_count if total_count > 0 else 0
+        return {
+            'column_name': column,
+            'total_count': total_count,
+            'distinct_count': distinct_count,
+            'duplicate_count': duplicate_count,
+            'uniqueness_ratio': round(uniqueness_ratio, 4),
+            'approximate': uniqueness_mode != 'exact',
+            'status': 'PASSED' if duplicate_count == 0 else 'FAILED'
+        }
+    
+    @staticmethod
+    def _validity_rule_result(column: str, rule: str, total_count: int, invalid_count: int) -> Dict[str, Any]:
+        """Build the validity result entry for a single rule."""
+        invalid_count = invalid_count or 0
+        validity_ratio = (total_count - invalid_count) / total_count if total_count > 0 else 0
+        return {
+            'column_name': column,
+            'rule': rule,
+            'total_count': total_count,
+            'invalid_count': invalid_count,
+            'validity_ratio': round(validity_ratio, 4),
+            'status': 'PASSED' if invalid_count == 0 else 'FAILED'
+        }
+    
+    @staticmethod
+    def _missing_column_checks(full_table_name: str, columns: List[str],
+                               uniqueness_cols: Optional[List[str]],
+                               validity_rules: Optional[Dict[str, str]],
+                               timestamp_column: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Build ERROR results for requested checks that name columns the table lacks.
+        
+        Args:
+            full_table_name: Fully qualified table name
+            columns: Column names from DESCRIBE TABLE
+            uniqueness_cols: Requested uniqueness columns
+            validity_rules: Requested column -> validation SQL condition
+            timestamp_column: Requested freshness column
+            
+        Returns:
+            Dictionary of check type -> ERROR result, for affected checks only
+        """
+        described = set(columns)
+        
+        def missing(requested: Iterable[str]) -> List[str]:
+            return [column for column in requested if stored_identifier(column) not in described]
+        
+        requested_columns = {
+            'UNIQUENESS': missing(uniqueness_cols or []),
+            'VALIDITY': missing(validity_rules or {}),
+            'TIMELINESS': missing([timestamp_column] if timestamp_column else [])
+        }
+        return {
+            check_type: {
+                'check_type': check_type,
+                'table': full_table_name,
+                'status': 'ERROR',
+                'error': f"Column(s) not found in {full_table_name}: {', '.join(absent)}"
+            }
+            for check_type, absent in requested_columns.items()
+            if absent
+        }
+    
     def run_comprehensive_validation(self, database: str, schema: str, table: str,
-                                   validation_config: Dict[str, Any] = None) -> Dict[str, Any]:
+                                   validation_config: Dict[str, Any] = None,
+                                   uniqueness_cols: List[str] = None,
+                                   validity_rules: Dict[str, str] = None,
+                                   timestamp_column: str = None) -> Dict[str, Any]:
         """
         Run comprehensive data quality validation.
         
+        Completeness of every column, plus any requested uniqueness, validity
+        and timeliness checks, is evaluated by one check_all() scan of the
+        table. Tables too wide for a single statement (see
+        MAX_AGGREGATES_PER_QUERY) or large enough to sample (rules.completeness
+        .sample_rows) have their completeness checked separately. Checks that
+        name a column DESCRIBE TABLE does not list are left out of the scan
+        and reported as ERROR, so they cannot fail the other checks.
+        
         Args:
             database: Database name
             schema: Schema name
             table: Table name
             validation_config: Custom validation configuration
+            uniqueness_cols: Columns to check for duplicate values
+            validity_rules: Dictionary of column -> validation SQL condition
+            timestamp_column: Column containing timestamp for the freshness check
             
         Returns:
             Comprehensive validation results
         """
         config = validation_config or self.config.get('data_quality', {})
+        rules = config.get('rules', {})
         
         results = {
             'table': f"{database}.{schema}.{table}",
@@ -376,27 +1220,242 @@ class DataQualityValidator:
         }
         
         try:
-            # Completeness check
-            if config.get('rules', {}).get('completeness', {}).get('enabled', True):
-                completeness = self.check_completeness(
-                    database, schema, table,
-                    threshold=config.get('rules', {}).get('completeness', {}).get('threshold', 0.95)
-                )
-                results['checks'].append(completeness)
-                if completeness.get('overall_status') == 'FAILED':
-                    results['overall_status'] = 'FAILED'
+            full_table_name = qualified_name(database, schema, table)
+            completeness_rules = rules.get('completeness', {})
+            threshold = completeness_rules.get('threshold', 0.95)
+            sample_rows = completeness_rules.get('sample_rows')
+            described_cols, not_null_cols = self._describe_columns(full_table_name)
+            
+            # A column the table lacks would fail the shared scan for every
+            # check, so checks naming one are reported as ERROR on their own
+            missing_checks = self._missing_column_checks(
+                full_table_name, described_cols, uniqueness_cols, validity_rules, timestamp_column
+            )
+            if 'UNIQUENESS' in missing_checks:
+                uniqueness_cols = None
+            if 'VALIDITY' in missing_checks:
+                validity_rules = None
+            if 'TIMELINESS' in missing_checks:
+                timestamp_column = None
             
-            # Additional checks can be added based on config
+            # Described names are exact, so they are passed on quoted
+            completeness_cols = []
+            if completeness_rules.get('enabled', True):
+                completeness_cols = [quote_stored_identifier(column) for column in described_cols]
+                counted = len(completeness_cols) - len(not_null_cols)
+                too_wide = counted + len(uniqueness_cols or []) + 2 * len(validity_rules or {}) > MAX_AGGREGATES_PER_QUERY
+                if too_wide or (counted and self._sample_plan(database, schema, table, sample_rows)):
+                    # check_completeness re-reads nullability from the DESCRIBE cache
+                    results['checks'].append(self.check_completeness(
+                        database, schema, table, threshold=threshold, sample_rows=sample_rows,
+                        sample_method=completeness_rules.get('sample_method', 'BERNOULLI'),
+                        confidence=completeness_rules.get('confidence', 0.95)
+                    ))
+                    completeness_cols = []
             
-            logger.info(f"Comprehensive validation completed for {database}.{schema}.{table}")
+            # Remaining checks share a single table scan
+            results['checks'].extend(self.check_all(
+                database, schema, table,
+                completeness_cols=completeness_cols,
+                not_null_cols=[quote_stored_identifier(column) for column in not_null_cols],
+                validity_rules=validity_rules,
+                uniqueness_cols=uniqueness_cols,
+                uniqueness_mode=rules.get('uniqueness', {}).get('mode', 'exact'),
+                timestamp_column=timestamp_column,
+                threshold=threshold,
+                max_age_hours=rules.get('timeliness', {}).get('max_age_hours', 24),
+                recheck_threshold=rules.get('uniqueness', {}).get('recheck_threshold', DEFAULT_RECHECK_THRESHOLD)
+            ))
+            if any(check.get('status') == 'ERROR' for check in results['checks']):
+                # The cached column list may predate DDL on the table
+                self.invalidate_schema_cache(full_table_name)
+            
+            if missing_checks:
+                results['checks'].extend(missing_checks.values())
+                results['checks'].sort(key=lambda check: CHECK_TYPES.index(check['check_type']))
+            results['overall_status'] = self._checks_status(results['checks'])
+            
+            logger.info("Comprehensive validation completed for %s.%s.%s", database, schema, table)
             
         except Exception as e:
-            logger.error(f"Comprehensive validation failed: {str(e)}")
+            logger.error("Comprehensive validation failed: %s", e)
             results['overall_status'] = 'ERROR'
             results['error'] = str(e)
         
         return results
     
+    def run_comprehensive_validation_many(self, tables: Iterable[Tuple[str, str, str]],
+                                          validation_config: Dict[str, Any] = None,
+                                          max_workers: int = None) -> List[Dict[str, Any]]:
+        """
+        Run comprehensive validation for many tables concurrently.
+        
+        Each check spends nearly all of its time waiting on Snowflake, so the
+        tables' queries are issued from a thread pool over the shared
+        connection (every query opens its own cursor).
+        
+        Args:
+            tables: (database, schema, table) tuples
+            validation_config: Custom validation configuration
+            max_workers: Concurrent tables (defaults to data_quality.parallelism, else 8)
+            
+        Returns:
+            Comprehensive validation results, in the order of ``tables``
+        """
+        tables = list(tables)
+        if not tables:
+            return []
+        
+        if max_workers is None:
+            max_workers = self.config.get('data_quality', {}).get('parallelism', 8)
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tables))) as executor:
+            return list(executor.map(
+                lambda table: self.run_comprehensive_validation(*table, validation_config=validation_config),
+                tables
+            ))
+    
+    def table_fingerprints(self, tables: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Fingerprint tables by their metadata and the configured DQ rules.
+        
+        The fingerprint hashes LAST_ALTERED, ROW_COUNT and BYTES from
+        INFORMATION_SCHEMA.TABLES (one query per database) together with the
+        data_quality rules, so it changes whenever the table's data or DDL
+        changes or the checks themselves are reconfigured. Tables listed with
+        those values already (e.g. from an INFORMATION_SCHEMA.TABLES listing)
+        are fingerprinted without a query.
+        
+        Args:
+            tables: Table dicts with database, schema and table keys, and
+                optionally last_altered, row_count and bytes
+            
+        Returns:
+            Dictionary of "database.schema.table" -> fingerprint; tables whose
+            metadata could not be read are omitted
+        """
+        rules = self.config.get('data_quality', {}).get('rules', {})
+        
+        def fingerprint(last_altered: Any, row_count: Any, bytes_: Any) -> str:
+            state = dumps_json([str(last_altered), row_count, bytes_, rules])
+            return hashlib.blake2b(state.encode(), digest_size=16).hexdigest()
+        
+        fingerprints = {}
+        by_database: Dict[str, List[Dict[str, Any]]] = {}
+        for table_info in tables:
+            if 'last_altered' in table_info:
+                table_name = f"{table_info['database']}.{table_info['schema']}.{table_info['table']}"
+                fingerprints[table_name] = fingerprint(
+                    table_info['last_altered'], table_info.get('row_count'), table_info.get('bytes')
+                )
+            else:
+                by_database.setdefault(table_info['database'], []).append(table_info)
+        
+        for database, database_tables in by_database.items():
+            query = f"""
+            SELECT table_schema, table_name, last_altered, row_count, bytes
+            FROM {qualified_name(database)}.INFORMATION_SCHEMA.TABLES
+            WHERE (table_schema, table_name) IN ({', '.join(['(%s, %s)'] * len(database_tables))})
+            """
+            params = tuple(
+                stored_identifier(name) for table_info in database_tables
+                for name in (table_info['schema'], table_info['table'])
+            )
+            
+            try:
+                rows = self.connection.execute_query(query, params)
+            except Exception as e:
+                logger.warning("Failed to fingerprint tables in %s: %s", database, e)
+                continue
+            
+            stats = {(row['TABLE_SCHEMA'], row['TABLE_NAME']): row for row in rows}
+            for table_info in database_tables:
+                row = stats.get((stored_identifier(table_info['schema']), stored_identifier(table_info['table'])))
+                if row is None:
+                    continue
+                table_name = f"{database}.{table_info['schema']}.{table_info['table']}"
+                fingerprints[table_name] = fingerprint(row['LAST_ALTERED'], row['ROW_COUNT'], row['BYTES'])
+        
+        return fingerprints
+    
+    def load_memoized_results(self, memo_table: str, fingerprints: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load stored validation results whose table fingerprint is unchanged.
+        
+        Args:
+            memo_table: Name of the memo table written by save_memoized_results
+            fingerprints: Current fingerprints from table_fingerprints
+            
+        Returns:
+            Dictionary of "database.schema.table" -> stored validation result
+        """
+        if not fingerprints:
+            return {}
+        
+        query = f"""
+        SELECT table_name, fingerprint, result_json
+        FROM {memo_table}
+        WHERE table_name IN ({', '.join(['%s'] * len(fingerprints))})
+        """
+        
+        try:
+            rows = self.connection.execute_query(query, tuple(fingerprints))
+        except Exception as e:
+            logger.warning("DQ memo table %s unavailable, validating all tables: %s", memo_table, e)
+            return {}
+        
+        memoized = {
+            row['TABLE_NAME']: loads_json(row['RESULT_JSON'])
+            for row in rows
+            if fingerprints.get(row['TABLE_NAME']) == row['FINGERPRINT']
+        }
+        logger.info("Reusing memoized DQ results for %s of %s tables", len(memoized), len(fingerprints))
+        return memoized
+    
+    def save_memoized_results(self, memo_table: str, results: List[Dict[str, Any]],
+                              fingerprints: Dict[str, str]) -> None:
+        """
+        Store validation results under their table's current fingerprint.
+        
+        Results with an ERROR status or any errored check, or for tables
+        without a fingerprint, are not stored so they are re-run next time.
+        
+        Args:
+            memo_table: Name of the memo table
+            results: Results from run_comprehensive_validation
+            fingerprints: Fingerprints the results were computed against
+        """
+        create_table_ddl = f"""
+        CREATE TABLE IF NOT EXISTS {memo_table} (
+            table_name VARCHAR,
+            fingerprint VARCHAR,
+            result_json VARIANT,
+            saved_at TIMESTAMP_NTZ,
+            PRIMARY KEY (table_name)
+        )
+        """
+        
+        saved_at = datetime.utcnow()
+        rows = [
+            (result['table'], fingerprints[result['table']], dumps_json(result), saved_at)
+            for result in results
+            if result.get('table') in fingerprints
+            and result.get('overall_status') != 'ERROR'
+            and not any(check.get('status') == 'ERROR' for check in result.get('checks', []))
+        ]
+        if not rows:
+            return
+        
+        self.connection.create_table_if_not_exists(memo_table, create_table_ddl)
+        self.connection.merge_load(
+            memo_table,
+            ['table_name', 'fingerprint', 'result_json', 'saved_at'],
+            rows,
+            key_columns=['table_name'],
+            json_columns=['result_json']
+        )
+        logger.info("Memoized %s DQ results in %s", len(rows), memo_table)
+    
     def save_validation_results(self, results: List[Dict[str, Any]], output_table: str) -> None:
         """
         Save validation results to Snowflake table.
@@ -420,30 +1479,52 @@ class DataQualityValidator:
         
         self.connection.create_table_if_not_exists(output_table, create_table_ddl)
         
-        # Prepare data for insertion
+        # Prepare data for insertion; one clock read per save, with the row
+        # index keeping validation ids unique within the batch
         insert_data = []
+        append = insert_data.append
+        saved_at = datetime.utcnow()
+        base_ns = time.time_ns()
         
-        for result in results:
-            validation_id = f"{result.get('table', 'unknown')}_{result.get('check_type', 'unknown')}_{datetime.utcnow().timestamp()}"
+        for i, result in enumerate(results):
+            table, check_type, status = _summary_fields(result)
+            validation_id = f"{table or 'unknown'}_{check_type or 'unknown'}_{base_ns + i}"
             
-            insert_data.append((
+            append((
                 validation_id,
-                result.get('table', ''),
-                result.get('check_type', ''),
-                result.get('status', result.get('overall_status', 'UNKNOWN')),
-                json.dumps(result),
-                datetime.utcnow()
+                table or '',
+                check_type or '',
+                status,
+                dumps_json(result),
+                saved_at
             ))
         
-        # Insert data
-        insert_query = f"""
-        INSERT INTO {output_table}
-        (validation_id, table_name, check_type, check_status, validation_json, validation_timestamp)
-        VALUES (%s, %s, %s, %s, PARSE_JSON(%s), %s)
+        # Validation ids are unique per save, so each run appends its results
+        self.connection.bulk_load(
+            output_table,
+            ['validation_id', 'table_name', 'check_type', 'check_status', 'validation_json', 'validation_timestamp'],
+            insert_data,
+            json_columns=['validation_json']
+        )
+        logger.info("Saved %s validation results to %s", len(insert_data), output_table)
+    
+    @staticmethod
+    def report_key(results: List[Dict[str, Any]]) -> str:
         """
+        Return a content hash of everything generate_dq_report reads.
+        
+        Only each result's table, check type and status feed the report, so
+        results that differ just in timestamps or measured values produce the
+        same key and therefore the same report.
         
-        self.connection.execute_many(insert_query, insert_data)
-        logger.info(f"Saved {len(insert_data)} validation results to {output_table}")
+        Args:
+            results: List of validation results
+            
+        Returns:
+            Hex BLAKE2b digest
+        """
+        summary = [_summary_fields(result) for result in results]
+        return hashlib.blake2b(dumps_json(summary).encode(), digest_size=16).hexdigest()
     
     def generate_dq_report(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -455,31 +1536,30 @@ class DataQualityValidator:
         Returns:
             Summary report
         """
+        fields = [_summary_fields(result) for result in results]
+        
+        if len(results) > PANDAS_REPORT_MIN_RESULTS:
+            # Aggregate the three summary fields as columns instead of per-result dicts
+            import pandas as pd
+            summary = pd.DataFrame.from_records(fields, columns=['table', 'check_type', 'status']).astype(object)
+            status_counts = {status: int(count) for status, count in summary['status'].value_counts().items()}
+            check_summary = summary.to_dict('records')
+        else:
+            status_counts = Counter(status for _, _, status in fields)
+            check_summary = [
+                {'table': table, 'check_type': check_type, 'status': status}
+                for table, check_type, status in fields
+            ]
+        
         report = {
             'report_timestamp': datetime.utcnow().isoformat(),
             'total_checks': len(results),
-            'passed_checks': 0,
-            'failed_checks': 0,
-            'error_checks': 0,
-            'check_summary': []
+            'passed_checks': status_counts.get('PASSED', 0),
+            'failed_checks': status_counts.get('FAILED', 0),
+            'error_checks': status_counts.get('ERROR', 0),
+            'check_summary': check_summary
         }
         
-        for result in results:
-            status = result.get('status', result.get('overall_status', 'UNKNOWN'))
-            
-            if status == 'PASSED':
-                report['passed_checks'] += 1
-            elif status == 'FAILED':
-                report['failed_checks'] += 1
-            elif status == 'ERROR':
-                report['error_checks'] += 1
-            
-            report['check_summary'].append({
-                'table': result.get('table'),
-                'check_type': result.get('check_type'),
-                'status': status
-            })
-        
         report['success_rate'] = report['passed_checks'] / report['total_checks'] if report['total_checks'] > 0 else 0
         
         logger.info("Data quality report generated")
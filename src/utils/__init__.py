@@ -0,0 +1,7 @@
+"""Utilities module initialization."""
+
+from .config_loader import load_config
+from .serialization import atomic_open, dumps_json, loads_json, read_msgpack, write_json, write_msgpack
+from .sql import quote_identifier, quote_stored_identifier, qualified_name, stored_identifier
+
+__all__ = ['load_config', 'dumps_json', 'loads_json', 'write_json', 'write_msgpack', 'read_msgpack', 'atomic_open', 'quote_identifier', 'quote_stored_identifier', 'qualified_name', 'stored_identifier']
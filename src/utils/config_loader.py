@@ -0,0 +1,95 @@
+"""
+Configuration Loader
+Parses the YAML configuration, reusing a JSON sidecar cache when it is fresh.
+"""
+
+import functools
+import logging
+import os
+import stat
+from types import MappingProxyType
+from typing import Any, Mapping
+import orjson
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml C loader; fall back to the pure-Python loader without it.
+# Config files are opened in binary mode so libyaml decodes the bytes itself.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Suffix of the parsed-config cache written next to the YAML file
+CACHE_SUFFIX = '.cache.json'
+
+
+def load_config(config_path: str) -> Mapping[str, Any]:
+    """
+    Load a YAML configuration file.
+    
+    Results are memoized per (absolute path, mtime, size), so every component
+    loading the same unchanged file gets the same dict back without parsing it
+    again; editing the file invalidates the entry. The returned config is
+    shared, so it is never copied and must not be mutated: the top level is a
+    read-only ``MappingProxyType`` so accidental writes raise, and nested
+    sections must be treated as read-only too. ``load_config.cache_info()``
+    reports cache hits and misses.
+    
+    The parsed config is also written to a JSON sidecar (``<path>.cache.json``)
+    stamped with the YAML file's mtime and size. Later loads read the sidecar
+    instead when both still match, since JSON parses far faster than YAML.
+    The sidecar gets the YAML file's permissions, since it contains the same
+    credentials. Configs with values JSON cannot represent (e.g. dates) are
+    not cached, and an unwritable directory just disables the cache.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        
+    Returns:
+        Parsed configuration (read-only mapping)
+        
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+    """
+    config_path = os.path.abspath(config_path)
+    st = os.stat(config_path)
+    return _load_config_cached(config_path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parse a config file version, preferring its JSON sidecar when it matches."""
+    cache_path = config_path + CACHE_SUFFIX
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = orjson.loads(f.read())
+        if cached.get('mtime_ns') == mtime_ns and cached.get('size') == size:
+            return MappingProxyType(cached['config'])
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=_YAML_LOADER) or {}
+    
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        payload = orjson.dumps({'mtime_ns': mtime_ns, 'size': size, 'config': config})
+        # The sidecar holds the whole config, credentials included, so it is
+        # created owner-only and then given the YAML file's own permissions
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(config_path).st_mode))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError) as e:
+        logger.debug("Config cache not written for %s: %s", config_path, e)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+    
+    return MappingProxyType(config)
+
+
+load_config.cache_info = _load_config_cached.cache_info
+load_config.cache_clear = _load_config_cached.cache_clear
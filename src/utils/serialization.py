@@ -0,0 +1,188 @@
+"""
+Serialization Utilities
+Fast JSON and msgpack encoding for governance records and artefacts.
+"""
+
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from types import GeneratorType
+from typing import Any, BinaryIO, Iterator, Union
+import os
+import tempfile
+import msgpack
+import orjson
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def dumps_json(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string with orjson.
+    
+    datetime/date values are encoded natively as ISO 8601; any other
+    unsupported value falls back to ``str()``.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(obj, default=str).decode()
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document with orjson.
+    
+    Args:
+        data: JSON text or UTF-8 bytes
+        
+    Returns:
+        Parsed object
+    """
+    return orjson.loads(data)
+
+
+@contextmanager
+def atomic_open(output_file: str) -> Iterator[BinaryIO]:
+    """
+    Open a binary file that only appears at ``output_file`` once complete.
+    
+    Data goes to a temporary file in the same directory through a 1 MiB
+    buffer; on a clean exit it is fsynced and moved into place with
+    ``os.replace``, so readers never see a partially written export. On error
+    the temporary file is removed and any existing file is left untouched.
+    
+    Args:
+        output_file: Final path of the file
+        
+    Yields:
+        Writable binary file object
+    """
+    directory = os.path.dirname(os.path.abspath(output_file))
+    tmp = tempfile.NamedTemporaryFile(
+        dir=directory, prefix=f".{os.path.basename(output_file)}.", suffix='.tmp',
+        delete=False, buffering=WRITE_BUFFER_SIZE
+    )
+    try:
+        with tmp:
+            yield tmp
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # NamedTemporaryFile creates files as 0600; publish with the usual mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp.name, 0o666 & ~umask)
+        os.replace(tmp.name, output_file)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
+def write_json(obj: Any, output_file: str, indent: bool = False) -> None:
+    """
+    Write an object to a JSON file with orjson.
+    
+    A top-level dictionary whose values include lists (or generators) is
+    written incrementally, one list item at a time, so the full document is
+    never held in memory as a single string. Output is compact by default;
+    with ``indent`` it matches the ``json.dump(obj, f, indent=2)`` layout.
+    The file is written atomically (see ``atomic_open``).
+    
+    Args:
+        obj: Object to serialize
+        output_file: Path of the file to write
+        indent: Pretty-print with two-space indentation
+    """
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    
+    def encode(value: Any, level: int) -> bytes:
+        data = orjson.dumps(value, default=str, option=option)
+        return data.replace(b"\n", b"\n" + b"  " * level) if indent else data
+    
+    newline = b"\n" if indent else b""
+    separator = b": " if indent else b":"
+    pad = b"  " if indent else b""
+    
+    with atomic_open(output_file) as f:
+        if not isinstance(obj, dict) or not any(isinstance(v, (list, tuple, GeneratorType)) for v in obj.values()):
+            f.write(encode(obj, 0))
+            return
+        
+        f.write(b"{")
+        for i, (key, value) in enumerate(obj.items()):
+            f.write((b"," if i else b"") + newline + pad + orjson.dumps(str(key)) + separator)
+            if not isinstance(value, (list, tuple, GeneratorType)):
+                f.write(encode(value, 1))
+                continue
+            
+            f.write(b"[")
+            empty = True
+            for item in value:
+                f.write((b"" if empty else b",") + newline + pad * 2 + encode(item, 2))
+                empty = False
+            f.write(b"]" if empty else newline + pad + b"]")
+        f.write(newline + b"}")
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Encode values msgpack has no type for the way dumps_json does."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, GeneratorType)):
+        return list(value)
+    return str(value)
+
+
+def write_msgpack(obj: Any, output_file: str) -> None:
+    """
+    Write an object to a msgpack file.
+    
+    msgpack is the compact binary format for artefacts read back by other
+    pipeline steps. Values are encoded as with ``dumps_json``: datetimes as
+    ISO 8601 strings and other unsupported values via ``str()``. A top-level
+    dictionary is packed one value (and one list item) at a time, and the
+    file is written atomically (see ``atomic_open``).
+    
+    Args:
+        obj: Object to serialize
+        output_file: Path of the file to write
+    """
+    packer = msgpack.Packer(default=_msgpack_default, use_bin_type=True, strict_types=False)
+    
+    with atomic_open(output_file) as f:
+        if not isinstance(obj, dict):
+            f.write(packer.pack(obj))
+            return
+        
+        f.write(packer.pack_map_header(len(obj)))
+        for key, value in obj.items():
+            f.write(packer.pack(key))
+            if isinstance(value, GeneratorType):
+                # Array headers carry the length up front
+                value = list(value)
+            if not isinstance(value, (list, tuple)):
+                f.write(packer.pack(value))
+                continue
+            
+            f.write(packer.pack_array_header(len(value)))
+            for item in value:
+                f.write(packer.pack(item))
+
+
+def read_msgpack(input_file: str) -> Any:
+    """
+    Read an artefact written by ``write_msgpack``.
+    
+    Args:
+        input_file: Path of the file to read
+        
+    Returns:
+        Decoded object
+    """
+    with open(input_file, 'rb') as f:
+        return msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
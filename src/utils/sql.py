@@ -0,0 +1,107 @@
+"""
+SQL Utilities
+Identifier quoting for Snowflake object names interpolated into queries.
+"""
+
+import re
+from functools import lru_cache
+from sqlglot import exp
+
+# Names Snowflake accepts without quotes (resolved case-insensitively)
+_UNQUOTED_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_$]*$')
+
+# Names already rendered as quoted identifiers, e.g. by quote_stored_identifier
+_QUOTED_IDENTIFIER = re.compile(r'^"(?:[^"]|"")+"$')
+
+# Snowflake reserved keywords, which must be quoted to be used as names
+_RESERVED_KEYWORDS = frozenset({
+    'ACCOUNT', 'ALL', 'ALTER', 'AND', 'ANY', 'AS', 'BETWEEN', 'BY', 'CASE', 'CAST',
+    'CHECK', 'COLUMN', 'CONNECT', 'CONNECTION', 'CONSTRAINT', 'CREATE', 'CROSS',
+    'CURRENT', 'CURRENT_DATE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP', 'CURRENT_USER',
+    'DATABASE', 'DELETE', 'DISTINCT', 'DROP', 'ELSE', 'EXISTS', 'FALSE', 'FOLLOWING',
+    'FOR', 'FROM', 'FULL', 'GRANT', 'GROUP', 'GSCLUSTER', 'HAVING', 'ILIKE', 'IN',
+    'INCREMENT', 'INNER', 'INSERT', 'INTERSECT', 'INTO', 'IS', 'ISSUE', 'JOIN',
+    'LATERAL', 'LEFT', 'LIKE', 'LOCALTIME', 'LOCALTIMESTAMP', 'MINUS', 'NATURAL',
+    'NOT', 'NULL', 'OF', 'ON', 'OR', 'ORDER', 'ORGANIZATION', 'QUALIFY', 'REGEXP',
+    'REVOKE', 'RIGHT', 'RLIKE', 'ROW', 'ROWS', 'SAMPLE', 'SCHEMA', 'SELECT', 'SET',
+    'SOME', 'START', 'TABLE', 'TABLESAMPLE', 'THEN', 'TO', 'TRIGGER', 'TRUE',
+    'TRY_CAST', 'UNION', 'UNIQUE', 'UPDATE', 'USING', 'VALUES', 'VIEW', 'WHEN',
+    'WHENEVER', 'WHERE', 'WITH'
+})
+
+
+@lru_cache(maxsize=4096)
+def quote_identifier(name: str) -> str:
+    """
+    Render one name as a Snowflake identifier.
+    
+    Plain names are left unquoted so they keep resolving case-insensitively,
+    as they did when interpolated directly. Names containing other characters
+    (e.g. hyphens or spaces) and reserved keywords are double-quoted, with
+    embedded quotes escaped. Names that already are quoted identifiers are
+    returned unchanged.
+    
+    Args:
+        name: Database, schema, table or column name
+        
+    Returns:
+        Identifier safe to interpolate into SQL
+    """
+    if _QUOTED_IDENTIFIER.match(name):
+        return name
+    quoted = not _UNQUOTED_IDENTIFIER.match(name) or name.upper() in _RESERVED_KEYWORDS
+    return exp.to_identifier(name, quoted=quoted).sql(dialect='snowflake')
+
+
+@lru_cache(maxsize=4096)
+def stored_identifier(name: str) -> str:
+    """
+    Return a name as Snowflake stores it in INFORMATION_SCHEMA.
+    
+    Names quote_identifier leaves unquoted resolve case-insensitively and
+    are stored upper-cased; quoted names are stored verbatim. Comparing
+    INFORMATION_SCHEMA columns against this value matches exactly the
+    object that qualified_name refers to.
+    
+    Args:
+        name: Database, schema, table or column name
+        
+    Returns:
+        Stored identifier text
+    """
+    if _QUOTED_IDENTIFIER.match(name):
+        return name[1:-1].replace('""', '"')
+    if _UNQUOTED_IDENTIFIER.match(name) and name.upper() not in _RESERVED_KEYWORDS:
+        return name.upper()
+    return name
+
+
+@lru_cache(maxsize=4096)
+def quote_stored_identifier(name: str) -> str:
+    """
+    Render a name read from Snowflake (INFORMATION_SCHEMA, DESCRIBE) as an identifier.
+    
+    Stored names are exact, so they are always double-quoted: a table
+    created as "orders" must not be left unquoted and resolve to ORDERS.
+    The result passes through quote_identifier and qualified_name unchanged.
+    
+    Args:
+        name: Stored database, schema, table or column name
+        
+    Returns:
+        Quoted identifier safe to interpolate into SQL
+    """
+    return exp.to_identifier(name, quoted=True).sql(dialect='snowflake')
+
+
+def qualified_name(*parts: str) -> str:
+    """
+    Join name parts into a dotted Snowflake object name, quoting each as needed.
+    
+    Args:
+        parts: Name parts, e.g. database, schema and table
+        
+    Returns:
+        Qualified object name safe to interpolate into SQL
+    """
+    return '.'.join(quote_identifier(part) for part in parts)